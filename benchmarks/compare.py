@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Compare two benchmark result files produced by ``run.py``.
+
+Usage:
+    python3 compare.py <baseline.json> <candidate.json> [--threshold PCT]
+
+Scenarios are matched on (size, mode, upload, concurrency); reports that
+predate the upload dimension count as ``json``.  For each, throughput,
+p95 latency, peak RSS and CPU per request are printed with their relative
+change.  Exits with status 1 if any metric regresses by more than
+``--threshold`` percent (default 10), so it can gate CI.
+"""
+
+import argparse
+import json
+import sys
+
+# (label, extractor, higher_is_better)
+METRICS = [
+    ("req/s", lambda r: r["throughput_rps"], True),
+    ("p95 ms", lambda r: r.get("latency_ms", {}).get("p95"), False),
+    ("rss MB", lambda r: r["peak_rss_mb"], False),
+    ("cpu ms/req", lambda r: r["cpu_ms_per_request"], False),
+]
+
+
+def _key(result: dict) -> tuple:
+    return (
+        result["size_bytes"],
+        result["mode"],
+        result.get("upload", "json"),
+        result["concurrency"],
+    )
+
+
+def load(path: str) -> dict:
+    with open(path) as f:
+        return {_key(r): r for r in json.load(f)["results"]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare two benchmark runs.")
+    parser.add_argument("baseline", help="Results JSON from the reference commit")
+    parser.add_argument("candidate", help="Results JSON from the commit under test")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="Regression threshold in percent (default: 10)",
+    )
+    args = parser.parse_args()
+
+    baseline = load(args.baseline)
+    candidate = load(args.candidate)
+    regressions = []
+
+    for key in sorted(baseline.keys() & candidate.keys()):
+        size, mode, upload, concurrency = key
+        cells = []
+        for label, extract, higher_is_better in METRICS:
+            old, new = extract(baseline[key]), extract(candidate[key])
+            if not old or new is None:
+                cells.append(f"{label} n/a")
+                continue
+            change = (new - old) / old * 100
+            cells.append(f"{label} {old:.2f}->{new:.2f} ({change:+.1f}%)")
+            worse = -change if higher_is_better else change
+            if worse > args.threshold:
+                regressions.append(
+                    f"{size} B {mode} {upload} c={concurrency}: {label} {change:+.1f}%"
+                )
+        print(
+            f"{size:>12,d} B  {mode:<5} {upload:<9} c={concurrency:<3} "
+            + "  ".join(cells)
+        )
+
+    missing = baseline.keys() ^ candidate.keys()
+    if missing:
+        print(f"\n{len(missing)} scenario(s) present in only one file", file=sys.stderr)
+
+    if regressions:
+        print("\nRegressions:", file=sys.stderr)
+        for line in regressions:
+            print(f"  {line}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the KIE extraction API, for benchmarking.
+
+Serves ``POST /v1/extract`` with configurable latency and error injection.
+The response maps every schema field to a placeholder value, so clients see
+a realistic result shape; ``--echo`` also reports what the server received.
+
+Both the JSON envelope and raw-bytes ``multipart/form-data`` uploads are
+accepted; ``--no-multipart`` answers multipart with 415, like a server that
+only speaks JSON.
+
+Usage:
+    python3 fake_server.py [--host HOST] [--port PORT] [--latency SECONDS]
+                           [--jitter SECONDS] [--error-rate RATE] [--echo]
+                           [--no-multipart]
+
+Only the Python standard library is used.  Import :class:`FakeExtractServer`
+to run the server in a background thread from another script.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+EXTRACT_PATH = "/v1/extract"
+
+
+@dataclass
+class ServerConfig:
+    """Behaviour of the stand-in server.
+
+    Attributes:
+        latency: Simulated inference time per request, in seconds.
+        jitter: Extra uniformly-random latency in ``[0, jitter]`` seconds.
+        error_rate: Fraction of requests answered with ``error_status``.
+        error_status: HTTP status used for injected errors.
+        echo: Include received byte count, document type and upload format
+            in the response.
+        multipart: Accept ``multipart/form-data`` uploads; when false they
+            are answered with 415.
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    echo: bool = False
+    multipart: bool = True
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: _Server
+    protocol_version = "HTTP/1.1"  # keep-alive, like a real deployment
+    disable_nagle_algorithm = True
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+    def do_POST(self) -> None:  # noqa: N802
+        if self.path != EXTRACT_PATH:
+            self._reply(404, {"detail": "Not Found"})
+            return
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        config = self.server.config
+        self.server.count_request(len(body))
+
+        content_type = self.headers.get("Content-Type", "")
+        upload = "multipart" if content_type.startswith("multipart/") else "json"
+        if upload == "multipart" and not config.multipart:
+            self._reply(415, {"detail": "Unsupported Media Type"})
+            return
+        try:
+            if upload == "multipart":
+                schema, doc_type = _parse_multipart(content_type, body)
+            else:
+                payload = json.loads(body)
+                schema = payload["schema"]
+                doc_type = payload["document"]["type"]
+        except (ValueError, KeyError, TypeError) as e:
+            self._reply(400, {"detail": f"Invalid request: {e}"})
+            return
+
+        delay = config.latency + random.uniform(0, config.jitter)
+        if delay:
+            time.sleep(delay)
+        if config.error_rate and random.random() < config.error_rate:
+            self._reply(config.error_status, {"detail": "Injected error"})
+            return
+
+        result = {field: _placeholder(hint) for field, hint in schema.items()}
+        if config.echo:
+            result["_received_bytes"] = len(body)
+            result["_document_type"] = doc_type
+            result["_upload"] = upload
+        self._reply(200, result)
+
+    def _reply(self, status: int, body: dict) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def _parse_multipart(content_type: str, body: bytes) -> tuple[dict, str]:
+    """Return ``(schema, doc_type)`` from a ``multipart/form-data`` body.
+
+    A plain split on the boundary; :mod:`email` is far too slow for
+    multi-megabyte parts and would dominate the measurements.
+    """
+    boundary = content_type.partition("boundary=")[2].strip('"')
+    if not boundary:
+        raise ValueError("missing multipart boundary")
+    parts = {}
+    for part in body.split(b"--" + boundary.encode())[1:-1]:
+        headers, _, content = part[2:-2].partition(b"\r\n\r\n")
+        name = headers.partition(b'name="')[2].partition(b'"')[0].decode()
+        parts[name] = content
+    if "document" not in parts:
+        raise KeyError("document")
+    return json.loads(parts["schema"]), parts["type"].decode()
+
+
+def _placeholder(hint: object) -> object:
+    """Return a dummy value matching a schema type hint."""
+    if isinstance(hint, list):
+        return [
+            {k: _placeholder(v) for k, v in item.items()}
+            for item in hint
+            if isinstance(item, dict)
+        ]
+    if isinstance(hint, str) and hint.startswith("number"):
+        return 0
+    return "value"
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], config: ServerConfig) -> None:
+        super().__init__(address, _Handler)
+        self.config = config
+        self.requests = 0
+        self.bytes_received = 0
+        self._lock = threading.Lock()
+
+    def count_request(self, size: int) -> None:
+        with self._lock:
+            self.requests += 1
+            self.bytes_received += size
+
+
+class FakeExtractServer:
+    """Run the stand-in server on a background thread.
+
+    Example::
+
+        with FakeExtractServer(ServerConfig(latency=0.05)) as server:
+            extract_document("doc.pdf", schema, endpoint=server.endpoint)
+    """
+
+    def __init__(
+        self,
+        config: ServerConfig | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self._server = _Server((host, port), config or ServerConfig())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def endpoint(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{EXTRACT_PATH}"
+
+    @property
+    def requests(self) -> int:
+        return self._server.requests
+
+    @property
+    def bytes_received(self) -> int:
+        return self._server.bytes_received
+
+    def __enter__(self) -> FakeExtractServer:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in KIE extraction API.")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address")
+    parser.add_argument("--port", type=int, default=8000, help="Listen port")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds per request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Injected error fraction")
+    parser.add_argument("--error-status", type=int, default=503, help="Injected error status")
+    parser.add_argument("--echo", action="store_true", help="Echo received size and type")
+    parser.add_argument(
+        "--no-multipart", action="store_true", help="Reject multipart uploads with 415"
+    )
+    args = parser.parse_args()
+
+    config = ServerConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        echo=args.echo,
+        multipart=not args.no_multipart,
+    )
+    server = _Server((args.host, args.port), config)
+    print(f"Fake KIE API listening on http://{args.host}:{args.port}{EXTRACT_PATH}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Benchmark kie-core end to end against the local stand-in server.
+
+Usage:
+    python3 run.py [-o results.json] [--sizes 10k,1m,10m,100m] [--modes sync,async]
+                   [--uploads json,multipart] [--concurrency 1,8] [--requests N]
+                   [--max-bytes BYTES] [--latency SECONDS] [--error-rate RATE]
+
+For every combination of document size, sync/async path, upload format (JSON
+envelope or raw-bytes multipart), and concurrency level, the script generates
+a synthetic document, extracts it repeatedly through :class:`kie_core.KIEClient`
+/ :class:`kie_core.AsyncKIEClient`, and records throughput, latency
+percentiles, peak RSS, and CPU time per request.
+Each scenario runs in a fresh process so peak RSS is attributable to it.
+
+Results are written as JSON (to stdout, or ``-o``) for comparison between
+commits with ``compare.py``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+from fake_server import FakeExtractServer, ServerConfig
+
+SCHEMA = {
+    "vendor_name": "string",
+    "invoice_date": "date (MM/DD/YYYY)",
+    "total_amount": "number",
+}
+
+SIZE_UNITS = {"k": 1024, "m": 1024**2, "g": 1024**3}
+
+# Small inputs are typical phone/scanner images; large ones multi-page PDFs.
+PDF_THRESHOLD = 5 * 1024**2
+
+
+def parse_size(label: str) -> int:
+    """Parse ``"10k"`` / ``"1m"`` / ``"4096"`` into bytes."""
+    label = label.strip().lower()
+    if label and label[-1] in SIZE_UNITS:
+        return int(float(label[:-1]) * SIZE_UNITS[label[-1]])
+    return int(label)
+
+
+def make_document(directory: Path, size: int) -> Path:
+    """Write a synthetic document of ``size`` bytes (PDF-typed when large)."""
+    is_pdf = size >= PDF_THRESHOLD
+    header = b"%PDF-1.7\n" if is_pdf else b"\x89PNG\r\n\x1a\n"
+    path = directory / f"doc_{size}.{'pdf' if is_pdf else 'png'}"
+    with path.open("wb") as f:
+        f.write(header)
+        remaining = size - len(header)
+        while remaining > 0:
+            chunk = min(remaining, 8 * 1024**2)
+            f.write(os.urandom(chunk))
+            remaining -= chunk
+    return path
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of ``values`` (which must be non-empty)."""
+    ordered = sorted(values)
+    rank = math.ceil(pct / 100 * len(ordered))
+    return ordered[max(0, min(len(ordered), rank) - 1)]
+
+
+def _peak_rss_mb() -> float:
+    # Prefer VmHWM: Linux carries ru_maxrss across exec, so a spawned child
+    # would inherit the parent's peak (which includes the server's buffers).
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return peak / 1024**2 if sys.platform == "darwin" else peak / 1024
+
+
+def _cpu_seconds() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def run_scenario(
+    endpoint: str,
+    document: str,
+    mode: str,
+    upload: str,
+    concurrency: int,
+    requests: int,
+) -> dict:
+    """Run one scenario in the current process and return raw measurements.
+
+    Single-flight is turned off: every call extracts the same document, and
+    collapsing them would measure hashing instead of the upload.
+    """
+    from kie_core import NO_RETRY, AsyncKIEClient, KIEClient
+
+    latencies: list[float] = []
+    failures: list[str] = []
+
+    def sync_run() -> None:
+        with KIEClient(
+            endpoint, retry=NO_RETRY, upload=upload, single_flight=False
+        ) as client:
+
+            def one(_: int) -> None:
+                started = time.perf_counter()
+                try:
+                    client.extract_document(document, SCHEMA)
+                except RuntimeError as e:
+                    failures.append(str(e))
+                    return
+                latencies.append(time.perf_counter() - started)
+
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                list(pool.map(one, range(requests)))
+
+    async def async_run() -> None:
+        semaphore = asyncio.Semaphore(concurrency)
+        async with AsyncKIEClient(
+            endpoint, retry=NO_RETRY, upload=upload, single_flight=False
+        ) as client:
+
+            async def one() -> None:
+                async with semaphore:
+                    started = time.perf_counter()
+                    try:
+                        await client.extract_document(document, SCHEMA)
+                    except RuntimeError as e:
+                        failures.append(str(e))
+                        return
+                    latencies.append(time.perf_counter() - started)
+
+            await asyncio.gather(*(one() for _ in range(requests)))
+
+    cpu_before = _cpu_seconds()
+    started = time.perf_counter()
+    if mode == "sync":
+        sync_run()
+    else:
+        asyncio.run(async_run())
+    wall = time.perf_counter() - started
+    cpu = _cpu_seconds() - cpu_before
+
+    return {
+        "wall_s": wall,
+        "cpu_s": cpu,
+        "peak_rss_mb": _peak_rss_mb(),
+        "latencies": latencies,
+        "errors": len(failures),
+    }
+
+
+def summarize(scenario: dict, raw: dict, size: int) -> dict:
+    """Turn raw measurements into the reported metrics."""
+    latencies = raw["latencies"]
+    completed = len(latencies)
+    total = completed + raw["errors"]
+    summary = {
+        **scenario,
+        "completed": completed,
+        "errors": raw["errors"],
+        "wall_s": round(raw["wall_s"], 4),
+        "throughput_rps": round(completed / raw["wall_s"], 3) if raw["wall_s"] else 0,
+        "upload_mb_per_s": round(completed * size / 1024**2 / raw["wall_s"], 3)
+        if raw["wall_s"]
+        else 0,
+        "cpu_ms_per_request": round(raw["cpu_s"] * 1000 / total, 3) if total else 0,
+        "peak_rss_mb": round(raw["peak_rss_mb"], 1),
+    }
+    if latencies:
+        summary["latency_ms"] = {
+            "p50": round(percentile(latencies, 50) * 1000, 3),
+            "p95": round(percentile(latencies, 95) * 1000, 3),
+            "p99": round(percentile(latencies, 99) * 1000, 3),
+            "mean": round(sum(latencies) / completed * 1000, 3),
+            "max": round(max(latencies) * 1000, 3),
+        }
+    return summary
+
+
+def git_commit() -> str | None:
+    """Return the current commit hash, if run inside a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark kie-core against a local stand-in extraction server."
+    )
+    parser.add_argument("-o", "--output", help="Path to save the results JSON")
+    parser.add_argument(
+        "--sizes", default="10k,1m,10m,100m", help="Comma-separated document sizes"
+    )
+    parser.add_argument(
+        "--modes", default="sync,async", help="Comma-separated client paths"
+    )
+    parser.add_argument(
+        "--uploads",
+        default="json",
+        help="Comma-separated upload formats (json,multipart)",
+    )
+    parser.add_argument(
+        "--concurrency", default="1,8", help="Comma-separated concurrency levels"
+    )
+    parser.add_argument(
+        "--requests", type=int, default=50, help="Requests per scenario (upper bound)"
+    )
+    parser.add_argument(
+        "--max-bytes",
+        type=parse_size,
+        default=parse_size("2g"),
+        help="Cap on bytes uploaded per scenario; large documents run fewer requests",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Simulated server latency (s)"
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, help="Extra random latency (s)"
+    )
+    parser.add_argument(
+        "--error-rate", type=float, default=0.0, help="Injected server error fraction"
+    )
+    args = parser.parse_args()
+
+    sizes = [parse_size(s) for s in args.sizes.split(",")]
+    modes = [m.strip() for m in args.modes.split(",")]
+    uploads = [u.strip() for u in args.uploads.split(",")]
+    levels = [int(c) for c in args.concurrency.split(",")]
+    config = ServerConfig(
+        latency=args.latency, jitter=args.jitter, error_rate=args.error_rate
+    )
+
+    results = []
+    ctx = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp, FakeExtractServer(config) as server:
+        for size in sizes:
+            document = make_document(Path(tmp), size)
+            requests = max(2, min(args.requests, args.max_bytes // max(size, 1)))
+            for mode in modes:
+                for upload in uploads:
+                    for concurrency in levels:
+                        scenario = {
+                            "size_bytes": size,
+                            "doc_type": "pdf" if size >= PDF_THRESHOLD else "image",
+                            "mode": mode,
+                            "upload": upload,
+                            "concurrency": concurrency,
+                            "requests": requests,
+                        }
+                        served = server.requests
+                        with ctx.Pool(1) as pool:
+                            raw = pool.apply(
+                                run_scenario,
+                                (
+                                    server.endpoint,
+                                    str(document),
+                                    mode,
+                                    upload,
+                                    concurrency,
+                                    requests,
+                                ),
+                            )
+                        served = server.requests - served
+                        if served != requests:
+                            sys.exit(
+                                f"{size} B {mode} {upload} c={concurrency}: server "
+                                f"saw {served} requests for {requests} calls"
+                            )
+                        summary = summarize(scenario, raw, size)
+                        results.append(summary)
+                        p95 = summary.get("latency_ms", {}).get("p95", 0)
+                        print(
+                            f"{size:>12,d} B  {mode:<5} {upload:<9} c={concurrency:<3} "
+                            f"{summary['throughput_rps']:>9.2f} req/s  "
+                            f"p95={p95:>9.2f} ms  "
+                            f"rss={summary['peak_rss_mb']:>7.1f} MB",
+                            file=sys.stderr,
+                        )
+            document.unlink()
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git_commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "server": vars(config),
+        },
+        "results": results,
+    }
+    report_json = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(report_json)
+        print(f"\nSaved to: {args.output}", file=sys.stderr)
+    else:
+        print(report_json)
+
+
+if __name__ == "__main__":
+    main()
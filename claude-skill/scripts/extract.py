@@ -4,28 +4,51 @@ Extract structured data from a document using a JSON schema via MCP REST API.
 
 Usage:
     python3 extract.py <document_path> <json_schema> [-o output.json] [--endpoint URL] [--model MODEL]
+    python3 extract.py <directory|glob> <json_schema> [-o results.jsonl] [--concurrency N] [--workers N]
 
 Arguments:
-    document_path  Path to the document (PDF or image: PNG, JPG, TIFF, etc.)
+    document_path  Path to the document (PDF or image: PNG, JPG, TIFF, etc.),
+                   or a directory / glob pattern (e.g. "scans/**/*.pdf") for batch mode
     json_schema    JSON schema string or path to a .json schema file
 
 Options:
-    -o, --output    Path to save the extracted JSON result
+    -o, --output    Path to save the extracted JSON result (JSON Lines in batch mode)
     --endpoint      Extract API endpoint (default: $KIE_API_URL or http://localhost:8000/v1/extract)
     --model         Model ID to use for extraction (e.g., joy-vl-3b-sglang)
+    --concurrency   Batch mode: requests kept in flight (default: 8)
+    --workers       Batch mode: processes reading and encoding documents (default: CPU count)
 
 The script calls the KIE extraction API with the base64-encoded document
 and JSON schema. Returns extracted field values as JSON to stdout.
+
+In batch mode, documents are read and encoded in a process pool while
+keep-alive connections keep up to --concurrency requests in flight. Each
+result is written as one JSON Lines record, {"document": ..., "result": ...}
+or {"document": ..., "error": ...}, as soon as it completes.
 """
 
 import argparse
 import base64
+import glob
+import http.client
 import json
 import os
 import sys
+import threading
+import urllib.parse
 import urllib.request
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from pathlib import Path
 
+DOCUMENT_EXTENSIONS = {
+    ".pdf", ".png", ".jpg", ".jpeg", ".tif", ".tiff", ".bmp", ".gif", ".webp",
+}
+
 
 def load_schema(schema_input: str) -> dict:
     """Load schema from a JSON string or file path."""
@@ -51,8 +74,8 @@ def encode_document(document_path: str) -> tuple[str, str]:
     return doc_base64, doc_type
 
 
-def call_extract_api(endpoint: str, doc_base64: str, doc_type: str, schema: dict, model: str | None = None) -> dict:
-    """Call the MCP extraction REST API."""
+def build_request_body(doc_base64: str, doc_type: str, schema: dict, model: str | None = None) -> bytes:
+    """Serialize the extraction request payload."""
     payload = {
         "document": {"content": doc_base64, "type": doc_type},
         "schema": schema,
@@ -61,7 +84,12 @@ def call_extract_api(endpoint: str, doc_base64: str, doc_type: str, schema: dict
     if model:
         payload["options"] = {"model": model}
 
-    data = json.dumps(payload).encode("utf-8")
+    return json.dumps(payload).encode("utf-8")
+
+
+def call_extract_api(endpoint: str, doc_base64: str, doc_type: str, schema: dict, model: str | None = None) -> dict:
+    """Call the MCP extraction REST API."""
+    data = build_request_body(doc_base64, doc_type, schema, model)
 
     req = urllib.request.Request(
         endpoint,
@@ -80,24 +108,179 @@ def call_extract_api(endpoint: str, doc_base64: str, doc_type: str, schema: dict
         raise RuntimeError(f"Could not reach endpoint {endpoint}: {e.reason}")
 
 
+def find_documents(target: str) -> list[str]:
+    """List the documents in a directory (recursively) or matching a glob pattern."""
+    if os.path.isdir(target):
+        paths = (str(p) for p in Path(target).rglob("*"))
+    else:
+        paths = glob.iglob(target, recursive=True)
+    return sorted(
+        p for p in paths
+        if os.path.isfile(p) and Path(p).suffix.lower() in DOCUMENT_EXTENSIONS
+    )
+
+
+def prepare_request(document_path: str, schema: dict, model: str | None) -> bytes:
+    """Read, encode and serialize one document (runs in a worker process)."""
+    doc_base64, doc_type = encode_document(document_path)
+    return build_request_body(doc_base64, doc_type, schema, model)
+
+
+class Uploader:
+    """POST request bodies over keep-alive connections, one per thread."""
+
+    def __init__(self, endpoint: str, timeout: float = 120):
+        parts = urllib.parse.urlsplit(endpoint)
+        self.endpoint = endpoint
+        self.timeout = timeout
+        self._connection_class = (
+            http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        )
+        self._host = parts.netloc
+        self._path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        self._local = threading.local()
+
+    def _connection(self) -> http.client.HTTPConnection:
+        if getattr(self._local, "connection", None) is None:
+            self._local.connection = self._connection_class(self._host, timeout=self.timeout)
+        return self._local.connection
+
+    def _reset(self) -> None:
+        self._local.connection.close()
+        self._local.connection = None
+
+    def post(self, body: bytes) -> dict:
+        """Send one request body and return the parsed response."""
+        for attempt in range(2):
+            connection = self._connection()
+            try:
+                connection.request(
+                    "POST", self._path, body=body, headers={"Content-Type": "application/json"}
+                )
+                response = connection.getresponse()
+                data = response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as e:
+                # The server may close an idle keep-alive connection; reconnect once.
+                self._reset()
+                if attempt:
+                    raise RuntimeError(f"Could not reach endpoint {self.endpoint}: {e}")
+                continue
+            except OSError as e:
+                self._reset()
+                raise RuntimeError(f"Could not reach endpoint {self.endpoint}: {e}")
+            if response.status >= 400:
+                raise RuntimeError(
+                    f"API request failed ({response.status}): {data.decode('utf-8', 'replace')}"
+                )
+            return json.loads(data.decode("utf-8"))
+
+
+def run_batch(
+    documents: list[str],
+    schema: dict,
+    endpoint: str,
+    model: str | None,
+    output,
+    concurrency: int = 8,
+    workers: int | None = None,
+) -> int:
+    """Extract every document, writing JSON Lines records as they complete.
+
+    Documents are prepared in a process pool and uploaded from a thread
+    pool of ``concurrency`` keep-alive connections.  At most
+    ``2 * concurrency`` documents are held in memory at once.  Returns the
+    number of failed documents.
+    """
+    uploader = Uploader(endpoint)
+    remaining = iter(documents)
+    in_flight = {}
+    failures = 0
+
+    def write(record: dict) -> None:
+        output.write(json.dumps(record, ensure_ascii=False) + "\n")
+        output.flush()
+
+    with ProcessPoolExecutor(workers) as prepare_pool, ThreadPoolExecutor(concurrency) as upload_pool:
+        while True:
+            while len(in_flight) < 2 * concurrency:
+                document = next(remaining, None)
+                if document is None:
+                    break
+                future = prepare_pool.submit(prepare_request, document, schema, model)
+                in_flight[future] = (document, "prepare")
+            if not in_flight:
+                break
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                document, stage = in_flight.pop(future)
+                error = future.exception()
+                if error is not None:
+                    failures += 1
+                    write({"document": document, "error": str(error)})
+                elif stage == "prepare":
+                    in_flight[upload_pool.submit(uploader.post, future.result())] = (document, "upload")
+                else:
+                    write({"document": document, "result": future.result()})
+    return failures
+
+
+def is_batch_target(target: str) -> bool:
+    """Whether the document argument names a directory or a glob pattern."""
+    return os.path.isdir(target) or (not os.path.exists(target) and glob.has_magic(target))
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Extract structured data from a document via MCP extraction API."
     )
-    parser.add_argument("document_path", help="Path to the document (PDF or image)")
+    parser.add_argument(
+        "document_path", help="Path to the document (PDF or image), or a directory / glob pattern"
+    )
     parser.add_argument("schema", help="JSON schema string or path to .json file")
-    parser.add_argument("-o", "--output", help="Path to save the result JSON")
+    parser.add_argument("-o", "--output", help="Path to save the result JSON (JSON Lines in batch mode)")
     parser.add_argument(
         "--endpoint",
         default=os.environ.get("KIE_API_URL", "http://localhost:8000/v1/extract"),
         help="Extract API endpoint (default: $KIE_API_URL or http://localhost:8000/v1/extract)",
     )
     parser.add_argument("--model", help="Model ID for extraction (e.g., joy-vl-3b-sglang)")
+    parser.add_argument(
+        "--concurrency", type=int, default=8, help="Batch mode: requests kept in flight (default: 8)"
+    )
+    parser.add_argument(
+        "--workers", type=int, help="Batch mode: document preparation processes (default: CPU count)"
+    )
 
     args = parser.parse_args()
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
 
     # Load inputs
     schema = load_schema(args.schema)
+
+    if is_batch_target(args.document_path):
+        documents = find_documents(args.document_path)
+        if not documents:
+            parser.error(f"No documents found: {args.document_path}")
+        if args.output:
+            Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+            output = open(args.output, "w")
+        else:
+            output = sys.stdout
+        try:
+            failures = run_batch(
+                documents, schema, args.endpoint, args.model, output, args.concurrency, args.workers
+            )
+        finally:
+            if output is not sys.stdout:
+                output.close()
+        print(
+            f"\nProcessed {len(documents)} documents ({failures} failed)"
+            + (f"; saved to: {args.output}" if args.output else ""),
+            file=sys.stderr,
+        )
+        sys.exit(1 if failures else 0)
+
     doc_base64, doc_type = encode_document(args.document_path)
 
     # Call extraction API
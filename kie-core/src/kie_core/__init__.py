@@ -1,21 +1,133 @@
 """Core client library for the KIE document extraction API."""
 
+from kie_core.batch import (
+    BatchResult,
+    extract_many,
+    extract_many_async,
+    extract_pages,
+    extract_pages_async,
+    extract_schemas,
+    extract_schemas_async,
+)
+from kie_core.cache import CacheStats, MemoryCache, ResultCache, SQLiteCache
 from kie_core.client import (
+    AsyncKIEClient,
+    KIEClient,
     extract,
     extract_async,
     extract_document,
     extract_document_async,
+    extract_typed,
+    extract_typed_async,
+    get_default_async_client,
+    get_default_client,
     get_endpoint,
+    set_default_cache,
+    set_default_limiters,
+)
+from kie_core.document import (
+    PreparedDocument,
+    encode_document,
+    hash_document,
+    iter_base64,
+    iter_chunks,
+    prepare_document,
+    read_document,
+)
+from kie_core.image import ImagePreprocessor, PreprocessResult, PreprocessStats
+from kie_core.instrumentation import (
+    ExtractionContext,
+    Instrumentation,
+    MultiInstrumentation,
+    OpenTelemetryInstrumentation,
+    PrometheusInstrumentation,
+    get_instrumentation,
+    integration_scope,
+    set_instrumentation,
+)
+from kie_core.journal import BatchJournal, JobSummary, run_batch
+from kie_core.pdf import merge_page_results, select_pages, split_pages
+from kie_core.ratelimit import (
+    AdaptiveConcurrencyLimiter,
+    FileTokenBucket,
+    TokenBucket,
+)
+from kie_core.retry import NO_RETRY, HedgePolicy, RetryPolicy
+from kie_core.schema import (
+    CompiledSchema,
+    SchemaRegistry,
+    compile_schema,
+    load_schema,
+    validate_schema,
 )
-from kie_core.document import encode_document
-from kie_core.schema import load_schema
+from kie_core.serialization import JSONBackend, get_json_backend, set_json_backend
+from kie_core.typed import ResultDecoder, TypedResult, compile_decoder, decode_result
 
 __all__ = [
+    "NO_RETRY",
+    "AdaptiveConcurrencyLimiter",
+    "AsyncKIEClient",
+    "BatchJournal",
+    "BatchResult",
+    "CacheStats",
+    "CompiledSchema",
+    "ExtractionContext",
+    "FileTokenBucket",
+    "HedgePolicy",
+    "ImagePreprocessor",
+    "Instrumentation",
+    "JSONBackend",
+    "JobSummary",
+    "KIEClient",
+    "MemoryCache",
+    "MultiInstrumentation",
+    "OpenTelemetryInstrumentation",
+    "PreparedDocument",
+    "PreprocessResult",
+    "PreprocessStats",
+    "PrometheusInstrumentation",
+    "ResultCache",
+    "ResultDecoder",
+    "RetryPolicy",
+    "SQLiteCache",
+    "SchemaRegistry",
+    "TokenBucket",
+    "TypedResult",
+    "compile_decoder",
+    "compile_schema",
+    "decode_result",
     "encode_document",
     "extract",
     "extract_async",
     "extract_document",
     "extract_document_async",
+    "extract_many",
+    "extract_many_async",
+    "extract_pages",
+    "extract_pages_async",
+    "extract_schemas",
+    "extract_schemas_async",
+    "extract_typed",
+    "extract_typed_async",
+    "get_default_async_client",
+    "get_default_client",
     "get_endpoint",
+    "get_instrumentation",
+    "get_json_backend",
+    "hash_document",
+    "integration_scope",
+    "iter_base64",
+    "iter_chunks",
     "load_schema",
+    "merge_page_results",
+    "prepare_document",
+    "read_document",
+    "run_batch",
+    "select_pages",
+    "set_default_cache",
+    "set_default_limiters",
+    "set_instrumentation",
+    "set_json_backend",
+    "split_pages",
+    "validate_schema",
 ]
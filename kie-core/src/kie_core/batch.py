@@ -0,0 +1,357 @@
+"""Bounded-concurrency batch extraction (sync and async)."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import AsyncIterator, BinaryIO, Iterable, Iterator, Mapping
+
+from kie_core.client import (
+    DEFAULT_TIMEOUT,
+    AsyncKIEClient,
+    KIEClient,
+    get_default_async_client,
+    get_default_client,
+)
+from kie_core.document import BUFFER_TYPES, PreparedDocument, prepare_document
+from kie_core.pdf import PageSelection, PDFInput, merge_page_results, split_pages
+from kie_core.schema import compile_schema
+
+DEFAULT_CONCURRENCY = 8
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one document in a batch.
+
+    Attributes:
+        index: Position of the document in the input sequence.
+        document_path: The input document path.
+        result: Extracted field values, or ``None`` if the item failed.
+        error: The exception raised for this item, or ``None`` on success.
+    """
+
+    index: int
+    document_path: str
+    result: dict | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the extraction succeeded."""
+        return self.error is None
+
+
+def extract_many(
+    document_paths: Iterable[str],
+    schema: dict | str,
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    model: str | None = None,
+    endpoint: str | None = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    client: KIEClient | None = None,
+) -> Iterator[BatchResult]:
+    """Extract fields from many documents with bounded concurrency (sync).
+
+    Documents are dispatched over a thread pool sharing one pooled client.
+    Results are yielded as they complete, not in input order; use
+    :attr:`BatchResult.index` to correlate them.  A failing document yields
+    a result with ``error`` set instead of aborting the batch.
+
+    Args:
+        document_paths: Paths to the documents.  Consumed lazily.
+        schema: JSON schema as a dict, JSON string, or path to a ``.json`` file.
+        concurrency: Maximum number of requests in flight.
+        model: Optional model ID for extraction.
+        endpoint: API endpoint URL.
+        timeout: Request timeout in seconds.
+        client: Pooled client to use.  Defaults to the shared client.
+
+    Yields:
+        One :class:`BatchResult` per input document.
+
+    Raises:
+        ValueError: If ``concurrency`` is less than 1 or the schema is invalid.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    schema = compile_schema(schema)
+    client = client or get_default_client()
+
+    def run(index: int, path: str) -> BatchResult:
+        try:
+            result = client.extract_document(
+                path, schema, model=model, endpoint=endpoint, timeout=timeout
+            )
+        except Exception as e:  # noqa: BLE001 — collected per item
+            return BatchResult(index, path, error=e)
+        return BatchResult(index, path, result=result)
+
+    pending: set[Future[BatchResult]] = set()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        try:
+            for index, path in enumerate(document_paths):
+                if len(pending) >= concurrency:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+                pending.add(pool.submit(run, index, path))
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+async def extract_many_async(
+    document_paths: Iterable[str],
+    schema: dict | str,
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    model: str | None = None,
+    endpoint: str | None = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    client: AsyncKIEClient | None = None,
+) -> AsyncIterator[BatchResult]:
+    """Extract fields from many documents with bounded concurrency (async).
+
+    Same parameters and semantics as :func:`extract_many`.  At most
+    ``concurrency`` tasks exist at once; pending requests are cancelled if
+    the consumer stops iterating early.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    schema = compile_schema(schema)
+    client = client or get_default_async_client()
+
+    async def run(index: int, path: str) -> BatchResult:
+        try:
+            result = await client.extract_document(
+                path, schema, model=model, endpoint=endpoint, timeout=timeout
+            )
+        except Exception as e:  # noqa: BLE001 — collected per item
+            return BatchResult(index, path, error=e)
+        return BatchResult(index, path, result=result)
+
+    pending: set[asyncio.Task[BatchResult]] = set()
+    try:
+        for index, path in enumerate(document_paths):
+            if len(pending) >= concurrency:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+            pending.add(asyncio.create_task(run(index, path)))
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def _prepare(
+    document: str | PreparedDocument | bytes | memoryview | BinaryIO,
+) -> PreparedDocument:
+    if isinstance(document, PreparedDocument):
+        return document
+    if isinstance(document, BUFFER_TYPES):
+        return PreparedDocument(document)
+    if hasattr(document, "read"):
+        return PreparedDocument(document.read())
+    return prepare_document(document)
+
+
+def extract_schemas(
+    document: str | PreparedDocument | bytes | memoryview | BinaryIO,
+    schemas: Mapping[str, dict | str],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    model: str | None = None,
+    endpoint: str | None = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    client: KIEClient | None = None,
+) -> dict[str, dict]:
+    """Extract several schemas from one document concurrently (sync).
+
+    The document is read and encoded once; every request reuses the
+    encoded bytes and goes through one pooled client.
+
+    Args:
+        document: Path to the document file, a
+            :class:`~kie_core.document.PreparedDocument`, the document's
+            bytes, or a binary file object.
+        schemas: Schemas by name, each a dict, JSON string, or path to a
+            ``.json`` file.
+        concurrency: Maximum number of requests in flight.
+        model: Optional model ID for extraction.
+        endpoint: API endpoint URL.
+        timeout: Request timeout in seconds.
+        client: Pooled client to use.  Defaults to the shared client.
+
+    Returns:
+        Extracted field values keyed by schema name, in ``schemas`` order.
+
+    Raises:
+        ValueError: If ``concurrency`` is less than 1 or a schema is invalid.
+        FileNotFoundError: If the document does not exist.
+        RuntimeError: If any extraction fails.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    loaded = {name: compile_schema(schema) for name, schema in schemas.items()}
+    prepared = _prepare(document)
+    client = client or get_default_client()
+
+    def run(schema: dict) -> dict:
+        return client.extract_document(
+            prepared, schema, model=model, endpoint=endpoint, timeout=timeout
+        )
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(loaded) or 1)) as pool:
+        return dict(zip(loaded, pool.map(run, loaded.values())))
+
+
+async def extract_schemas_async(
+    document: str | PreparedDocument | bytes | memoryview | BinaryIO,
+    schemas: Mapping[str, dict | str],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    model: str | None = None,
+    endpoint: str | None = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    client: AsyncKIEClient | None = None,
+) -> dict[str, dict]:
+    """Extract several schemas from one document concurrently (async).
+
+    Same parameters and semantics as :func:`extract_schemas`.  If one
+    extraction fails, the others are cancelled.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    loaded = {name: compile_schema(schema) for name, schema in schemas.items()}
+    prepared = _prepare(document)
+    client = client or get_default_async_client()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(schema: dict) -> dict:
+        async with semaphore:
+            return await client.extract_document(
+                prepared, schema, model=model, endpoint=endpoint, timeout=timeout
+            )
+
+    tasks = [asyncio.create_task(run(schema)) for schema in loaded.values()]
+    try:
+        results = await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+    return dict(zip(loaded, results))
+
+
+def extract_pages(
+    document: PDFInput,
+    schema: dict | str,
+    *,
+    pages: PageSelection | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    model: str | None = None,
+    endpoint: str | None = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    client: KIEClient | None = None,
+) -> dict:
+    """Extract each page of a PDF separately and merge the results (sync).
+
+    The PDF is split into single-page documents (requires the ``pdf``
+    extra), which are extracted concurrently through one pooled client.
+    Results are merged in page order with
+    :func:`~kie_core.pdf.merge_page_results`: list fields are concatenated
+    and other fields take the first non-empty value.
+
+    Args:
+        document: Path to a PDF, its bytes, a seekable binary file object,
+            or a :class:`~kie_core.document.PreparedDocument`.
+        schema: JSON schema as a dict, JSON string, or path to a ``.json`` file.
+        pages: Optional page selection, as for
+            :func:`~kie_core.client.extract_document`; defaults to every page.
+        concurrency: Maximum number of requests in flight.
+        model: Optional model ID for extraction.
+        endpoint: API endpoint URL.
+        timeout: Request timeout in seconds.
+        client: Pooled client to use.  Defaults to the shared client.
+
+    Returns:
+        Merged field values.
+
+    Raises:
+        ValueError: If ``concurrency`` is less than 1, the document is not a
+            PDF, or no page is selected.
+        FileNotFoundError: If the document does not exist.
+        RuntimeError: If pypdf is missing or any extraction fails.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    schema = compile_schema(schema)
+    parts = [PreparedDocument(data, "pdf") for _, data in split_pages(document, pages)]
+    client = client or get_default_client()
+
+    def run(part: PreparedDocument) -> dict:
+        return client.extract_document(
+            part, schema, model=model, endpoint=endpoint, timeout=timeout
+        )
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(parts))) as pool:
+        return merge_page_results(pool.map(run, parts))
+
+
+async def extract_pages_async(
+    document: PDFInput,
+    schema: dict | str,
+    *,
+    pages: PageSelection | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    model: str | None = None,
+    endpoint: str | None = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    client: AsyncKIEClient | None = None,
+) -> dict:
+    """Extract each page of a PDF separately and merge the results (async).
+
+    Same parameters and semantics as :func:`extract_pages`.  The PDF is
+    split in a worker thread; if one extraction fails, the others are
+    cancelled.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    schema = compile_schema(schema)
+    split = await asyncio.get_running_loop().run_in_executor(
+        None, split_pages, document, pages
+    )
+    client = client or get_default_async_client()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(data: bytes) -> dict:
+        async with semaphore:
+            return await client.extract_document(
+                PreparedDocument(data, "pdf"),
+                schema,
+                model=model,
+                endpoint=endpoint,
+                timeout=timeout,
+            )
+
+    tasks = [asyncio.create_task(run(data)) for _, data in split]
+    try:
+        results = await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+    return merge_page_results(results)
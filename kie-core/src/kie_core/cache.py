@@ -0,0 +1,198 @@
+"""Content-addressed caches for extraction results."""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+from kie_core.schema import compile_schema
+
+DEFAULT_MAX_ENTRIES = 1024
+
+
+def cache_key(document_digest: str, schema: dict, model: str | None = None) -> str:
+    """Build a cache key from a document digest, schema, and model.
+
+    The schema enters through its
+    :attr:`~kie_core.schema.CompiledSchema.fingerprint`, so semantically
+    identical schemas (field order, whitespace, type-hint spelling) map to
+    the same key.
+
+    Args:
+        document_digest: SHA-256 hex digest of the raw document bytes.
+        schema: JSON schema defining the fields to extract; a
+            :class:`~kie_core.schema.CompiledSchema` avoids re-compiling it.
+        model: Optional model ID for extraction.
+
+    Returns:
+        SHA-256 hex digest identifying the extraction.
+    """
+    fingerprint = compile_schema(schema).fingerprint
+    material = "\0".join([document_digest, fingerprint, model or ""])
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a :class:`ResultCache`."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache (0.0 when unused)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResultCache:
+    """Base class for extraction result caches.
+
+    Subclasses implement :meth:`_get` and :meth:`_set`; lookups through
+    :meth:`get` are counted in :attr:`stats`.  Implementations must be safe
+    to call from several threads.
+    """
+
+    def __init__(self) -> None:
+        self.stats = CacheStats()
+        self._stats_lock = threading.Lock()
+
+    def get(self, key: str) -> dict | None:
+        """Return the cached result for ``key``, or ``None`` on a miss."""
+        value = self._get(key)
+        with self._stats_lock:
+            if value is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+        return value
+
+    def set(self, key: str, value: dict) -> None:
+        """Store ``value`` under ``key``."""
+        self._set(key, value)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        raise NotImplementedError
+
+    def _get(self, key: str) -> dict | None:
+        raise NotImplementedError
+
+    def _set(self, key: str, value: dict) -> None:
+        raise NotImplementedError
+
+
+class MemoryCache(ResultCache):
+    """In-process LRU cache with optional time-to-live.
+
+    Args:
+        max_entries: Maximum number of results kept; least recently used
+            entries are evicted first.
+        ttl: Seconds after which an entry expires.  ``None`` never expires.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: float | None = None,
+    ) -> None:
+        super().__init__()
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _get(self, key: str) -> dict | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def _set(self, key: str, value: dict) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), copy.deepcopy(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class SQLiteCache(ResultCache):
+    """On-disk cache backed by a SQLite database.
+
+    Results survive process restarts and can be shared by several processes
+    pointing at the same file.
+
+    Args:
+        path: Database file path; parent directories are created.
+        ttl: Seconds after which an entry expires.  ``None`` never expires.
+    """
+
+    def __init__(self, path: str | Path, ttl: float | None = None) -> None:
+        super().__init__()
+        self.path = Path(path)
+        self.ttl = ttl
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS results "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, stored_at REAL NOT NULL)"
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM results")
+
+    def _get(self, key: str) -> dict | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, stored_at FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, stored_at = row
+            if self.ttl is not None and time.time() - stored_at > self.ttl:
+                with self._conn:
+                    self._conn.execute("DELETE FROM results WHERE key = ?", (key,))
+                return None
+        return json.loads(value)
+
+    def _set(self, key: str, value: dict) -> None:
+        data = json.dumps(value, ensure_ascii=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (key, value, stored_at) "
+                "VALUES (?, ?, ?)",
+                (key, data, time.time()),
+            )
@@ -2,15 +2,92 @@
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import base64
+import binascii
+import copy
+import hashlib
+import itertools
 import os
+import re
+import threading
+import time
+import weakref
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from contextlib import AbstractAsyncContextManager, contextmanager, nullcontext
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    BinaryIO,
+    Callable,
+    Iterator,
+)
 
 import httpx
 
-from kie_core.document import encode_document
-from kie_core.schema import load_schema
+from kie_core.cache import MemoryCache, ResultCache, cache_key
+from kie_core.document import (
+    BUFFER_TYPES,
+    DEFAULT_CHUNK_SIZE,
+    Base64Encoder,
+    DocumentInput,
+    PreparedDocument,
+    base64_length,
+    detect_document_type,
+    encode_document,
+    hash_document,
+    iter_base64,
+    iter_chunks,
+    sniff_document_type,
+)
+from kie_core import ratelimit, serialization
+from kie_core.image import ImagePreprocessor
+from kie_core.instrumentation import (
+    Instrumentation,
+    Recorder,
+    get_instrumentation,
+    record_extraction,
+    timed,
+    timing,
+)
+from kie_core.pdf import PageSelection, select_pages
+from kie_core.ratelimit import AdaptiveConcurrencyLimiter, TokenBucket
+from kie_core.retry import (
+    NO_RETRY,
+    HedgePolicy,
+    RetryPolicy,
+    acall_with_retry,
+    ahedged_call,
+    call_with_retry,
+    hedged_call,
+)
+from kie_core.schema import CompiledSchema, compile_schema
+from kie_core.typed import TypedResult, compile_decoder
 
 DEFAULT_ENDPOINT = "http://localhost:8000/v1/extract"
 DEFAULT_TIMEOUT = 120.0
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+DEFAULT_STREAM_THRESHOLD = 8 * 1024 * 1024
+DEFAULT_OFFLOAD_THRESHOLD = 1024 * 1024
+DEFAULT_OFFLOAD_WORKERS = 4
+UPLOAD_MODES = ("json", "multipart")
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Statuses with which a server signals it does not accept multipart uploads.
+# A 400 only counts if its body says so (see _rejects_multipart); other 4xx
+# responses are validation errors that a JSON upload would hit as well.
+MULTIPART_REJECTED_STATUSES = frozenset({405, 415})
+
+_UNSUPPORTED_FORMAT = re.compile(
+    rb"unsupported|multipart|content[- ]type|media[- ]type", re.IGNORECASE
+)
 
 
 def get_endpoint() -> str:
@@ -37,6 +114,1451 @@ def _build_payload(
     return payload
 
 
+class _SplicedPayload:
+    """Request body assembled from pre-serialized pieces.
+
+    The envelope around the document is serialized separately and the
+    pieces are sent back to back.  Unless noted otherwise, bodies are
+    re-iterable and have a known length, so httpx sends a ``Content-Length``
+    header rather than chunked encoding.  ``blocking`` bodies read or encode
+    the document while they are iterated.  ``hedgeable`` bodies can be
+    iterated by concurrent attempts at once.
+    """
+
+    content_length: int
+    replayable = True
+    hedgeable = True
+    blocking = True
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {
+            "Content-Type": "application/json",
+            "Content-Length": str(self.content_length),
+        }
+
+    def __iter__(self) -> Iterator[bytes]:
+        raise NotImplementedError
+
+    async def aiter_bytes(
+        self, executor: Executor | None = None
+    ) -> AsyncIterator[bytes]:
+        """Yield the body, producing each chunk in ``executor`` if given."""
+        if executor is None:
+            for chunk in self:
+                yield chunk
+            return
+        loop = asyncio.get_running_loop()
+        chunks = iter(self)
+        while True:
+            chunk = await loop.run_in_executor(executor, next, chunks, None)
+            if chunk is None:
+                return
+            yield chunk
+
+
+def _payload_tail(schema: dict, model: str | None) -> bytes:
+    """Serialize the request body after the ``"document"`` value.
+
+    The schema's JSON comes precomputed from its
+    :class:`~kie_core.schema.CompiledSchema`; only the options are
+    serialized per request.  Matches the key order of :func:`_build_payload`.
+    """
+    tail = b',"schema":' + compile_schema(schema).json
+    if model:
+        tail += b',"options":' + serialization.dumps({"model": model})
+    return tail + b"}"
+
+
+def _serialize_payload(
+    doc_base64: str, doc_type: str, schema: dict, model: str | None
+) -> bytes:
+    """Serialize the :func:`_build_payload` payload, splicing in the schema."""
+    document = serialization.dumps({"content": doc_base64, "type": doc_type})
+    return b'{"document":' + document + _payload_tail(schema, model)
+
+
+def _json_envelope(
+    doc_type: str, schema: dict, model: str | None
+) -> tuple[bytes, bytes]:
+    """Serialize the JSON envelope split around the document content."""
+    suffix = b'","type":' + serialization.dumps(doc_type) + b"}"
+    return b'{"document":{"content":"', suffix + _payload_tail(schema, model)
+
+
+def _multipart_envelope(
+    boundary: str, doc_type: str, filename: str, schema: dict, model: str | None
+) -> tuple[bytes, bytes]:
+    """Return the ``multipart/form-data`` parts before and after the file."""
+    fields = {"schema": compile_schema(schema).json.decode(), "type": doc_type}
+    if model:
+        fields["model"] = model
+    parts = [
+        f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"'
+        f"\r\n\r\n{value}\r\n"
+        for name, value in fields.items()
+    ]
+    mime = "application/pdf" if doc_type == "pdf" else "application/octet-stream"
+    parts.append(
+        f"--{boundary}\r\nContent-Disposition: form-data; "
+        f'name="document"; filename="{_quote_filename(filename)}"\r\n'
+        f"Content-Type: {mime}\r\n\r\n"
+    )
+    return "".join(parts).encode(), f"\r\n--{boundary}--\r\n".encode()
+
+
+def _multipart_headers(boundary: str) -> dict[str, str]:
+    return {"Content-Type": f"multipart/form-data; boundary={boundary}"}
+
+
+class _StreamingPayload(_SplicedPayload):
+    """Request body that base64-encodes a document file on the fly."""
+
+    def __init__(
+        self,
+        document_path: str | Path,
+        schema: dict,
+        model: str | None = None,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        self.path = Path(document_path)
+        self.chunk_size = chunk_size
+        self.doc_type = detect_document_type(self.path)
+        self.prefix, self.suffix = _json_envelope(self.doc_type, schema, model)
+        self.content_length = (
+            len(self.prefix)
+            + base64_length(self.path.stat().st_size)
+            + len(self.suffix)
+        )
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self.prefix
+        yield from iter_base64(self.path, self.chunk_size)
+        yield self.suffix
+
+
+class _PreparedPayload(_SplicedPayload):
+    """Request body around a :class:`PreparedDocument`'s serialized fragment.
+
+    Only the schema and options are serialized per request; the encoded
+    document is sent as-is without being copied.
+    """
+
+    _PREFIX = b'{"document":'
+    blocking = False
+
+    def __init__(
+        self,
+        prepared: PreparedDocument,
+        schema: dict,
+        model: str | None = None,
+    ) -> None:
+        self.prepared = prepared
+        self.suffix = _payload_tail(schema, model)
+        self.content_length = (
+            len(self._PREFIX)
+            + sum(len(part) for part in prepared.fragments)
+            + len(self.suffix)
+        )
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self._PREFIX
+        yield from self.prepared.fragments
+        yield self.suffix
+
+
+class _MultipartPayload(_SplicedPayload):
+    """``multipart/form-data`` body carrying the raw document bytes.
+
+    Parts: ``schema`` (JSON), ``type``, optional ``model``, then the
+    ``document`` file.  Files are streamed from disk in chunks; nothing is
+    base64-encoded, so the body is about 25% smaller than the JSON envelope.
+    """
+
+    def __init__(
+        self,
+        document: str | PreparedDocument | bytes | bytearray | memoryview,
+        schema: dict,
+        model: str | None = None,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        self.document = document
+        self.chunk_size = chunk_size
+        self.blocking = not isinstance(document, BUFFER_TYPES)
+        if isinstance(document, PreparedDocument):
+            doc_type, size, filename = document.doc_type, document.size, "document"
+        elif isinstance(document, BUFFER_TYPES):
+            view = memoryview(document)
+            doc_type = sniff_document_type(bytes(view[:4]))
+            size, filename = view.nbytes, "document"
+        else:
+            path = Path(document)
+            doc_type = detect_document_type(path)
+            size, filename = path.stat().st_size, path.name
+        self.boundary = os.urandom(16).hex()
+        self.prefix, self.suffix = _multipart_envelope(
+            self.boundary, doc_type, filename, schema, model
+        )
+        self.content_length = len(self.prefix) + size + len(self.suffix)
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {
+            **_multipart_headers(self.boundary),
+            "Content-Length": str(self.content_length),
+        }
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self.prefix
+        if isinstance(self.document, PreparedDocument):
+            yield base64.b64decode(self.document.content)
+        elif isinstance(self.document, BUFFER_TYPES):
+            yield self.document
+        else:
+            with open(self.document, "rb") as f:
+                while chunk := f.read(self.chunk_size):
+                    yield chunk
+        yield self.suffix
+
+
+class _StreamPayload(_SplicedPayload):
+    """Body for a document given as a binary file object or async chunks.
+
+    Nothing touches the disk: chunks are encoded (or, for multipart, passed
+    through) as they are read, and the document type is sniffed from the
+    first chunk.  Seekable file objects are rewound on every iteration, so
+    they can be retried, and are sent with a ``Content-Length``.  Other
+    sources can only be sent once, with chunked transfer encoding.  Attempts
+    share the source's read position, so they are never hedged.
+    """
+
+    hedgeable = False
+
+    def __init__(
+        self,
+        source: BinaryIO | AsyncIterable[bytes],
+        schema: dict,
+        model: str | None = None,
+        *,
+        multipart: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        self.source = source
+        self.schema = schema
+        self.model = model
+        self.multipart = multipart
+        self.chunk_size = chunk_size
+        self.boundary = os.urandom(16).hex()
+        name = getattr(source, "name", None)
+        self.filename = Path(name).name if isinstance(name, str) else "document"
+        self.start = _tell(source)
+        self.replayable = self.start is not None
+        self.content_length = None
+        self._consumed = False
+        if self.start is not None:
+            size = source.seek(0, os.SEEK_END) - self.start
+            source.seek(self.start)
+            head = source.read(4)
+            source.seek(self.start)
+            prefix, suffix = self._envelope(sniff_document_type(head))
+            content = size if multipart else base64_length(size)
+            self.content_length = len(prefix) + content + len(suffix)
+
+    @property
+    def headers(self) -> dict[str, str]:
+        if self.multipart:
+            headers = _multipart_headers(self.boundary)
+        else:
+            headers = dict(JSON_HEADERS)
+        if self.content_length is not None:
+            headers["Content-Length"] = str(self.content_length)
+        return headers
+
+    def _envelope(self, doc_type: str) -> tuple[bytes, bytes]:
+        if self.multipart:
+            return _multipart_envelope(
+                self.boundary, doc_type, self.filename, self.schema, self.model
+            )
+        return _json_envelope(doc_type, self.schema, self.model)
+
+    def _begin(self, first: bytes) -> bytes:
+        """Start a pass over the source; returns the envelope prefix."""
+        if self._consumed and not self.replayable:
+            raise RuntimeError("Document stream was already consumed")
+        self._consumed = True
+        self._encoder = None if self.multipart else Base64Encoder()
+        prefix, self._suffix = self._envelope(sniff_document_type(bytes(first[:4])))
+        return prefix
+
+    def _feed(self, chunk: bytes) -> bytes:
+        if self._encoder is None:
+            return bytes(chunk)
+        return self._encoder.update(chunk)
+
+    def _end(self) -> bytes:
+        if self._encoder is None:
+            return self._suffix
+        return self._encoder.finish() + self._suffix
+
+    def __iter__(self) -> Iterator[bytes]:
+        if self.start is not None:
+            self.source.seek(self.start)
+        chunks = iter_chunks(self.source, self.chunk_size)
+        first = next(chunks, b"")
+        yield self._begin(first)
+        for chunk in itertools.chain([first], chunks):
+            if part := self._feed(chunk):
+                yield part
+        yield self._end()
+
+    async def aiter_bytes(
+        self, executor: Executor | None = None
+    ) -> AsyncIterator[bytes]:
+        if not hasattr(self.source, "__aiter__"):
+            async for part in super().aiter_bytes(executor):
+                yield part
+            return
+        chunks = self.source.__aiter__()
+        first = await anext(chunks, b"")
+        yield self._begin(first)
+        if part := self._feed(first):
+            yield part
+        async for chunk in chunks:
+            if part := self._feed(chunk):
+                yield part
+        yield self._end()
+
+
+def _rejects_multipart(response: httpx.Response) -> bool:
+    """Whether an error response means the server does not take multipart."""
+    status = response.status_code
+    if status in MULTIPART_REJECTED_STATUSES:
+        return True
+    return status == 400 and bool(_UNSUPPORTED_FORMAT.search(response.content))
+
+
+def _tell(source: object) -> int | None:
+    """Return the position of a seekable file object, else ``None``."""
+    try:
+        return source.tell() if source.seekable() else None
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _is_stream(document: object) -> bool:
+    return hasattr(document, "read") or hasattr(document, "__aiter__")
+
+
+def _streaming_payload(
+    document_path: str,
+    schema: dict,
+    model: str | None,
+    threshold: int | None,
+) -> _StreamingPayload | None:
+    """Return a streaming body if the document is at least ``threshold`` bytes.
+
+    Missing files return ``None`` so the caller's regular path raises the
+    usual ``FileNotFoundError``.
+    """
+    if threshold is None:
+        return None
+    try:
+        size = os.path.getsize(document_path)
+    except OSError:
+        return None
+    if size < threshold:
+        return None
+    return _StreamingPayload(document_path, schema, model)
+
+
+def _quote_filename(name: str) -> str:
+    """Escape a filename for a ``Content-Disposition`` header (HTML5 style)."""
+    return name.translate({ord('"'): "%22", ord("\r"): "%0D", ord("\n"): "%0A"})
+
+
+def _json_body(
+    document: str | PreparedDocument | bytes | bytearray | memoryview,
+    schema: dict,
+    model: str | None,
+    threshold: int | None,
+) -> _SplicedPayload | bytes:
+    """Return the JSON-envelope body for a document.
+
+    Prepared, in-memory and large documents get a pre-assembled body;
+    anything else is encoded and serialized in memory.
+    """
+    if isinstance(document, BUFFER_TYPES):
+        document = PreparedDocument(document)
+    if isinstance(document, PreparedDocument):
+        return _PreparedPayload(document, schema, model)
+    body = _streaming_payload(document, schema, model, threshold)
+    if body is not None:
+        return body
+    return _serialize_payload(*encode_document(document), schema, model)
+
+
+def _check_upload_mode(upload: str) -> str:
+    if upload not in UPLOAD_MODES:
+        raise ValueError(f"upload must be one of {UPLOAD_MODES}, got {upload!r}")
+    return upload
+
+
+def _document_digest(document: DocumentInput) -> str | None:
+    """Return the SHA-256 of a document, or ``None`` if it cannot be re-read."""
+    if isinstance(document, PreparedDocument):
+        return document.digest
+    if isinstance(document, BUFFER_TYPES):
+        return hashlib.sha256(document).hexdigest()
+    if _is_stream(document):
+        start = _tell(document)
+        if start is None:
+            return None
+        digest = hash_document(document)
+        document.seek(start)
+        return digest
+    return hash_document(document)
+
+
+def _document_size(document: DocumentInput) -> int | None:
+    """Return how many bytes must be read or encoded up front for a document.
+
+    ``None`` for file objects, whose size is not known without touching
+    them.  Prepared documents and async iterators need no up-front work, and
+    missing files count as empty so that the regular path raises the usual
+    ``FileNotFoundError``.
+    """
+    if isinstance(document, PreparedDocument) or hasattr(document, "__aiter__"):
+        return 0
+    if isinstance(document, BUFFER_TYPES):
+        return memoryview(document).nbytes
+    if _is_stream(document):
+        return None
+    try:
+        return os.path.getsize(document)
+    except OSError:
+        return 0
+
+
+def _keyed(client: KIEClient | AsyncKIEClient) -> bool:
+    """Whether the client's extractions need a cache / single-flight key."""
+    return client.cache is not None or client._flights is not None
+
+
+def _extraction_key(
+    client: KIEClient | AsyncKIEClient,
+    digest: Callable[[], str | None],
+    schema: dict,
+    model: str | None,
+) -> str | None:
+    """Return the cache / single-flight key of an extraction.
+
+    ``None`` when the client uses neither, or when the document cannot be
+    hashed up front (one-shot streams).
+    """
+    if not _keyed(client):
+        return None
+    document_digest = digest()
+    if document_digest is None:
+        return None
+    return cache_key(document_digest, schema, model)
+
+
+class _SingleFlight:
+    """Collapse concurrent identical calls (threads) into one."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[str, Future[dict]] = {}
+
+    def do(self, key: str, call: Callable[[], dict]) -> dict:
+        """Run ``call``, or wait for the identical call already running.
+
+        Callers that join get a deep copy, so no two share a result dict.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            if future is None:
+                future = self._calls[key] = Future()
+                leader = True
+            else:
+                leader = False
+        if not leader:
+            return copy.deepcopy(future.result())
+        try:
+            result = call()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class _AsyncSingleFlight:
+    """Collapse concurrent identical calls (tasks) into one.
+
+    The call runs in its own task, so a cancelled caller does not cancel it
+    for the others; it is cancelled only once every caller has given up.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, tuple[asyncio.Task[dict], list[int]]] = {}
+
+    async def do(self, key: str, call: Callable[[], Awaitable[dict]]) -> dict:
+        """Await ``call``, or join the identical call already running."""
+        entry = self._calls.get(key)
+        leader = entry is None
+        if leader:
+            task = asyncio.ensure_future(call())
+            entry = self._calls[key] = (task, [0])
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        task, waiters = entry
+        waiters[0] += 1
+        try:
+            result = await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if not task.done() and waiters[0] == 1:
+                task.cancel()
+            raise
+        finally:
+            waiters[0] -= 1
+        return result if leader else copy.deepcopy(result)
+
+
+def _digest_base64(doc_base64: str, decode: bool = True) -> str:
+    """Return the digest keying an extraction of a base64-encoded document.
+
+    Decoding gives the same digest as the raw bytes, so results are shared
+    with :meth:`KIEClient.extract_document` through a cache; it costs a full
+    decoded copy.  Without ``decode`` (single-flight only), the text is hashed
+    in chunks instead, under a prefix that keeps it apart from raw digests.
+    """
+    if not decode:
+        digest = hashlib.sha256()
+        for start in range(0, len(doc_base64), DEFAULT_CHUNK_SIZE):
+            digest.update(doc_base64[start : start + DEFAULT_CHUNK_SIZE].encode())
+        return "base64:" + digest.hexdigest()
+    try:
+        data = base64.b64decode(doc_base64)
+    except binascii.Error:
+        # Malformed input; the server will reject it, but it still needs a key.
+        data = b"invalid base64:" + doc_base64.encode()
+    return hashlib.sha256(data).hexdigest()
+
+
+_offload_executor: ThreadPoolExecutor | None = None
+_offload_executor_lock = threading.Lock()
+
+
+def _default_offload_executor() -> ThreadPoolExecutor:
+    """Return the bounded pool async clients read and encode documents in.
+
+    Separate from the event loop's default executor, so a burst of large
+    documents cannot starve DNS lookups and other ``to_thread`` work.
+    """
+    global _offload_executor
+    with _offload_executor_lock:
+        if _offload_executor is None:
+            _offload_executor = ThreadPoolExecutor(
+                max_workers=DEFAULT_OFFLOAD_WORKERS, thread_name_prefix="kie-io"
+            )
+        return _offload_executor
+
+
+def _build_limits(
+    max_connections: int,
+    max_keepalive_connections: int,
+    keepalive_expiry: float,
+) -> httpx.Limits:
+    """Build the connection-pool limits shared by both client flavours."""
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+@contextmanager
+def _api_errors(endpoint: str, timeout: float) -> Iterator[None]:
+    """Translate httpx failures into the ``RuntimeError`` callers expect."""
+    try:
+        yield
+    except httpx.HTTPStatusError as e:
+        body = e.response.text
+        raise RuntimeError(
+            f"API request failed ({e.response.status_code}): {body}"
+        ) from e
+    except httpx.ConnectError as e:
+        raise RuntimeError(f"Could not reach endpoint {endpoint}: {e}") from e
+    except httpx.TimeoutException as e:
+        raise RuntimeError(
+            f"Request to {endpoint} timed out after {timeout}s"
+        ) from e
+
+
+def _error_response(error: BaseException) -> httpx.Response | None:
+    """The response carried by an HTTP status error, for instrumentation."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response
+    return None
+
+
+# ── pooled clients ────────────────────────────────────────────────────
+
+
+class KIEClient:
+    """Long-lived synchronous client that owns a keep-alive connection pool.
+
+    Reusing one instance across calls avoids paying TCP and TLS setup on
+    every extraction.  The client is thread-safe and can be shared.
+
+    Args:
+        endpoint: API endpoint URL.  When omitted, ``$KIE_API_URL`` (or the
+            default) is resolved on every call.
+        timeout: Default request timeout in seconds.
+        max_connections: Maximum number of concurrent connections.
+        max_keepalive_connections: Maximum number of idle connections kept open.
+        keepalive_expiry: Seconds an idle connection is kept before closing.
+        http2: Enable HTTP/2 (requires the ``http2`` extra).
+        stream_threshold: Documents at least this many bytes are streamed from
+            disk in chunks by :meth:`extract_document` instead of being
+            encoded in memory.  ``None`` disables streaming.
+        upload: How :meth:`extract_document` sends documents: ``"json"``
+            (base64 inside the JSON envelope) or ``"multipart"`` (raw bytes
+            as ``multipart/form-data``, about 25% smaller and without JSON
+            encoding).  If the server rejects a multipart upload the request
+            is repeated as JSON, and the client sticks to JSON from then on.
+        cache: Optional :class:`~kie_core.cache.ResultCache` consulted before
+            any network call, keyed on document hash, schema, and model.
+        preprocessor: Optional :class:`~kie_core.image.ImagePreprocessor`
+            applied to image documents before upload.  The cache is keyed on
+            the original document, so hits skip preprocessing too.
+        single_flight: Collapse concurrent identical extractions (same
+            document hash, schema, and model) into one request whose result
+            all callers share, whether or not a cache is configured.
+            Documents are hashed up front for this; one-shot streams are
+            never deduplicated.
+        retry: Retry policy for 429/5xx responses and connection failures.
+            Defaults to :class:`~kie_core.retry.RetryPolicy` (3 attempts);
+            pass :data:`~kie_core.retry.NO_RETRY` to disable.
+        hedge: Optional :class:`~kie_core.retry.HedgePolicy`; slow requests
+            get a duplicate and the first answer wins.
+        rate_limiter: Optional :class:`~kie_core.ratelimit.TokenBucket`
+            every attempt draws a token from.
+        concurrency_limiter: Optional
+            :class:`~kie_core.ratelimit.AdaptiveConcurrencyLimiter` bounding
+            attempts in flight.  Share one instance between clients to give
+            them a common budget.
+        instrumentation: Optional
+            :class:`~kie_core.instrumentation.Instrumentation` receiving
+            per-phase timings, sizes, attempts, and cache hits of every
+            call.  Defaults to
+            :func:`~kie_core.instrumentation.get_instrumentation`.
+        transport: Optional custom httpx transport (mainly for testing).
+    """
+
+    def __init__(
+        self,
+        endpoint: str | None = None,
+        *,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
+        stream_threshold: int | None = DEFAULT_STREAM_THRESHOLD,
+        upload: str = "json",
+        cache: ResultCache | None = None,
+        preprocessor: ImagePreprocessor | None = None,
+        single_flight: bool = True,
+        retry: RetryPolicy | None = None,
+        hedge: HedgePolicy | None = None,
+        rate_limiter: TokenBucket | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        instrumentation: Instrumentation | None = None,
+        transport: httpx.BaseTransport | None = None,
+    ) -> None:
+        self.endpoint = endpoint
+        self.timeout = timeout
+        self.stream_threshold = stream_threshold
+        self.upload = _check_upload_mode(upload)
+        self._multipart_rejected = False
+        self.cache = cache
+        self.preprocessor = preprocessor
+        self._flights = _SingleFlight() if single_flight else None
+        self.retry = retry or RetryPolicy()
+        self.hedge = hedge
+        self.rate_limiter = rate_limiter
+        self.concurrency_limiter = concurrency_limiter
+        self.instrumentation = instrumentation
+        self._http = httpx.Client(
+            timeout=timeout,
+            limits=_build_limits(
+                max_connections, max_keepalive_connections, keepalive_expiry
+            ),
+            http2=http2,
+            transport=transport,
+        )
+        self._hedge_executor = (
+            ThreadPoolExecutor(max_workers=max_connections) if hedge else None
+        )
+
+    def __enter__(self) -> KIEClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether the underlying connection pool has been closed."""
+        return self._http.is_closed
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False)
+        self._http.close()
+
+    def extract(
+        self,
+        doc_base64: str,
+        doc_type: str,
+        schema: dict,
+        *,
+        model: str | None = None,
+        endpoint: str | None = None,
+        timeout: float | None = None,
+    ) -> dict:
+        """Call the KIE extraction API.  See :func:`extract`."""
+        schema = compile_schema(schema)
+        with record_extraction(self._instrumentation(), "extract") as recorder:
+            key = _extraction_key(
+                self,
+                timing(
+                    recorder,
+                    "hash",
+                    lambda: _digest_base64(doc_base64, self.cache is not None),
+                ),
+                schema,
+                model,
+            )
+
+            def call() -> dict:
+                with timed(recorder, "prepare"):
+                    payload = _serialize_payload(doc_base64, doc_type, schema, model)
+                return self._post(
+                    endpoint,
+                    timeout,
+                    lambda: self._request(payload),
+                    recorder=recorder,
+                )
+
+            return self._once(key, call, recorder)
+
+    def _instrumentation(self) -> Instrumentation | None:
+        return self.instrumentation or get_instrumentation()
+
+    def _once(
+        self,
+        key: str | None,
+        call: Callable[[], dict],
+        recorder: Recorder | None = None,
+    ) -> dict:
+        """Answer from the cache, join an identical call in flight, or run it."""
+        if key is None:
+            return call()
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                if recorder is not None:
+                    recorder.ctx.cache_hit = True
+                return cached
+        ran = False
+
+        def fetch() -> dict:
+            nonlocal ran
+            ran = True
+            result = call()
+            if self.cache is not None:
+                self.cache.set(key, result)
+            return result
+
+        if self._flights is None:
+            return fetch()
+        result = self._flights.do(key, fetch)
+        if recorder is not None and not ran:
+            recorder.ctx.shared = True
+        return result
+
+    def _post(
+        self,
+        endpoint: str | None,
+        timeout: float | None,
+        build_request: Callable[[], dict[str, Any]],
+        json_fallback: Callable[[], Callable[[], dict[str, Any]]] | None = None,
+        replayable: bool = True,
+        hedgeable: bool = True,
+        parse: Callable[[bytes], Any] = serialization.loads,
+        recorder: Recorder | None = None,
+    ) -> Any:
+        """POST with retries and optional hedging; returns the parsed body.
+
+        ``build_request`` returns the httpx request arguments and is called
+        once per attempt, so streamed bodies are rebuilt on retry.  If the
+        server rejects a multipart upload, ``json_fallback`` supplies the
+        ``build_request`` for the JSON envelope, which is sent instead.
+        Bodies that are not ``replayable`` are sent once, without retries
+        or hedging; bodies that are not ``hedgeable`` are retried but never
+        sent by two attempts at once.  The response body is decoded with
+        ``parse``.  Attempts and their transport phases are reported to
+        ``recorder``.
+        """
+        endpoint = endpoint or self.endpoint or get_endpoint()
+        timeout = self.timeout if timeout is None else timeout
+        retry = self.retry if replayable else NO_RETRY
+        hedged = self.hedge is not None and replayable and hedgeable
+
+        def sender(
+            build: Callable[[], dict[str, Any]],
+        ) -> Callable[[float], httpx.Response]:
+            def send(attempt_timeout: float) -> httpx.Response:
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire()
+                limiter = self.concurrency_limiter
+                with limiter.slot() if limiter else nullcontext():
+                    if recorder is None:
+                        response = self._http.post(
+                            endpoint, timeout=attempt_timeout, **build()
+                        )
+                        response.raise_for_status()
+                        return response
+                    trace = recorder.attempt()
+                    try:
+                        response = self._http.post(
+                            endpoint,
+                            timeout=attempt_timeout,
+                            extensions={"trace": trace},
+                            **build(),
+                        )
+                        response.raise_for_status()
+                    except Exception as e:
+                        trace.finish(_error_response(e), e)
+                        raise
+                    trace.finish(response)
+                    return response
+
+            def attempt(attempt_timeout: float) -> httpx.Response:
+                delay = self.hedge.current_delay()
+                started = time.monotonic()
+                if delay is None:
+                    response = send(attempt_timeout)
+                else:
+                    response = hedged_call(
+                        self._hedge_executor, lambda: send(attempt_timeout), delay
+                    )
+                self.hedge.record(time.monotonic() - started)
+                return response
+
+            return attempt if hedged else send
+
+        with _api_errors(endpoint, timeout):
+            try:
+                response = call_with_retry(retry, sender(build_request), timeout)
+            except httpx.HTTPStatusError as e:
+                if json_fallback is None or not _rejects_multipart(e.response):
+                    raise
+                response = call_with_retry(retry, sender(json_fallback()), timeout)
+                self._multipart_rejected = True
+            with timed(recorder, "parse"):
+                return parse(response.content)
+
+    @staticmethod
+    def _request(body: _SplicedPayload | bytes) -> dict[str, Any]:
+        if isinstance(body, _SplicedPayload):
+            return {"content": body, "headers": body.headers}
+        return {"content": body, "headers": JSON_HEADERS}
+
+    def extract_document(
+        self,
+        document_path: DocumentInput,
+        schema: dict | str,
+        *,
+        model: str | None = None,
+        endpoint: str | None = None,
+        timeout: float | None = None,
+        pages: PageSelection | None = None,
+    ) -> dict:
+        """Encode a document and extract fields.  See :func:`extract_document`."""
+        return self._extract_document(
+            document_path, compile_schema(schema), model, endpoint, timeout, pages
+        )
+
+    def extract_typed(
+        self,
+        document_path: DocumentInput,
+        schema: dict | str,
+        *,
+        backend: str | None = None,
+        model: str | None = None,
+        endpoint: str | None = None,
+        timeout: float | None = None,
+        pages: PageSelection | None = None,
+    ) -> TypedResult:
+        """Extract fields as typed values.  See :func:`extract_typed`."""
+        decoder = compile_decoder(schema, backend=backend)
+        return self._extract_document(
+            document_path,
+            decoder.schema,
+            model,
+            endpoint,
+            timeout,
+            pages,
+            decode=decoder.decode,
+        )
+
+    def _extract_document(
+        self,
+        document_path: DocumentInput,
+        schema: CompiledSchema,
+        model: str | None,
+        endpoint: str | None,
+        timeout: float | None,
+        pages: PageSelection | None,
+        decode: Callable[[bytes | dict], Any] | None = None,
+    ) -> Any:
+        """Run an extraction, decoding the result with ``decode`` if given.
+
+        ``decode`` parses the response body directly, unless a cache is
+        configured: the cache holds plain results, so those are decoded.
+        """
+        operation = "extract_document" if decode is None else "extract_typed"
+        decode_body = decode is not None and self.cache is None
+        with record_extraction(self._instrumentation(), operation) as recorder:
+            if pages is not None:
+                with timed(recorder, "pages"):
+                    document_path = select_pages(document_path, pages)
+            key = _extraction_key(
+                self,
+                timing(recorder, "hash", lambda: _document_digest(document_path)),
+                schema,
+                model,
+            )
+            if decode_body and key is not None:
+                key += ":typed"  # never share a flight with plain results
+
+            def call() -> Any:
+                document = document_path
+                if self.preprocessor is not None:
+                    with timed(recorder, "preprocess"):
+                        document = self.preprocessor.process_document(document)
+                with timed(recorder, "prepare"):
+                    requests = _upload_requests(self, document, schema, model)
+                return self._post(
+                    endpoint,
+                    timeout,
+                    *requests,
+                    parse=decode if decode_body else serialization.loads,
+                    recorder=recorder,
+                )
+
+            result = self._once(key, call, recorder)
+            if decode is not None and not decode_body:
+                with timed(recorder, "parse"):
+                    result = decode(result)
+            return result
+
+
+class AsyncKIEClient:
+    """Long-lived asynchronous client that owns a keep-alive connection pool.
+
+    Same parameters as :class:`KIEClient`, plus the two below.  An instance
+    is bound to the event loop it is first used on; create one per loop.
+
+    Args:
+        offload_threshold: Documents at least this many bytes are read,
+            hashed, and encoded in ``executor`` instead of on the event loop,
+            and streamed bodies produce their chunks there.  Smaller ones stay
+            inline, where a thread hop would cost more than it saves.  File
+            objects of unknown size, and lookups in caches other than
+            :class:`~kie_core.cache.MemoryCache` (such as SQLite), are always
+            offloaded; ``None`` keeps all work on the loop.
+        executor: Pool for the offloaded work.  Defaults to a shared pool of
+            :data:`DEFAULT_OFFLOAD_WORKERS` threads, which also bounds how
+            much memory concurrent encodes can take.
+    """
+
+    def __init__(
+        self,
+        endpoint: str | None = None,
+        *,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        http2: bool = False,
+        stream_threshold: int | None = DEFAULT_STREAM_THRESHOLD,
+        offload_threshold: int | None = DEFAULT_OFFLOAD_THRESHOLD,
+        executor: Executor | None = None,
+        upload: str = "json",
+        cache: ResultCache | None = None,
+        preprocessor: ImagePreprocessor | None = None,
+        single_flight: bool = True,
+        retry: RetryPolicy | None = None,
+        hedge: HedgePolicy | None = None,
+        rate_limiter: TokenBucket | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        instrumentation: Instrumentation | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.endpoint = endpoint
+        self.timeout = timeout
+        self.stream_threshold = stream_threshold
+        self.offload_threshold = offload_threshold
+        self.executor = executor
+        self.upload = _check_upload_mode(upload)
+        self._multipart_rejected = False
+        self.cache = cache
+        self.preprocessor = preprocessor
+        self._flights = _AsyncSingleFlight() if single_flight else None
+        self.retry = retry or RetryPolicy()
+        self.hedge = hedge
+        self.rate_limiter = rate_limiter
+        self.concurrency_limiter = concurrency_limiter
+        self.instrumentation = instrumentation
+        self._http = httpx.AsyncClient(
+            timeout=timeout,
+            limits=_build_limits(
+                max_connections, max_keepalive_connections, keepalive_expiry
+            ),
+            http2=http2,
+            transport=transport,
+        )
+
+    async def __aenter__(self) -> AsyncKIEClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether the underlying connection pool has been closed."""
+        return self._http.is_closed
+
+    async def aclose(self) -> None:
+        """Close all pooled connections."""
+        await self._http.aclose()
+
+    async def extract(
+        self,
+        doc_base64: str,
+        doc_type: str,
+        schema: dict,
+        *,
+        model: str | None = None,
+        endpoint: str | None = None,
+        timeout: float | None = None,
+    ) -> dict:
+        """Call the KIE extraction API.  See :func:`extract`."""
+        schema = compile_schema(schema)
+        executor = self._offload_to(len(doc_base64))
+        with record_extraction(self._instrumentation(), "extract") as recorder:
+            digest = None
+            if _keyed(self):
+                with timed(recorder, "hash"):
+                    digest = await _offload(
+                        executor, _digest_base64, doc_base64, self.cache is not None
+                    )
+            key = _extraction_key(self, lambda: digest, schema, model)
+
+            async def call() -> dict:
+                with timed(recorder, "prepare"):
+                    payload = await _offload(
+                        executor,
+                        _serialize_payload,
+                        doc_base64,
+                        doc_type,
+                        schema,
+                        model,
+                    )
+                return await self._post(
+                    endpoint,
+                    timeout,
+                    lambda: self._request(payload),
+                    recorder=recorder,
+                )
+
+            return await self._once(key, call, recorder)
+
+    def _instrumentation(self) -> Instrumentation | None:
+        return self.instrumentation or get_instrumentation()
+
+    def _offload_to(self, size: int | None) -> Executor | None:
+        """Return the executor for work on ``size`` bytes, ``None`` for inline."""
+        threshold = self.offload_threshold
+        if threshold is None or (size is not None and size < threshold):
+            return None
+        return self.executor or _default_offload_executor()
+
+    async def _once(
+        self,
+        key: str | None,
+        call: Callable[[], Awaitable[dict]],
+        recorder: Recorder | None = None,
+    ) -> dict:
+        """Answer from the cache, join an identical call in flight, or run it."""
+        if key is None:
+            return await call()
+        # Only in-memory lookups are cheap enough for the event loop.
+        cache_executor = (
+            None if isinstance(self.cache, MemoryCache) else self._offload_to(None)
+        )
+        if self.cache is not None:
+            cached = await _offload(cache_executor, self.cache.get, key)
+            if cached is not None:
+                if recorder is not None:
+                    recorder.ctx.cache_hit = True
+                return cached
+        ran = False
+
+        async def fetch() -> dict:
+            nonlocal ran
+            ran = True
+            result = await call()
+            if self.cache is not None:
+                await _offload(cache_executor, self.cache.set, key, result)
+            return result
+
+        if self._flights is None:
+            return await fetch()
+        result = await self._flights.do(key, fetch)
+        if recorder is not None and not ran:
+            recorder.ctx.shared = True
+        return result
+
+    async def _post(
+        self,
+        endpoint: str | None,
+        timeout: float | None,
+        build_request: Callable[[], dict[str, Any]],
+        json_fallback: Callable[[], Callable[[], dict[str, Any]]] | None = None,
+        replayable: bool = True,
+        hedgeable: bool = True,
+        parse: Callable[[bytes], Any] = serialization.loads,
+        recorder: Recorder | None = None,
+    ) -> Any:
+        """POST with retries and optional hedging.  See :meth:`KIEClient._post`."""
+        endpoint = endpoint or self.endpoint or get_endpoint()
+        timeout = self.timeout if timeout is None else timeout
+        retry = self.retry if replayable else NO_RETRY
+        hedged = self.hedge is not None and replayable and hedgeable
+
+        def sender(
+            build: Callable[[], dict[str, Any]],
+        ) -> Callable[[float], Awaitable[httpx.Response]]:
+            async def send(attempt_timeout: float) -> httpx.Response:
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.aacquire()
+                limiter = self.concurrency_limiter
+                slot: AbstractAsyncContextManager = (
+                    limiter.aslot() if limiter else nullcontext()
+                )
+                async with slot:
+                    if recorder is None:
+                        response = await self._http.post(
+                            endpoint, timeout=attempt_timeout, **build()
+                        )
+                        response.raise_for_status()
+                        return response
+                    trace = recorder.attempt()
+                    try:
+                        response = await self._http.post(
+                            endpoint,
+                            timeout=attempt_timeout,
+                            extensions={"trace": trace.atrace},
+                            **build(),
+                        )
+                        response.raise_for_status()
+                    except Exception as e:
+                        trace.finish(_error_response(e), e)
+                        raise
+                    trace.finish(response)
+                    return response
+
+            async def attempt(attempt_timeout: float) -> httpx.Response:
+                delay = self.hedge.current_delay()
+                started = time.monotonic()
+                if delay is None:
+                    response = await send(attempt_timeout)
+                else:
+                    response = await ahedged_call(lambda: send(attempt_timeout), delay)
+                self.hedge.record(time.monotonic() - started)
+                return response
+
+            return attempt if hedged else send
+
+        with _api_errors(endpoint, timeout):
+            try:
+                response = await acall_with_retry(
+                    retry, sender(build_request), timeout
+                )
+            except httpx.HTTPStatusError as e:
+                if json_fallback is None or not _rejects_multipart(e.response):
+                    raise
+                response = await acall_with_retry(
+                    retry, sender(json_fallback()), timeout
+                )
+                self._multipart_rejected = True
+            with timed(recorder, "parse"):
+                return parse(response.content)
+
+    def _request(self, body: _SplicedPayload | bytes) -> dict[str, Any]:
+        if isinstance(body, _SplicedPayload):
+            executor = self._offload_to(body.content_length) if body.blocking else None
+            return {"content": body.aiter_bytes(executor), "headers": body.headers}
+        return {"content": body, "headers": JSON_HEADERS}
+
+    async def extract_document(
+        self,
+        document_path: DocumentInput,
+        schema: dict | str,
+        *,
+        model: str | None = None,
+        endpoint: str | None = None,
+        timeout: float | None = None,
+        pages: PageSelection | None = None,
+    ) -> dict:
+        """Encode a document and extract fields.  See :func:`extract_document`."""
+        return await self._extract_document(
+            document_path, compile_schema(schema), model, endpoint, timeout, pages
+        )
+
+    async def extract_typed(
+        self,
+        document_path: DocumentInput,
+        schema: dict | str,
+        *,
+        backend: str | None = None,
+        model: str | None = None,
+        endpoint: str | None = None,
+        timeout: float | None = None,
+        pages: PageSelection | None = None,
+    ) -> TypedResult:
+        """Extract fields as typed values.  See :func:`extract_typed`."""
+        decoder = compile_decoder(schema, backend=backend)
+        return await self._extract_document(
+            document_path,
+            decoder.schema,
+            model,
+            endpoint,
+            timeout,
+            pages,
+            decode=decoder.decode,
+        )
+
+    async def _extract_document(
+        self,
+        document_path: DocumentInput,
+        schema: CompiledSchema,
+        model: str | None,
+        endpoint: str | None,
+        timeout: float | None,
+        pages: PageSelection | None,
+        decode: Callable[[bytes | dict], Any] | None = None,
+    ) -> Any:
+        """Run an extraction.  See :meth:`KIEClient._extract_document`."""
+        operation = "extract_document" if decode is None else "extract_typed"
+        decode_body = decode is not None and self.cache is None
+        with record_extraction(self._instrumentation(), operation) as recorder:
+            if pages is not None:
+                with timed(recorder, "pages"):
+                    document_path = await _offload(
+                        self._offload_to(None), select_pages, document_path, pages
+                    )
+            executor = self._offload_to(_document_size(document_path))
+            digest = None
+            if _keyed(self):
+                with timed(recorder, "hash"):
+                    digest = await _offload(executor, _document_digest, document_path)
+            key = _extraction_key(self, lambda: digest, schema, model)
+            if decode_body and key is not None:
+                key += ":typed"
+
+            async def call() -> Any:
+                document, prepare_in = document_path, executor
+                if self.preprocessor is not None:
+                    with timed(recorder, "preprocess"):
+                        document = await self.preprocessor.aprocess_document(document)
+                    prepare_in = self._offload_to(_document_size(document))
+                with timed(recorder, "prepare"):
+                    requests = await _offload(
+                        prepare_in, _upload_requests, self, document, schema, model
+                    )
+                return await self._post(
+                    endpoint,
+                    timeout,
+                    *requests,
+                    parse=decode if decode_body else serialization.loads,
+                    recorder=recorder,
+                )
+
+            result = await self._once(key, call, recorder)
+            if decode is not None and not decode_body:
+                with timed(recorder, "parse"):
+                    result = decode(result)
+            return result
+
+
+async def _offload(
+    executor: Executor | None, func: Callable[..., Any], *args: Any
+) -> Any:
+    """Call ``func(*args)`` in ``executor``, or inline if it is ``None``."""
+    if executor is None:
+        return func(*args)
+    return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+
+
+def _upload_requests(
+    client: KIEClient | AsyncKIEClient,
+    document: DocumentInput,
+    schema: dict,
+    model: str | None,
+) -> tuple[
+    Callable[[], dict[str, Any]],
+    Callable[[], Callable[[], dict[str, Any]]] | None,
+    bool,
+    bool,
+]:
+    """Return the ``_post`` arguments for a document and the client's upload mode.
+
+    That is ``build_request``, the JSON fallback for multipart uploads,
+    whether the body can be sent more than once, and whether it can be
+    hedged.
+    """
+    multipart = client.upload == "multipart" and not client._multipart_rejected
+    if _is_stream(document):
+        if hasattr(document, "__aiter__") and not isinstance(client, AsyncKIEClient):
+            raise TypeError("Async iterators are only supported by AsyncKIEClient")
+        body = _StreamPayload(document, schema, model, multipart=multipart)
+        stream_fallback = None
+        if multipart and body.replayable:
+
+            def stream_fallback() -> Callable[[], dict[str, Any]]:
+                document.seek(body.start)
+                json_body = _StreamPayload(document, schema, model)
+                return lambda: client._request(json_body)
+
+        return (
+            lambda: client._request(body),
+            stream_fallback,
+            body.replayable,
+            body.hedgeable,
+        )
+
+    def json_request() -> Callable[[], dict[str, Any]]:
+        body = _json_body(document, schema, model, client.stream_threshold)
+        return lambda: client._request(body)
+
+    if multipart:
+        body = _MultipartPayload(document, schema, model)
+        return lambda: client._request(body), json_request, True, True
+    return json_request(), None, True, True
+
+
+# ── shared default clients ────────────────────────────────────────────
+
+_default_client: KIEClient | None = None
+_default_client_lock = threading.Lock()
+_default_cache: ResultCache | None = None
+_default_async_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, AsyncKIEClient
+] = weakref.WeakKeyDictionary()
+
+
+def _default_client_options() -> dict[str, Any]:
+    return {
+        "cache": _default_cache,
+        "upload": os.environ.get("KIE_UPLOAD", "json"),
+        "rate_limiter": ratelimit.get_default_rate_limiter(),
+        "concurrency_limiter": ratelimit.get_default_concurrency_limiter(),
+    }
+
+
+def get_default_client() -> KIEClient:
+    """Return the process-wide pooled :class:`KIEClient`, creating it lazily."""
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None or _default_client.is_closed:
+            _default_client = KIEClient(**_default_client_options())
+        return _default_client
+
+
+def get_default_async_client() -> AsyncKIEClient:
+    """Return the pooled :class:`AsyncKIEClient` for the running event loop.
+
+    Connection pools cannot be shared across event loops, so one client is
+    kept per loop and dropped when the loop is garbage-collected.
+    """
+    loop = asyncio.get_running_loop()
+    client = _default_async_clients.get(loop)
+    if client is None or client.is_closed:
+        client = AsyncKIEClient(
+            **_default_client_options(),
+            offload_threshold=int(
+                os.environ.get("KIE_OFFLOAD_THRESHOLD", DEFAULT_OFFLOAD_THRESHOLD)
+            ),
+        )
+        _default_async_clients[loop] = client
+    return client
+
+
+def set_default_cache(cache: ResultCache | None) -> None:
+    """Enable (or with ``None``, disable) result caching for the shared clients.
+
+    Affects the module-level :func:`extract` / :func:`extract_document`
+    functions and their async twins, including already-created clients.
+    """
+    global _default_cache
+    with _default_client_lock:
+        _default_cache = cache
+        if _default_client is not None:
+            _default_client.cache = cache
+        for client in list(_default_async_clients.values()):
+            client.cache = cache
+
+
+def set_default_limiters(
+    rate_limiter: TokenBucket | None = None,
+    concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+) -> None:
+    """Set the rate and concurrency limiters shared by the default clients.
+
+    Every integration in the process (MCP server, LangChain tool, OpenAI
+    handler) goes through the default clients, so they all draw from this
+    one budget.  Overrides ``$KIE_RATE_LIMIT`` / ``$KIE_MAX_CONCURRENCY``;
+    pass ``None`` to remove a limiter.
+    """
+    with _default_client_lock:
+        ratelimit._set_defaults(rate_limiter, concurrency_limiter)
+        clients = [_default_client, *_default_async_clients.values()]
+        for client in clients:
+            if client is not None:
+                client.rate_limiter = rate_limiter
+                client.concurrency_limiter = concurrency_limiter
+
+
+@atexit.register
+def _close_default_client() -> None:
+    if _default_client is not None:
+        _default_client.close()
+
+
 # ── low-level ─────────────────────────────────────────────────────────
 
 
@@ -63,27 +1585,12 @@ def extract(
         Extracted field values as a dict.
 
     Raises:
+        ValueError: If the schema is invalid.
         RuntimeError: If the API request fails.
     """
-    endpoint = endpoint or get_endpoint()
-    payload = _build_payload(doc_base64, doc_type, schema, model)
-
-    try:
-        with httpx.Client(timeout=timeout) as client:
-            response = client.post(endpoint, json=payload)
-            response.raise_for_status()
-            return response.json()
-    except httpx.HTTPStatusError as e:
-        body = e.response.text
-        raise RuntimeError(
-            f"API request failed ({e.response.status_code}): {body}"
-        ) from e
-    except httpx.ConnectError as e:
-        raise RuntimeError(f"Could not reach endpoint {endpoint}: {e}") from e
-    except httpx.TimeoutException as e:
-        raise RuntimeError(
-            f"Request to {endpoint} timed out after {timeout}s"
-        ) from e
+    return get_default_client().extract(
+        doc_base64, doc_type, schema, model=model, endpoint=endpoint, timeout=timeout
+    )
 
 
 async def extract_async(
@@ -99,73 +1606,142 @@ async def extract_async(
 
     Same parameters and semantics as :func:`extract`.
     """
-    endpoint = endpoint or get_endpoint()
-    payload = _build_payload(doc_base64, doc_type, schema, model)
-
-    try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(endpoint, json=payload)
-            response.raise_for_status()
-            return response.json()
-    except httpx.HTTPStatusError as e:
-        body = e.response.text
-        raise RuntimeError(
-            f"API request failed ({e.response.status_code}): {body}"
-        ) from e
-    except httpx.ConnectError as e:
-        raise RuntimeError(f"Could not reach endpoint {endpoint}: {e}") from e
-    except httpx.TimeoutException as e:
-        raise RuntimeError(
-            f"Request to {endpoint} timed out after {timeout}s"
-        ) from e
+    return await get_default_async_client().extract(
+        doc_base64, doc_type, schema, model=model, endpoint=endpoint, timeout=timeout
+    )
 
 
 # ── high-level convenience ────────────────────────────────────────────
 
 
 def extract_document(
-    document_path: str,
+    document_path: DocumentInput,
     schema: dict | str,
     *,
     model: str | None = None,
     endpoint: str | None = None,
     timeout: float = DEFAULT_TIMEOUT,
+    pages: PageSelection | None = None,
 ) -> dict:
     """Encode a document and extract fields in one call (sync).
 
     Args:
-        document_path: Path to the document file.
+        document_path: Path to the document file, or a
+            :class:`~kie_core.document.PreparedDocument` to skip re-reading
+            and re-encoding it.  Documents that are not on disk can be
+            passed as ``bytes``/``memoryview``, a binary file object, or
+            (async only) an async iterator of byte chunks; these are
+            streamed straight into the request.  Non-seekable streams are
+            sent once, without retries, and bypass the result cache.
         schema: JSON schema as a dict, JSON string, or path to a ``.json`` file.
+            It is validated before anything is uploaded; see
+            :func:`~kie_core.schema.compile_schema`.
         model: Optional model ID for extraction.
         endpoint: API endpoint URL.
         timeout: Request timeout in seconds.
+        pages: Upload only these pages of a PDF: a range string such as
+            ``"1-2,5"``, 1-based page numbers, or a predicate
+            ``(page_number, page) -> bool``.  Requires the ``pdf`` extra.
 
     Returns:
         Extracted field values as a dict.
     """
-    if isinstance(schema, str):
-        schema = load_schema(schema)
-    doc_base64, doc_type = encode_document(document_path)
-    return extract(
-        doc_base64, doc_type, schema, model=model, endpoint=endpoint, timeout=timeout
+    return get_default_client().extract_document(
+        document_path,
+        schema,
+        model=model,
+        endpoint=endpoint,
+        timeout=timeout,
+        pages=pages,
     )
 
 
 async def extract_document_async(
-    document_path: str,
+    document_path: DocumentInput,
     schema: dict | str,
     *,
     model: str | None = None,
     endpoint: str | None = None,
     timeout: float = DEFAULT_TIMEOUT,
+    pages: PageSelection | None = None,
 ) -> dict:
     """Encode a document and extract fields in one call (async).
 
     Same parameters and semantics as :func:`extract_document`.
     """
-    if isinstance(schema, str):
-        schema = load_schema(schema)
-    doc_base64, doc_type = encode_document(document_path)
-    return await extract_async(
-        doc_base64, doc_type, schema, model=model, endpoint=endpoint, timeout=timeout
+    return await get_default_async_client().extract_document(
+        document_path,
+        schema,
+        model=model,
+        endpoint=endpoint,
+        timeout=timeout,
+        pages=pages,
+    )
+
+
+def extract_typed(
+    document_path: DocumentInput,
+    schema: dict | str,
+    *,
+    backend: str | None = None,
+    model: str | None = None,
+    endpoint: str | None = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    pages: PageSelection | None = None,
+) -> TypedResult:
+    """Extract fields and decode them against the schema (sync).
+
+    The response body is parsed straight into typed values by a decoder
+    compiled once per schema (see :class:`~kie_core.typed.ResultDecoder`):
+    numbers and currency become ``float``, dates such as
+    ``"date (MM/DD/YYYY)"`` become ``datetime.date``, and missing or
+    unconvertible fields are listed on the result.  With a result cache
+    configured, the cached plain result is decoded instead.
+
+    Args:
+        document_path: As for :func:`extract_document`.
+        schema: As for :func:`extract_document`.
+        backend: ``"msgspec"``, ``"pydantic"`` or ``"python"``; defaults to
+            the first one installed.
+        model: Optional model ID for extraction.
+        endpoint: API endpoint URL.
+        timeout: Request timeout in seconds.
+        pages: As for :func:`extract_document`.
+
+    Returns:
+        A :class:`~kie_core.typed.TypedResult`.
+    """
+    return get_default_client().extract_typed(
+        document_path,
+        schema,
+        backend=backend,
+        model=model,
+        endpoint=endpoint,
+        timeout=timeout,
+        pages=pages,
+    )
+
+
+async def extract_typed_async(
+    document_path: DocumentInput,
+    schema: dict | str,
+    *,
+    backend: str | None = None,
+    model: str | None = None,
+    endpoint: str | None = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    pages: PageSelection | None = None,
+) -> TypedResult:
+    """Extract fields and decode them against the schema (async).
+
+    Same parameters and semantics as :func:`extract_typed`.
+    """
+    return await get_default_async_client().extract_typed(
+        document_path,
+        schema,
+        backend=backend,
+        model=model,
+        endpoint=endpoint,
+        timeout=timeout,
+        pages=pages,
     )
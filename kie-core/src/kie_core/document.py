@@ -1,7 +1,98 @@
 """Document encoding utilities."""
 
 import base64
+import hashlib
+import io
+import json
+import mmap
+from contextlib import contextmanager
 from pathlib import Path
+from typing import AsyncIterable, BinaryIO, Iterator, Union
+
+# A multiple of 3 so that base64-encoded chunks concatenate without padding.
+DEFAULT_CHUNK_SIZE = 3 * 256 * 1024
+
+
+def sniff_document_type(head: bytes) -> str:
+    """Return ``"pdf"`` or ``"image"`` from the leading bytes of a document."""
+    return "pdf" if head.startswith(b"%PDF") else "image"
+
+
+def _open(document_path: str | Path) -> BinaryIO:
+    try:
+        return open(document_path, "rb")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Document not found: {document_path}") from None
+
+
+@contextmanager
+def _mapped(f: BinaryIO) -> Iterator[memoryview | None]:
+    """Memory-map an open file read-only; yields ``None`` if it cannot be.
+
+    Pipes, character devices, empty files and objects without a file
+    descriptor cannot be mapped.
+    """
+    try:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError, AttributeError, io.UnsupportedOperation):
+        yield None
+        return
+    view = memoryview(mm)
+    try:
+        yield view
+    finally:
+        view.release()
+        try:
+            mm.close()
+        except BufferError:
+            pass  # a caller still holds a slice; unmapped when it is collected
+
+
+@contextmanager
+def read_document(document_path: str | Path) -> Iterator[memoryview | bytes]:
+    """Give access to a document's full contents without copying if possible.
+
+    Regular files are memory-mapped and exposed as a read-only
+    ``memoryview``, so the OS pages them in on demand instead of the whole
+    file being copied onto the heap.  Sources that cannot be mapped (pipes,
+    devices, empty files) are read into ``bytes``.  The view is only valid
+    inside the ``with`` block.
+
+    Raises:
+        FileNotFoundError: If the document does not exist.
+    """
+    with _open(document_path) as f, _mapped(f) as view:
+        yield view if view is not None else f.read()
+
+
+def iter_chunks(
+    document: str | Path | BinaryIO,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[memoryview | bytes]:
+    """Yield a document's raw bytes in pieces of at most ``chunk_size``.
+
+    Paths to regular files yield ``memoryview`` slices of a memory map;
+    other paths and binary file objects are read with ``read()``.  Each
+    chunk is only valid until the next one is requested.
+
+    Raises:
+        FileNotFoundError: If the document path does not exist.
+    """
+    if hasattr(document, "read"):
+        while chunk := document.read(chunk_size):
+            yield chunk
+        return
+    with _open(document) as f, _mapped(f) as view:
+        if view is None:
+            while chunk := f.read(chunk_size):
+                yield chunk
+            return
+        for start in range(0, len(view), chunk_size):
+            chunk = view[start : start + chunk_size]
+            try:
+                yield chunk
+            finally:
+                chunk.release()
 
 
 def encode_document(document_path: str | Path) -> tuple[str, str]:
@@ -16,12 +107,171 @@ def encode_document(document_path: str | Path) -> tuple[str, str]:
     Raises:
         FileNotFoundError: If the document does not exist.
     """
-    path = Path(document_path)
-    if not path.exists():
-        raise FileNotFoundError(f"Document not found: {document_path}")
-
-    doc_bytes = path.read_bytes()
-    doc_base64 = base64.b64encode(doc_bytes).decode("ascii")
-    doc_type = "pdf" if doc_bytes.startswith(b"%PDF") else "image"
+    with read_document(document_path) as data:
+        doc_base64 = base64.b64encode(data).decode("ascii")
+        doc_type = sniff_document_type(bytes(data[:4]))
 
     return doc_base64, doc_type
+
+
+def base64_length(size: int) -> int:
+    """Return the length of the base64 encoding of ``size`` raw bytes."""
+    return 4 * ((size + 2) // 3)
+
+
+def iter_base64(
+    document: str | Path | BinaryIO,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """Yield the base64 encoding of a document in fixed-size pieces.
+
+    Only one chunk of the file is held in memory at a time, so peak memory
+    is independent of the document size.  Regular files are encoded
+    straight from a memory map.
+
+    Args:
+        document: Path to the document file, or a binary file object.
+        chunk_size: Raw bytes read per iteration; rounded down to a multiple
+            of 3 (minimum 3).
+
+    Yields:
+        Base64-encoded ASCII bytes.  Concatenated, they equal
+        ``base64.b64encode(path.read_bytes())``.
+
+    Raises:
+        FileNotFoundError: If the document does not exist.
+    """
+    chunk_size = max(3, chunk_size - chunk_size % 3)
+    encoder = Base64Encoder()
+    for chunk in iter_chunks(document, chunk_size):
+        if encoded := encoder.update(chunk):
+            yield encoded
+    if encoded := encoder.finish():
+        yield encoded
+
+
+class Base64Encoder:
+    """Incremental base64 encoder for chunks of arbitrary size.
+
+    Bytes that do not fill a 3-byte group are carried over to the next
+    chunk, so the concatenated output equals a one-shot encoding.
+    """
+
+    def __init__(self) -> None:
+        self._carry = b""
+
+    def update(self, chunk: bytes | memoryview) -> bytes:
+        """Encode ``chunk``; returns what can be emitted so far (may be empty)."""
+        if not self._carry and len(chunk) % 3 == 0:
+            return base64.b64encode(chunk)
+        chunk = self._carry + chunk
+        cut = len(chunk) - len(chunk) % 3
+        self._carry = chunk[cut:]
+        return base64.b64encode(chunk[:cut])
+
+    def finish(self) -> bytes:
+        """Encode the remaining carried-over bytes, with padding."""
+        carry, self._carry = self._carry, b""
+        return base64.b64encode(carry)
+
+
+def detect_document_type(document_path: str | Path) -> str:
+    """Sniff a document's type from its first bytes without reading it all.
+
+    Raises:
+        FileNotFoundError: If the document does not exist.
+    """
+    with _open(document_path) as f:
+        return sniff_document_type(f.read(4))
+
+
+def hash_document(
+    document: str | Path | BinaryIO,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> str:
+    """Return the SHA-256 hex digest of a document, reading it in chunks.
+
+    Args:
+        document: Path to the document file, or a binary file object.
+        chunk_size: Bytes hashed per iteration.
+
+    Raises:
+        FileNotFoundError: If the document does not exist.
+    """
+    digest = hashlib.sha256()
+    for chunk in iter_chunks(document, chunk_size):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+class PreparedDocument:
+    """A document read, hashed, and base64-encoded once for repeated use.
+
+    Besides the encoding, the JSON value of the request's ``"document"`` key
+    is serialized up front, so each extraction only has to serialize its
+    schema.  Create one with :func:`prepare_document` and pass it wherever a
+    document path is accepted.
+
+    Args:
+        data: Raw document bytes (any bytes-like object; not retained).
+        doc_type: ``"pdf"`` or ``"image"``; sniffed from ``data`` if omitted.
+    """
+
+    def __init__(
+        self, data: bytes | memoryview, doc_type: str | None = None
+    ) -> None:
+        self.doc_type = doc_type or sniff_document_type(bytes(data[:4]))
+        self.digest = hashlib.sha256(data).hexdigest()
+        self.size = len(data)
+        self.content = base64.b64encode(data)
+        # The "document" JSON value in pieces, so the (large) encoded
+        # content is never copied into a joined buffer.
+        self.fragments = (
+            b'{"content":"',
+            self.content,
+            f'","type":{json.dumps(self.doc_type)}}}'.encode(),
+        )
+
+    def __repr__(self) -> str:
+        return f"PreparedDocument(doc_type={self.doc_type!r}, size={self.size})"
+
+    @property
+    def document_json(self) -> bytes:
+        """The serialized ``"document"`` value, joined (this copies it)."""
+        return b"".join(self.fragments)
+
+    @property
+    def doc_base64(self) -> str:
+        """The base64-encoded document as a string, as taken by ``extract``."""
+        return self.content.decode("ascii")
+
+
+# Everything ``extract_document`` accepts as a document.
+DocumentInput = Union[
+    str,
+    Path,
+    PreparedDocument,
+    bytes,
+    bytearray,
+    memoryview,
+    BinaryIO,
+    AsyncIterable[bytes],
+]
+
+BUFFER_TYPES = (bytes, bytearray, memoryview)
+
+
+def prepare_document(document_path: str | Path) -> PreparedDocument:
+    """Read and encode a document once for extraction with several schemas.
+
+    Args:
+        document_path: Path to the document file.
+
+    Returns:
+        A :class:`PreparedDocument`.
+
+    Raises:
+        FileNotFoundError: If the document does not exist.
+    """
+    with read_document(document_path) as data:
+        return PreparedDocument(data)
@@ -0,0 +1,244 @@
+"""Optional image downscaling and recompression before upload."""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import threading
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Callable
+
+from kie_core.document import BUFFER_TYPES, DocumentInput, sniff_document_type
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # pragma: no cover — optional extra
+    Image = ImageOps = None
+
+FORMATS = ("JPEG", "WEBP")
+ORIENTATION = 0x0112  # EXIF tag
+
+
+@dataclass
+class PreprocessResult:
+    """Outcome of preprocessing one image.
+
+    Attributes:
+        data: Bytes to upload (the original if re-encoding did not help).
+        original_size: Size of the input in bytes.
+        size: Size of ``data`` in bytes.
+        reencoded: Whether ``data`` is the re-encoded image.
+    """
+
+    data: bytes
+    original_size: int
+    size: int
+    reencoded: bool
+
+    @property
+    def bytes_saved(self) -> int:
+        """Bytes not uploaded thanks to preprocessing."""
+        return self.original_size - self.size
+
+
+@dataclass
+class PreprocessStats:
+    """Running totals for an :class:`ImagePreprocessor`."""
+
+    documents: int = 0
+    original_bytes: int = 0
+    uploaded_bytes: int = 0
+
+    @property
+    def bytes_saved(self) -> int:
+        """Total bytes not uploaded thanks to preprocessing."""
+        return self.original_bytes - self.uploaded_bytes
+
+
+def _preprocess(
+    source: str | bytes,
+    max_dimension: int | None,
+    grayscale: bool,
+    image_format: str,
+    quality: int,
+    strip_exif: bool,
+) -> PreprocessResult:
+    """Downscale and re-encode one image.  Module-level so it can be pickled.
+
+    Images Pillow cannot decode, and multi-frame images (multi-page TIFF,
+    animated GIF or WebP) whose re-encoding would keep only the first frame,
+    are returned unchanged, for the server to handle.
+    """
+    if isinstance(source, str):
+        source = Path(source).read_bytes()
+    original_size = len(source)
+    try:
+        data = _reencode(
+            source, max_dimension, grayscale, image_format, quality, strip_exif
+        )
+    except (OSError, Image.DecompressionBombError):  # undecodable or truncated
+        data = None
+    if data is None or len(data) >= original_size:
+        return PreprocessResult(source, original_size, original_size, False)
+    return PreprocessResult(data, original_size, len(data), True)
+
+
+def _reencode(
+    source: bytes,
+    max_dimension: int | None,
+    grayscale: bool,
+    image_format: str,
+    quality: int,
+    strip_exif: bool,
+) -> bytes | None:
+    """Return the re-encoded image, or ``None`` if it has several frames."""
+    with Image.open(io.BytesIO(source)) as img:
+        if getattr(img, "n_frames", 1) > 1:
+            return None
+        # Bake the EXIF orientation into the pixels, and keep only the EXIF
+        # of the rotated image, whose Orientation tag no longer applies.
+        img = ImageOps.exif_transpose(img)
+        exif = img.getexif()
+        exif.pop(ORIENTATION, None)
+        if max_dimension and max(img.size) > max_dimension:
+            img.thumbnail((max_dimension, max_dimension), Image.Resampling.LANCZOS)
+        if grayscale:
+            img = img.convert("L")
+        elif image_format == "JPEG" and img.mode not in ("RGB", "L"):
+            img = img.convert("RGB")
+        elif img.mode not in ("RGB", "RGBA", "L"):
+            img = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+        save_options = {"quality": quality}
+        if exif and not strip_exif:
+            save_options["exif"] = exif.tobytes()
+        out = io.BytesIO()
+        img.save(out, format=image_format, **save_options)
+    return out.getvalue()
+
+
+class ImagePreprocessor:
+    """Shrink images before upload: cap dimensions, recompress, strip EXIF.
+
+    Requires the ``image`` extra (Pillow).  Pass an instance to
+    :class:`~kie_core.client.KIEClient` / :class:`~kie_core.client.AsyncKIEClient`
+    to apply it to every image document; PDFs, prepared documents and
+    streams are uploaded untouched.  The async client runs the work in
+    ``executor`` (or the event loop's default thread pool) so it never
+    blocks the loop.  If the re-encoded image is not smaller than the
+    original, the original is uploaded; so are multi-frame images such as
+    multi-page TIFF scans, which JPEG and WebP would cut to their first page.
+
+    Args:
+        max_dimension: Longest side in pixels after downscaling; ``None``
+            keeps the original resolution.
+        grayscale: Convert to grayscale (fine for most printed documents).
+        format: Output format, ``"JPEG"`` or ``"WEBP"``.
+        quality: Encoder quality (1–100).
+        strip_exif: Drop EXIF metadata (orientation is applied first).
+        executor: Thread or process pool for the async path.  Process pools
+            avoid GIL contention when many large images are processed.
+        on_result: Called with each :class:`PreprocessResult`, e.g. to
+            report bytes saved per document.
+    """
+
+    def __init__(
+        self,
+        max_dimension: int | None = 2048,
+        *,
+        grayscale: bool = False,
+        format: str = "JPEG",  # noqa: A002
+        quality: int = 85,
+        strip_exif: bool = True,
+        executor: Executor | None = None,
+        on_result: Callable[[PreprocessResult], None] | None = None,
+    ) -> None:
+        if Image is None:
+            raise RuntimeError(
+                "Pillow is not installed (install the kie-core[image] extra)"
+            )
+        image_format = format.upper()
+        if image_format not in FORMATS:
+            raise ValueError(f"format must be one of {FORMATS}, got {format!r}")
+        if not 1 <= quality <= 100:
+            raise ValueError("quality must be between 1 and 100")
+        self.max_dimension = max_dimension
+        self.grayscale = grayscale
+        self.format = image_format
+        self.quality = quality
+        self.strip_exif = strip_exif
+        self.executor = executor
+        self.on_result = on_result
+        self.stats = PreprocessStats()
+        self._stats_lock = threading.Lock()
+
+    def _task(self, source: str | bytes) -> Callable[[], PreprocessResult]:
+        return partial(
+            _preprocess,
+            source,
+            self.max_dimension,
+            self.grayscale,
+            self.format,
+            self.quality,
+            self.strip_exif,
+        )
+
+    def _record(self, result: PreprocessResult) -> None:
+        with self._stats_lock:
+            self.stats.documents += 1
+            self.stats.original_bytes += result.original_size
+            self.stats.uploaded_bytes += result.size
+        if self.on_result is not None:
+            self.on_result(result)
+
+    def process(self, data: bytes | memoryview) -> PreprocessResult:
+        """Preprocess one image given as bytes (synchronously)."""
+        result = self._task(bytes(data))()
+        self._record(result)
+        return result
+
+    async def aprocess(self, data: bytes | memoryview) -> PreprocessResult:
+        """Preprocess one image in :attr:`executor` without blocking the loop."""
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(self.executor, self._task(bytes(data)))
+        self._record(result)
+        return result
+
+    def process_document(self, document: DocumentInput) -> DocumentInput:
+        """Return the bytes to upload for ``document``, or it unchanged.
+
+        Only image files and in-memory images are processed.
+        """
+        source = _image_source(document)
+        if source is None:
+            return document
+        result = self._task(source)()
+        self._record(result)
+        return result.data
+
+    async def aprocess_document(self, document: DocumentInput) -> DocumentInput:
+        """Async counterpart of :meth:`process_document`."""
+        source = _image_source(document)
+        if source is None:
+            return document
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(self.executor, self._task(source))
+        self._record(result)
+        return result.data
+
+
+def _image_source(document: DocumentInput) -> str | bytes | None:
+    """Return a picklable source for image documents, else ``None``."""
+    if isinstance(document, BUFFER_TYPES):
+        head = bytes(memoryview(document)[:4])
+        return bytes(document) if sniff_document_type(head) == "image" else None
+    if isinstance(document, (str, Path)):
+        try:
+            with open(document, "rb") as f:
+                head = f.read(4)
+        except FileNotFoundError:
+            return None  # the upload path raises the usual error
+        return str(document) if sniff_document_type(head) == "image" else None
+    return None
@@ -0,0 +1,632 @@
+"""Instrumentation hooks for extraction timings, sizes, retries and cache hits."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+
+try:
+    import prometheus_client
+except ImportError:  # pragma: no cover — optional extra
+    prometheus_client = None
+
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:  # pragma: no cover — optional extra
+    otel_trace = None
+
+T = TypeVar("T")
+
+# Phases of an extraction, in the order they happen.  The transport phases
+# come from httpx's ``trace`` extension and are recorded per attempt; they
+# are missing with transports that do not report them (e.g. mocks).
+PHASES = (
+    "pages",  # slicing selected PDF pages
+    "hash",  # hashing the document for the cache / single-flight key
+    "preprocess",  # image preprocessing
+    "prepare",  # building the request body (in-memory documents are encoded)
+    "connect",  # waiting for a pooled connection, TCP and TLS
+    "upload",  # sending the request; streamed documents are read and encoded
+    "server",  # from the end of the upload to the response headers
+    "download",  # receiving the response body
+    "parse",  # decoding the response
+)
+
+DEFAULT_SIZE_BUCKETS = tuple(4**n * 1024 for n in range(1, 10))  # 4 KiB - 256 MiB
+
+_integration: ContextVar[str] = ContextVar("kie_integration", default="core")
+
+
+@contextmanager
+def integration_scope(name: str) -> Iterator[None]:
+    """Label the extractions made inside the block with an integration name.
+
+    The MCP server, LangChain tool and OpenAI handler use ``"mcp"``,
+    ``"langchain"`` and ``"openai"``; calls made directly are ``"core"``.
+    The label follows the context into threads started with
+    ``contextvars.copy_context`` and into asyncio tasks.
+    """
+    token = _integration.set(name)
+    try:
+        yield
+    finally:
+        _integration.reset(token)
+
+
+def current_integration() -> str:
+    """Return the integration label in effect (``"core"`` by default)."""
+    return _integration.get()
+
+
+@dataclass
+class ExtractionContext:
+    """What happened during one extraction call; passed to every hook.
+
+    Attributes:
+        operation: ``"extract"``, ``"extract_document"`` or
+            ``"extract_typed"``.
+        integration: Label set by :func:`integration_scope`.
+        started: Wall-clock start, seconds since the epoch.
+        phases: Seconds spent in each phase (see :data:`PHASES`), summed
+            over attempts.
+        attempts: HTTP attempts made, including retries and hedges.
+        request_bytes: Size of the last request body, if known.
+        response_bytes: Size of the last response body.
+        status: HTTP status of the last response.
+        cache_hit: Answered from the result cache.
+        shared: Joined an identical extraction already in flight.
+        error: The exception the call raised, if any.
+        duration: Total seconds, set when the call finishes.
+        state: Scratch space for instrumentations (e.g. the current span).
+    """
+
+    operation: str
+    integration: str = "core"
+    started: float = field(default_factory=time.time)
+    phases: dict[str, float] = field(default_factory=dict)
+    attempts: int = 0
+    request_bytes: int | None = None
+    response_bytes: int | None = None
+    status: int | None = None
+    cache_hit: bool = False
+    shared: bool = False
+    error: BaseException | None = None
+    duration: float | None = None
+    state: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def retries(self) -> int:
+        """Attempts beyond the first."""
+        return max(0, self.attempts - 1)
+
+    @property
+    def outcome(self) -> str:
+        """``"cache_hit"``, ``"shared"``, ``"error"`` or ``"ok"``."""
+        if self.error is not None:
+            return "error"
+        if self.cache_hit:
+            return "cache_hit"
+        if self.shared:
+            return "shared"
+        return "ok"
+
+
+class Instrumentation:
+    """Receives extraction events; the base class ignores them all.
+
+    Subclass and override the hooks you need.  Hooks run inline on the
+    calling thread or event loop, so keep them cheap; an exception raised
+    by a hook propagates to the caller.
+    """
+
+    def extraction_started(self, ctx: ExtractionContext) -> None:
+        """An extraction call began."""
+
+    def phase_finished(
+        self, ctx: ExtractionContext, phase: str, start: float, duration: float
+    ) -> None:
+        """A phase ended; ``start`` is wall-clock seconds since the epoch."""
+
+    def attempt_finished(
+        self,
+        ctx: ExtractionContext,
+        attempt: int,
+        start: float,
+        duration: float,
+        status: int | None,
+        error: BaseException | None,
+    ) -> None:
+        """An HTTP attempt ended with a response ``status`` or an ``error``."""
+
+    def extraction_finished(self, ctx: ExtractionContext) -> None:
+        """An extraction call ended; ``ctx`` is complete."""
+
+
+class MultiInstrumentation(Instrumentation):
+    """Forwards every event to several instrumentations, in order."""
+
+    def __init__(self, instrumentations: Iterable[Instrumentation]) -> None:
+        self.instrumentations = list(instrumentations)
+
+    def extraction_started(self, ctx: ExtractionContext) -> None:
+        for instrumentation in self.instrumentations:
+            instrumentation.extraction_started(ctx)
+
+    def phase_finished(
+        self, ctx: ExtractionContext, phase: str, start: float, duration: float
+    ) -> None:
+        for instrumentation in self.instrumentations:
+            instrumentation.phase_finished(ctx, phase, start, duration)
+
+    def attempt_finished(
+        self,
+        ctx: ExtractionContext,
+        attempt: int,
+        start: float,
+        duration: float,
+        status: int | None,
+        error: BaseException | None,
+    ) -> None:
+        for instrumentation in self.instrumentations:
+            instrumentation.attempt_finished(
+                ctx, attempt, start, duration, status, error
+            )
+
+    def extraction_finished(self, ctx: ExtractionContext) -> None:
+        for instrumentation in self.instrumentations:
+            instrumentation.extraction_finished(ctx)
+
+
+class PrometheusInstrumentation(Instrumentation):
+    """Records extraction metrics in a Prometheus registry.
+
+    Metrics (prefixed with ``namespace``), all labelled by ``integration``:
+
+    - ``extractions_total{outcome}`` — ``ok``, ``error``, ``cache_hit``, ``shared``
+    - ``extraction_seconds`` — total call latency
+    - ``phase_seconds{phase}`` — time per phase
+    - ``attempts_total{status}`` — HTTP attempts by status (``error`` if none)
+    - ``retries_total`` — attempts beyond the first
+    - ``request_bytes`` / ``response_bytes`` — body sizes
+    - ``in_flight`` — extractions currently running
+
+    Args:
+        registry: Registry to register the metrics in.  Defaults to
+            ``prometheus_client.REGISTRY``.
+        namespace: Metric name prefix.
+
+    Raises:
+        RuntimeError: If prometheus_client is not installed.
+    """
+
+    def __init__(self, registry: Any = None, *, namespace: str = "kie") -> None:
+        if prometheus_client is None:
+            raise RuntimeError(
+                "prometheus_client is not installed "
+                "(install the kie-core[prometheus] extra)"
+            )
+        if registry is None:
+            registry = prometheus_client.REGISTRY
+        self.registry = registry
+        options = {"namespace": namespace, "registry": registry}
+        self.extractions = prometheus_client.Counter(
+            "extractions",
+            "Extraction calls by outcome.",
+            ["integration", "outcome"],
+            **options,
+        )
+        self.latency = prometheus_client.Histogram(
+            "extraction_seconds",
+            "Extraction call latency.",
+            ["integration"],
+            **options,
+        )
+        self.phases = prometheus_client.Histogram(
+            "phase_seconds",
+            "Time spent in each extraction phase.",
+            ["integration", "phase"],
+            **options,
+        )
+        self.attempts = prometheus_client.Counter(
+            "attempts",
+            "HTTP attempts by response status.",
+            ["integration", "status"],
+            **options,
+        )
+        self.retries = prometheus_client.Counter(
+            "retries", "HTTP attempts beyond the first.", ["integration"], **options
+        )
+        self.request_bytes = prometheus_client.Histogram(
+            "request_bytes",
+            "Request body size.",
+            ["integration"],
+            buckets=DEFAULT_SIZE_BUCKETS,
+            **options,
+        )
+        self.response_bytes = prometheus_client.Histogram(
+            "response_bytes",
+            "Response body size.",
+            ["integration"],
+            buckets=DEFAULT_SIZE_BUCKETS,
+            **options,
+        )
+        self.in_flight = prometheus_client.Gauge(
+            "in_flight",
+            "Extractions currently running.",
+            ["integration"],
+            multiprocess_mode="livesum",
+            **options,
+        )
+
+    def render(self) -> tuple[bytes, str]:
+        """Return the registry in the text exposition format, and its content type.
+
+        For serving a ``/metrics`` endpoint, as the MCP server does.
+        """
+        return (
+            prometheus_client.generate_latest(self.registry),
+            prometheus_client.CONTENT_TYPE_LATEST,
+        )
+
+    def extraction_started(self, ctx: ExtractionContext) -> None:
+        self.in_flight.labels(ctx.integration).inc()
+
+    def phase_finished(
+        self, ctx: ExtractionContext, phase: str, start: float, duration: float
+    ) -> None:
+        self.phases.labels(ctx.integration, phase).observe(duration)
+
+    def attempt_finished(
+        self,
+        ctx: ExtractionContext,
+        attempt: int,
+        start: float,
+        duration: float,
+        status: int | None,
+        error: BaseException | None,
+    ) -> None:
+        label = "error" if status is None else str(status)
+        self.attempts.labels(ctx.integration, label).inc()
+        if attempt > 1:
+            self.retries.labels(ctx.integration).inc()
+
+    def extraction_finished(self, ctx: ExtractionContext) -> None:
+        integration = ctx.integration
+        self.in_flight.labels(integration).dec()
+        self.extractions.labels(integration, ctx.outcome).inc()
+        if ctx.duration is not None:
+            self.latency.labels(integration).observe(ctx.duration)
+        if ctx.request_bytes is not None:
+            self.request_bytes.labels(integration).observe(ctx.request_bytes)
+        if ctx.response_bytes is not None:
+            self.response_bytes.labels(integration).observe(ctx.response_bytes)
+
+
+def _ns(seconds: float) -> int:
+    return int(seconds * 1e9)
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """Emits an OpenTelemetry span per extraction, with a child span per phase.
+
+    The extraction span (``kie.extract_document`` etc.) is a child of the
+    span current when the call starts.  Each attempt is recorded as a
+    ``kie.attempt`` event on it; sizes, attempts, cache hits and the
+    outcome are set as ``kie.*`` attributes when it ends.
+
+    Args:
+        tracer_provider: Provider to get the tracer from.  Defaults to the
+            global one.
+
+    Raises:
+        RuntimeError: If opentelemetry-api is not installed.
+    """
+
+    def __init__(self, tracer_provider: Any = None) -> None:
+        if otel_trace is None:
+            raise RuntimeError(
+                "opentelemetry-api is not installed "
+                "(install the kie-core[opentelemetry] extra)"
+            )
+        self.tracer = otel_trace.get_tracer("kie_core", tracer_provider=tracer_provider)
+
+    def extraction_started(self, ctx: ExtractionContext) -> None:
+        ctx.state["otel_span"] = self.tracer.start_span(
+            f"kie.{ctx.operation}",
+            kind=otel_trace.SpanKind.CLIENT,
+            start_time=_ns(ctx.started),
+            attributes={"kie.integration": ctx.integration},
+        )
+
+    def phase_finished(
+        self, ctx: ExtractionContext, phase: str, start: float, duration: float
+    ) -> None:
+        parent = ctx.state.get("otel_span")
+        if parent is None:
+            return
+        span = self.tracer.start_span(
+            f"kie.{phase}",
+            context=otel_trace.set_span_in_context(parent),
+            start_time=_ns(start),
+        )
+        span.end(end_time=_ns(start + duration))
+
+    def attempt_finished(
+        self,
+        ctx: ExtractionContext,
+        attempt: int,
+        start: float,
+        duration: float,
+        status: int | None,
+        error: BaseException | None,
+    ) -> None:
+        span = ctx.state.get("otel_span")
+        if span is None:
+            return
+        attributes: dict[str, Any] = {"kie.attempt": attempt, "kie.seconds": duration}
+        if status is not None:
+            attributes["http.response.status_code"] = status
+        if error is not None:
+            attributes["error.type"] = type(error).__name__
+        span.add_event("kie.attempt", attributes, timestamp=_ns(start + duration))
+
+    def extraction_finished(self, ctx: ExtractionContext) -> None:
+        span = ctx.state.pop("otel_span", None)
+        if span is None:
+            return
+        attributes: dict[str, Any] = {
+            "kie.outcome": ctx.outcome,
+            "kie.attempts": ctx.attempts,
+            "kie.cache_hit": ctx.cache_hit,
+            "kie.shared": ctx.shared,
+        }
+        if ctx.request_bytes is not None:
+            attributes["http.request.body.size"] = ctx.request_bytes
+        if ctx.response_bytes is not None:
+            attributes["http.response.body.size"] = ctx.response_bytes
+        if ctx.status is not None:
+            attributes["http.response.status_code"] = ctx.status
+        span.set_attributes(attributes)
+        if ctx.error is not None:
+            span.record_exception(ctx.error)
+            span.set_status(otel_trace.Status(otel_trace.StatusCode.ERROR))
+        end = ctx.started + (ctx.duration or 0.0)
+        span.end(end_time=_ns(end))
+
+
+# ── recording ─────────────────────────────────────────────────────────
+
+
+class Recorder:
+    """Feeds one extraction's events to an instrumentation.
+
+    Created by :func:`record_extraction`; the client reports phases and
+    attempts through it.
+    """
+
+    def __init__(self, instrumentation: Instrumentation, operation: str) -> None:
+        self.instrumentation = instrumentation
+        self.ctx = ExtractionContext(operation, _integration.get())
+        self._clock = time.perf_counter()
+
+    def phase(self, name: str, start: float, duration: float) -> None:
+        phases = self.ctx.phases
+        phases[name] = phases.get(name, 0.0) + duration
+        self.instrumentation.phase_finished(self.ctx, name, start, duration)
+
+    @contextmanager
+    def timed(self, name: str) -> Iterator[None]:
+        """Record the block as phase ``name``."""
+        start = time.time()
+        clock = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phase(name, start, time.perf_counter() - clock)
+
+    def attempt(self) -> _AttemptTrace:
+        self.ctx.attempts += 1
+        return _AttemptTrace(self, self.ctx.attempts)
+
+    def finish(self, error: BaseException | None) -> None:
+        self.ctx.error = error
+        self.ctx.duration = time.perf_counter() - self._clock
+        self.instrumentation.extraction_finished(self.ctx)
+
+
+# Transport events (without the ``http11.``/``http2.`` prefix) that end
+# the time before each transport phase; see :meth:`_AttemptTrace.finish`.
+_TRACE_MARKS = {
+    "send_request_headers.started": "sending",
+    "send_request_body.complete": "sent",
+    "receive_response_headers.complete": "headers",
+    "receive_response_body.complete": "body",
+}
+
+
+class _AttemptTrace:
+    """Times one HTTP attempt from httpx ``trace`` extension events."""
+
+    def __init__(self, recorder: Recorder, number: int) -> None:
+        self.recorder = recorder
+        self.number = number
+        self.start = time.time()
+        self.marks: dict[str, float] = {"start": time.perf_counter()}
+
+    def __call__(self, name: str, info: dict[str, Any]) -> None:
+        mark = _TRACE_MARKS.get(name.partition(".")[2])
+        if mark is not None:
+            self.marks[mark] = time.perf_counter()
+
+    async def atrace(self, name: str, info: dict[str, Any]) -> None:
+        self(name, info)
+
+    def finish(
+        self, response: Any = None, error: BaseException | None = None
+    ) -> None:
+        """Record the transport phases and the attempt itself."""
+        end = time.perf_counter()
+        marks = self.marks
+        previous = "start"
+        for phase, mark in (
+            ("connect", "sending"),
+            ("upload", "sent"),
+            ("server", "headers"),
+            ("download", "body"),
+        ):
+            if mark not in marks or previous not in marks:
+                break
+            self.recorder.phase(
+                phase,
+                self.start + marks[previous] - marks["start"],
+                marks[mark] - marks[previous],
+            )
+            previous = mark
+        ctx = self.recorder.ctx
+        status = None
+        if response is not None:
+            status = ctx.status = response.status_code
+            length = response.request.headers.get("Content-Length")
+            if length is not None:
+                ctx.request_bytes = int(length)
+            ctx.response_bytes = len(response.content)
+        self.recorder.instrumentation.attempt_finished(
+            ctx, self.number, self.start, end - marks["start"], status, error
+        )
+
+
+@contextmanager
+def record_extraction(
+    instrumentation: Instrumentation | None, operation: str
+) -> Iterator[Recorder | None]:
+    """Record one extraction call; yields ``None`` when not instrumented."""
+    if instrumentation is None:
+        yield None
+        return
+    recorder = Recorder(instrumentation, operation)
+    instrumentation.extraction_started(recorder.ctx)
+    try:
+        yield recorder
+    except BaseException as e:
+        recorder.finish(e)
+        raise
+    recorder.finish(None)
+
+
+@contextmanager
+def timed(recorder: Recorder | None, phase: str) -> Iterator[None]:
+    """Record the block as ``phase`` if ``recorder`` is set."""
+    if recorder is None:
+        yield
+    else:
+        with recorder.timed(phase):
+            yield
+
+
+def timing(
+    recorder: Recorder | None, phase: str, call: Callable[[], T]
+) -> Callable[[], T]:
+    """Wrap ``call`` so running it is recorded as ``phase``, if ``recorder`` is set."""
+    if recorder is None:
+        return call
+
+    def timed_call() -> T:
+        with recorder.timed(phase):
+            return call()
+
+    return timed_call
+
+
+# ── global instrumentation ────────────────────────────────────────────
+
+INSTRUMENTATIONS: dict[str, Callable[[], Instrumentation]] = {
+    "prometheus": PrometheusInstrumentation,
+    "opentelemetry": OpenTelemetryInstrumentation,
+    "otel": OpenTelemetryInstrumentation,
+}
+
+_instrumentation: Instrumentation | None = None
+_configured = False
+_lock = threading.Lock()
+
+
+def _from_names(names: str) -> Instrumentation | None:
+    chosen = []
+    for name in filter(None, (part.strip() for part in names.split(","))):
+        try:
+            chosen.append(INSTRUMENTATIONS[name]())
+        except KeyError:
+            raise ValueError(
+                f"Unknown instrumentation {name!r}; "
+                f"expected one of {sorted(INSTRUMENTATIONS)}"
+            ) from None
+    if not chosen:
+        return None
+    return chosen[0] if len(chosen) == 1 else MultiInstrumentation(chosen)
+
+
+def get_instrumentation() -> Instrumentation | None:
+    """Return the instrumentation clients use by default.
+
+    On first call it is built from ``$KIE_INSTRUMENTATION``, a comma-separated
+    list of ``prometheus`` and ``opentelemetry`` (or ``otel``); ``None`` when
+    unset.
+    """
+    global _instrumentation, _configured
+    with _lock:
+        if not _configured:
+            names = os.environ.get("KIE_INSTRUMENTATION", "")
+            _instrumentation = _from_names(names)
+            _configured = True
+        return _instrumentation
+
+
+def set_instrumentation(
+    instrumentation: Instrumentation | Iterable[Instrumentation] | str | None,
+) -> None:
+    """Set the instrumentation used by clients without their own.
+
+    Args:
+        instrumentation: An :class:`Instrumentation`, several (combined with
+            :class:`MultiInstrumentation`), names as accepted by
+            ``$KIE_INSTRUMENTATION``, or ``None`` to turn it off.
+
+    Raises:
+        ValueError: If a name is unknown.
+        RuntimeError: If a named exporter's library is not installed.
+    """
+    global _instrumentation, _configured
+    if isinstance(instrumentation, str):
+        instrumentation = _from_names(instrumentation)
+    elif instrumentation is not None and not isinstance(
+        instrumentation, Instrumentation
+    ):
+        instrumentation = MultiInstrumentation(instrumentation)
+    with _lock:
+        _instrumentation = instrumentation
+        _configured = True
+
+
+def find_instrumentation(
+    kind: type[T], instrumentation: Instrumentation | None = None
+) -> T | None:
+    """Return the first ``kind`` instrumentation in use, looking into fan-outs.
+
+    Defaults to searching :func:`get_instrumentation`; the MCP server uses
+    this to find the Prometheus registry to expose.
+    """
+    if instrumentation is None:
+        instrumentation = get_instrumentation()
+    if isinstance(instrumentation, kind):
+        return instrumentation
+    if isinstance(instrumentation, MultiInstrumentation):
+        for inner in instrumentation.instrumentations:
+            found = find_instrumentation(kind, inner)
+            if found is not None:
+                return found
+    return None
@@ -0,0 +1,305 @@
+"""Resumable batch extraction backed by an append-only journal."""
+
+from __future__ import annotations
+
+import os
+import socket
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator
+
+from kie_core import serialization
+from kie_core.batch import DEFAULT_CONCURRENCY, extract_many
+from kie_core.cache import cache_key
+from kie_core.client import DEFAULT_TIMEOUT, KIEClient
+from kie_core.document import hash_document
+from kie_core.schema import compile_schema
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover — Windows
+    fcntl = None
+
+DEFAULT_LEASE = 600.0
+
+CLAIMED = "claimed"
+DONE = "done"
+FAILED = "failed"
+
+
+class BatchJournal:
+    """Append-only record of which documents of a batch are done.
+
+    Every line of the journal is a JSON entry with the extraction key
+    (document hash + schema + model), the document, a status (``claimed``,
+    ``done`` or ``failed``), a timestamp, and for finished documents the
+    byte offset and length of the result line in the output file.  The
+    latest entry for a key wins.
+
+    Journal and output are guarded with ``flock``, so several processes
+    can work through the same batch without duplicate work; this is only
+    available on POSIX.  A claim whose process is gone (on this host), or
+    that was not finished within ``lease`` seconds, may be taken over.
+
+    Args:
+        path: Journal file; created if missing.
+        lease: Seconds after which an unfinished claim is considered stale.
+    """
+
+    def __init__(
+        self, path: str | Path, *, lease: float = DEFAULT_LEASE
+    ) -> None:
+        if fcntl is None:
+            raise RuntimeError("BatchJournal requires fcntl (POSIX only)")
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.touch(exist_ok=True)
+        self.lease = lease
+        self._entries: dict[str, dict] = {}
+        self._position = 0
+        self._lock = threading.Lock()
+        self._host = socket.gethostname()
+        self._run = uuid.uuid4().hex
+
+    @contextmanager
+    def _locked(self) -> Iterator[BinaryIO]:
+        """Hold the journal lock, with entries written by others loaded."""
+        with self._lock, self.path.open("rb+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(self._position)
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # torn write from a crashed process
+                    self._position += len(line)
+                    try:
+                        entry = serialization.loads(line)
+                    except ValueError:
+                        continue
+                    self._entries[entry["key"]] = entry
+                yield f
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _append(self, f: BinaryIO, entry: dict) -> None:
+        entry["time"] = time.time()
+        line = serialization.dumps(entry) + b"\n"
+        if f.seek(0, os.SEEK_END) != self._position:
+            # Drop a torn line left by a crashed writer.
+            f.truncate(self._position)
+            f.seek(self._position)
+        f.write(line)
+        f.flush()
+        self._position += len(line)
+        self._entries[entry["key"]] = entry
+
+    def _stale(self, entry: dict) -> bool:
+        """Whether an unfinished claim was abandoned by its worker."""
+        if time.time() - entry["time"] >= self.lease:
+            return True
+        if entry.get("host") != self._host:
+            return False
+        if entry.get("pid") == os.getpid():
+            return entry.get("run") != self._run
+        try:
+            os.kill(entry["pid"], 0)
+        except ProcessLookupError:
+            return True
+        except (OSError, KeyError):
+            pass
+        return False
+
+    def status(self, key: str) -> dict | None:
+        """Return the latest entry for ``key``, or ``None``."""
+        with self._locked():
+            return self._entries.get(key)
+
+    def entries(self) -> dict[str, dict]:
+        """Return the latest entry for every key."""
+        with self._locked():
+            return dict(self._entries)
+
+    def claim(self, key: str, document: str, *, retry_failed: bool = True) -> bool:
+        """Claim ``key`` for this worker.
+
+        Returns ``False`` if it is done, failed (with ``retry_failed``
+        false), or claimed by another worker within the lease.
+        """
+        with self._locked() as f:
+            entry = self._entries.get(key)
+            if entry is not None:
+                status = entry["status"]
+                if status == DONE or (status == FAILED and not retry_failed):
+                    return False
+                if status == CLAIMED and not self._stale(entry):
+                    return False
+            self._append(
+                f,
+                {
+                    "key": key,
+                    "document": document,
+                    "status": CLAIMED,
+                    "host": self._host,
+                    "pid": os.getpid(),
+                    "run": self._run,
+                },
+            )
+            return True
+
+    def complete(
+        self, key: str, document: str, result: dict, output: str | Path
+    ) -> int:
+        """Append ``result`` to the JSON Lines ``output`` and mark ``key`` done.
+
+        Returns:
+            Byte offset of the result line in ``output``.
+        """
+        record = {"document": document, "key": key, "result": result}
+        line = serialization.dumps(record)
+        with self._locked() as f, open(output, "ab") as out:
+            offset = out.seek(0, os.SEEK_END)
+            out.write(line + b"\n")
+            out.flush()
+            self._append(
+                f,
+                {
+                    "key": key,
+                    "document": document,
+                    "status": DONE,
+                    "offset": offset,
+                    "length": len(line) + 1,
+                },
+            )
+        return offset
+
+    def fail(self, key: str, document: str, error: BaseException | str) -> None:
+        """Mark ``key`` failed; it is retried on the next run."""
+        with self._locked() as f:
+            self._append(
+                f,
+                {
+                    "key": key,
+                    "document": document,
+                    "status": FAILED,
+                    "error": str(error),
+                },
+            )
+
+    def read_result(self, key: str, output: str | Path) -> dict | None:
+        """Read the result recorded for ``key`` back from ``output``."""
+        entry = self.status(key)
+        if entry is None or entry["status"] != DONE:
+            return None
+        with open(output, "rb") as f:
+            f.seek(entry["offset"])
+            return serialization.loads(f.read(entry["length"]))["result"]
+
+
+@dataclass
+class JobSummary:
+    """Counts from one :func:`run_batch` call.
+
+    Attributes:
+        completed: Documents extracted in this run.
+        failed: Documents that failed in this run.
+        skipped: Documents already done, or claimed by another worker.
+    """
+
+    completed: int = 0
+    failed: int = 0
+    skipped: int = 0
+
+
+def run_batch(
+    document_paths: Iterable[str],
+    schema: dict | str,
+    output: str | Path,
+    *,
+    journal: BatchJournal | str | Path | None = None,
+    retry_failed: bool = True,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    model: str | None = None,
+    endpoint: str | None = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    client: KIEClient | None = None,
+) -> JobSummary:
+    """Extract a batch resumably, appending results to a JSON Lines file.
+
+    Each document is hashed and claimed in the journal just before it is
+    dispatched, so rerunning after a crash skips every finished document
+    and retries only failures (and claims whose lease expired).  Start
+    the same call in several processes to split the work between them.
+    Extraction itself follows :func:`~kie_core.batch.extract_many`.
+
+    Output lines look like ``{"document": ..., "key": ..., "result": {...}}``;
+    errors are recorded in the journal only.
+
+    Args:
+        document_paths: Paths to the documents.  Consumed lazily.
+        schema: JSON schema as a dict, JSON string, or path to a ``.json`` file.
+        output: JSON Lines file results are appended to.
+        journal: A :class:`BatchJournal` or its path.  Defaults to
+            ``<output>.journal``.
+        retry_failed: Retry documents that failed in an earlier run.
+        concurrency: Maximum number of requests in flight.
+        model: Optional model ID for extraction.
+        endpoint: API endpoint URL.
+        timeout: Request timeout in seconds.
+        client: Pooled client to use.  Defaults to the shared client.
+
+    Returns:
+        A :class:`JobSummary` for this run.
+
+    Raises:
+        ValueError: If ``concurrency`` is less than 1 or the schema is invalid.
+        RuntimeError: If ``fcntl`` is unavailable.
+    """
+    schema = compile_schema(schema)
+    if journal is None:
+        journal = f"{output}.journal"
+    if not isinstance(journal, BatchJournal):
+        journal = BatchJournal(journal)
+    Path(output).parent.mkdir(parents=True, exist_ok=True)
+    summary = JobSummary()
+    keys: list[str] = []  # by BatchResult.index
+
+    def claim() -> Iterator[str]:
+        for path in document_paths:
+            path = str(path)
+            try:
+                key = cache_key(hash_document(path), schema, model)
+            except FileNotFoundError as e:
+                key = cache_key(f"missing:{path}", schema, model)
+                if journal.claim(key, path, retry_failed=retry_failed):
+                    journal.fail(key, path, e)
+                    summary.failed += 1
+                else:
+                    summary.skipped += 1
+                continue
+            if journal.claim(key, path, retry_failed=retry_failed):
+                keys.append(key)
+                yield path
+            else:
+                summary.skipped += 1
+
+    for item in extract_many(
+        claim(),
+        schema,
+        concurrency=concurrency,
+        model=model,
+        endpoint=endpoint,
+        timeout=timeout,
+        client=client,
+    ):
+        key = keys[item.index]
+        if item.ok:
+            journal.complete(key, item.document_path, item.result, output)
+            summary.completed += 1
+        else:
+            journal.fail(key, item.document_path, item.error)
+            summary.failed += 1
+    return summary
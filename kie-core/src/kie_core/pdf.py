@@ -0,0 +1,177 @@
+"""PDF page selection and splitting (requires the ``pdf`` extra)."""
+
+from __future__ import annotations
+
+import base64
+import io
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Iterable, Union
+
+from kie_core.document import BUFFER_TYPES, PreparedDocument, sniff_document_type
+
+try:
+    import pypdf
+except ImportError:  # pragma: no cover — optional extra
+    pypdf = None
+
+# A page range string such as ``"1-2,5,10-"`` (1-based, inclusive), page
+# numbers, or a predicate called with each 1-based page number and its
+# ``pypdf.PageObject``.
+PageSelection = Union[str, Iterable[int], Callable[[int, Any], bool]]
+
+PDFInput = Union[str, Path, PreparedDocument, bytes, bytearray, memoryview, BinaryIO]
+
+
+def _require_pypdf() -> None:
+    if pypdf is None:
+        raise RuntimeError("pypdf is not installed (install the kie-core[pdf] extra)")
+
+
+def parse_page_range(spec: str, page_count: int) -> list[int]:
+    """Turn a page range string into sorted, de-duplicated 0-based indices.
+
+    Args:
+        spec: Comma-separated 1-based pages and inclusive ranges, e.g.
+            ``"1-2,5"``.  ``"10-"`` runs to the last page.
+        page_count: Number of pages in the document.
+
+    Returns:
+        Page indices, ascending.  Pages past the end are ignored.
+
+    Raises:
+        ValueError: If the string is malformed.
+    """
+    indices: set[int] = set()
+    for part in spec.replace(" ", "").split(","):
+        if not part:
+            continue
+        start, dash, end = part.partition("-")
+        try:
+            first = int(start)
+            last = int(end) if end else first
+        except ValueError:
+            raise ValueError(f"Invalid page range: {spec!r}") from None
+        if first < 1 or last < first:
+            raise ValueError(f"Invalid page range: {spec!r}")
+        if dash and not end:
+            last = page_count
+        indices.update(range(first - 1, min(last, page_count)))
+    return sorted(indices)
+
+
+def _pdf_source(document: PDFInput) -> str | Path | BinaryIO:
+    """Return something ``pypdf.PdfReader`` can open."""
+    if isinstance(document, PreparedDocument):
+        if document.doc_type != "pdf":
+            raise ValueError("Page selection requires a PDF document")
+        return io.BytesIO(base64.b64decode(document.content))
+    if isinstance(document, BUFFER_TYPES):
+        head = bytes(memoryview(document)[:4])
+        source: Any = io.BytesIO(document)
+    elif isinstance(document, (str, Path)):
+        if not Path(document).is_file():
+            raise FileNotFoundError(f"Document not found: {document}")
+        with open(document, "rb") as f:
+            head = f.read(4)
+        source = document
+    elif hasattr(document, "seek"):
+        source = document
+        start = source.tell()
+        head = source.read(4)
+        source.seek(start)
+    else:
+        raise TypeError("Page selection needs a path, bytes or a seekable file")
+    if sniff_document_type(head) != "pdf":
+        raise ValueError("Page selection requires a PDF document")
+    return source
+
+
+def _selected(reader: Any, pages: PageSelection | None) -> list[int]:
+    count = len(reader.pages)
+    if pages is None:
+        return list(range(count))
+    if isinstance(pages, str):
+        return parse_page_range(pages, count)
+    if callable(pages):
+        return [i for i, page in enumerate(reader.pages) if pages(i + 1, page)]
+    return sorted({n - 1 for n in pages if 1 <= n <= count})
+
+
+def _write(reader: Any, indices: Iterable[int]) -> bytes:
+    writer = pypdf.PdfWriter()
+    for index in indices:
+        writer.add_page(reader.pages[index])
+    out = io.BytesIO()
+    writer.write(out)
+    return out.getvalue()
+
+
+def select_pages(document: PDFInput, pages: PageSelection) -> bytes:
+    """Build a smaller PDF holding only the selected pages.
+
+    Args:
+        document: Path to a PDF, its bytes, a seekable binary file object,
+            or a :class:`~kie_core.document.PreparedDocument`.
+        pages: Page range string (``"1-2,5"``), 1-based page numbers, or a
+            predicate ``(page_number, page) -> bool``.
+
+    Returns:
+        The new PDF's bytes.
+
+    Raises:
+        ValueError: If the document is not a PDF, the range is malformed,
+            or no page is selected.
+        FileNotFoundError: If the document does not exist.
+        RuntimeError: If pypdf is not installed.
+    """
+    _require_pypdf()
+    reader = pypdf.PdfReader(_pdf_source(document))
+    indices = _selected(reader, pages)
+    if not indices:
+        raise ValueError("No pages selected")
+    return _write(reader, indices)
+
+
+def split_pages(
+    document: PDFInput, pages: PageSelection | None = None
+) -> list[tuple[int, bytes]]:
+    """Split a PDF into single-page PDFs.
+
+    Args:
+        document: As for :func:`select_pages`.
+        pages: Optional selection, as for :func:`select_pages`; defaults to
+            every page.
+
+    Returns:
+        ``(page_number, pdf_bytes)`` pairs in page order, 1-based.
+
+    Raises:
+        Same as :func:`select_pages`.
+    """
+    _require_pypdf()
+    reader = pypdf.PdfReader(_pdf_source(document))
+    indices = _selected(reader, pages)
+    if not indices:
+        raise ValueError("No pages selected")
+    return [(index + 1, _write(reader, [index])) for index in indices]
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or value == "" or value == [] or value == {}
+
+
+def merge_page_results(results: Iterable[dict]) -> dict:
+    """Merge per-page extraction results, in page order.
+
+    List fields (e.g. line items) are concatenated across pages; for every
+    other field the first non-empty value wins.
+    """
+    merged: dict = {}
+    for result in results:
+        for field, value in result.items():
+            current = merged.get(field)
+            if isinstance(value, list) and isinstance(current, list):
+                merged[field] = current + value
+            elif field not in merged or _is_empty(current):
+                merged[field] = value
+    return merged
@@ -0,0 +1,329 @@
+"""Client-side rate limiting and adaptive concurrency control."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from pathlib import Path
+from typing import AsyncIterator, Iterator
+
+import httpx
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover — Windows
+    fcntl = None
+
+OVERLOAD_STATUSES = frozenset({429, 503})
+
+
+def is_overload(error: BaseException) -> bool:
+    """Whether ``error`` signals that the backend is overloaded."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in OVERLOAD_STATUSES
+    return isinstance(error, httpx.TimeoutException)
+
+
+# ── rate limiting ─────────────────────────────────────────────────────
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting requests per second.
+
+    Callers reserve a token and sleep until it becomes available, so waits
+    are fair and work from both threads and coroutines.
+
+    Args:
+        rate: Sustained requests per second.
+        burst: Bucket capacity (maximum burst).  Defaults to ``max(1, rate)``.
+    """
+
+    def __init__(self, rate: float, burst: float | None = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token and return how long to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def aacquire(self) -> None:
+        """Wait (without blocking the event loop) until a request may be sent."""
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+class FileTokenBucket(TokenBucket):
+    """Token bucket whose state is shared across processes through a file.
+
+    Every process pointing at the same ``path`` draws from one budget.  The
+    file is guarded with ``flock``, so this is only available on POSIX.
+    """
+
+    def __init__(
+        self, path: str | Path, rate: float, burst: float | None = None
+    ) -> None:
+        if fcntl is None:
+            raise RuntimeError("FileTokenBucket requires fcntl (POSIX only)")
+        super().__init__(rate, burst)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.touch(exist_ok=True)
+
+    def _reserve(self) -> float:
+        with self._lock, self.path.open("r+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                now = time.time()
+                try:
+                    tokens, updated = (float(v) for v in f.read().split())
+                except ValueError:
+                    tokens, updated = self.capacity, now
+                tokens = min(self.capacity, tokens + (now - updated) * self.rate) - 1
+                f.seek(0)
+                f.truncate()
+                f.write(f"{tokens} {now}")
+                f.flush()
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+        return max(0.0, -tokens / self.rate)
+
+
+# ── adaptive concurrency ──────────────────────────────────────────────
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD limit on requests in flight, shared by threads and coroutines.
+
+    The limit grows additively (about +1 per window of successful requests)
+    while latency stays healthy, and is cut multiplicatively when the backend
+    signals overload (429/503 or timeouts).
+
+    Args:
+        initial: Starting limit.
+        min_limit: Lowest the limit may fall to.
+        max_limit: Highest the limit may grow to.
+        backoff_factor: Multiplier applied to the limit on overload.
+        latency_threshold: Successful requests slower than this (seconds) do
+            not grow the limit.  ``None`` treats every success as healthy.
+        cooldown: Minimum seconds between two decreases, so one burst of
+            failures counts as a single congestion event.
+    """
+
+    def __init__(
+        self,
+        initial: int = 8,
+        *,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        backoff_factor: float = 0.5,
+        latency_threshold: float | None = None,
+        cooldown: float = 1.0,
+    ) -> None:
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_factor = backoff_factor
+        self.latency_threshold = latency_threshold
+        self.cooldown = cooldown
+        self._limit = float(min(max(initial, min_limit), max_limit))
+        self._in_flight = 0
+        self._last_decrease = float("-inf")
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._async_waiters: deque[
+            tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]
+        ] = deque()
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Requests currently holding a slot."""
+        return self._in_flight
+
+    def acquire(self) -> None:
+        """Block until a slot is free and take it."""
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                self._cond.wait()
+            self._in_flight += 1
+
+    async def aacquire(self) -> None:
+        """Wait (without blocking the event loop) for a slot and take it."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if self._in_flight < int(self._limit):
+                    self._in_flight += 1
+                    return
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self._lock:
+                    if (loop, waiter) in self._async_waiters:
+                        self._async_waiters.remove((loop, waiter))
+                    else:
+                        self._wake()
+                raise
+
+    def release(
+        self, *, latency: float | None = None, overloaded: bool = False
+    ) -> None:
+        """Return a slot and adjust the limit.
+
+        Args:
+            latency: Duration of a successful request, or ``None`` when the
+                request failed for a reason unrelated to load.
+            overloaded: Whether the backend signalled overload.
+        """
+        with self._lock:
+            self._in_flight -= 1
+            now = time.monotonic()
+            if overloaded:
+                if now - self._last_decrease >= self.cooldown:
+                    self._limit = max(
+                        float(self.min_limit), self._limit * self.backoff_factor
+                    )
+                    self._last_decrease = now
+            elif latency is not None and (
+                self.latency_threshold is None or latency <= self.latency_threshold
+            ):
+                self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+            self._wake()
+
+    def _wake(self) -> None:
+        """Wake as many waiters as there are free slots.  Caller holds the lock."""
+        free = int(self._limit) - self._in_flight
+        if free <= 0:
+            return
+        self._cond.notify(free)
+        while free > 0 and self._async_waiters:
+            loop, waiter = self._async_waiters.popleft()
+            loop.call_soon_threadsafe(_resolve, waiter)
+            free -= 1
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold a slot for the duration of one request."""
+        self.acquire()
+        started = time.monotonic()
+        try:
+            yield
+        except BaseException as e:
+            self.release(overloaded=is_overload(e))
+            raise
+        self.release(latency=time.monotonic() - started)
+
+    @asynccontextmanager
+    async def aslot(self) -> AsyncIterator[None]:
+        """Async counterpart of :meth:`slot`."""
+        await self.aacquire()
+        started = time.monotonic()
+        try:
+            yield
+        except BaseException as e:
+            self.release(overloaded=is_overload(e))
+            raise
+        self.release(latency=time.monotonic() - started)
+
+
+def _resolve(waiter: asyncio.Future[None]) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+# ── process-wide defaults ─────────────────────────────────────────────
+
+_defaults_lock = threading.Lock()
+_default_rate_limiter: TokenBucket | None = None
+_default_concurrency_limiter: AdaptiveConcurrencyLimiter | None = None
+_defaults_loaded = False
+
+
+def _load_defaults() -> None:
+    """Build the shared limiters from the environment (once)."""
+    global _default_rate_limiter, _default_concurrency_limiter, _defaults_loaded
+    if _defaults_loaded:
+        return
+    rate = os.environ.get("KIE_RATE_LIMIT")
+    if rate:
+        burst = os.environ.get("KIE_RATE_LIMIT_BURST")
+        burst_value = float(burst) if burst else None
+        path = os.environ.get("KIE_RATE_LIMIT_FILE")
+        _default_rate_limiter = (
+            FileTokenBucket(path, float(rate), burst_value)
+            if path
+            else TokenBucket(float(rate), burst_value)
+        )
+    max_concurrency = os.environ.get("KIE_MAX_CONCURRENCY")
+    if max_concurrency:
+        maximum = int(max_concurrency)
+        _default_concurrency_limiter = AdaptiveConcurrencyLimiter(
+            initial=min(8, maximum), max_limit=maximum
+        )
+    _defaults_loaded = True
+
+
+def get_default_rate_limiter() -> TokenBucket | None:
+    """Return the process-wide rate limiter, if one is configured.
+
+    Configured from ``$KIE_RATE_LIMIT`` (requests/second), optionally
+    ``$KIE_RATE_LIMIT_BURST``, and ``$KIE_RATE_LIMIT_FILE`` to share the
+    budget across processes.
+    """
+    with _defaults_lock:
+        _load_defaults()
+        return _default_rate_limiter
+
+
+def get_default_concurrency_limiter() -> AdaptiveConcurrencyLimiter | None:
+    """Return the process-wide adaptive concurrency limiter, if configured.
+
+    Configured from ``$KIE_MAX_CONCURRENCY`` (upper bound of the limit).
+    """
+    with _defaults_lock:
+        _load_defaults()
+        return _default_concurrency_limiter
+
+
+def _set_defaults(
+    rate_limiter: TokenBucket | None,
+    concurrency_limiter: AdaptiveConcurrencyLimiter | None,
+) -> None:
+    """Override the environment-derived defaults.
+
+    Use :func:`kie_core.client.set_default_limiters`, which also updates the
+    shared clients that already exist.
+    """
+    global _default_rate_limiter, _default_concurrency_limiter, _defaults_loaded
+    with _defaults_lock:
+        _default_rate_limiter = rate_limiter
+        _default_concurrency_limiter = concurrency_limiter
+        _defaults_loaded = True
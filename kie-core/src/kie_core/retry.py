@@ -0,0 +1,257 @@
+"""Retry, backoff, and hedged-request policies for the KIE client."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, wait
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable
+
+import httpx
+
+DEFAULT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Transport failures where the server cannot have processed the request.
+_CONNECTION_ERRORS = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.PoolTimeout,
+    httpx.RemoteProtocolError,
+)
+
+
+@dataclass
+class RetryPolicy:
+    """When and how long to wait before retrying a failed request.
+
+    Attributes:
+        max_attempts: Total attempts including the first; ``1`` disables retries.
+        backoff_base: Delay before the first retry, doubled on each attempt.
+        backoff_max: Upper bound on any single delay (including ``Retry-After``).
+        jitter: Use "full jitter" (uniform in ``[0, delay]``) to spread retries.
+        retry_statuses: HTTP status codes that are retried.
+        retry_on_connection_errors: Retry connect failures and dropped
+            connections, where the request never reached the server.
+        retry_on_timeout: Also retry read/write timeouts.  Off by default
+            because a timed-out extraction may still be running server-side.
+        deadline: Total time budget in seconds across all attempts and
+            delays.  ``None`` means only ``max_attempts`` applies.
+    """
+
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    jitter: bool = True
+    retry_statuses: frozenset[int] = DEFAULT_RETRY_STATUSES
+    retry_on_connection_errors: bool = True
+    retry_on_timeout: bool = False
+    deadline: float | None = None
+
+    def is_retryable(self, error: Exception) -> bool:
+        """Whether ``error`` (raised by an attempt) should be retried."""
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in self.retry_statuses
+        if isinstance(error, _CONNECTION_ERRORS):
+            return self.retry_on_connection_errors
+        if isinstance(error, httpx.TimeoutException):
+            return self.retry_on_timeout
+        return False
+
+    def backoff(self, attempt: int, error: Exception | None = None) -> float:
+        """Seconds to wait after failed attempt number ``attempt`` (1-based).
+
+        A ``Retry-After`` header on an HTTP error response takes precedence
+        over the exponential schedule.
+        """
+        if isinstance(error, httpx.HTTPStatusError):
+            retry_after = _parse_retry_after(error.response)
+            if retry_after is not None:
+                return min(retry_after, self.backoff_max)
+        delay = min(self.backoff_base * 2 ** (attempt - 1), self.backoff_max)
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+def _parse_retry_after(response: httpx.Response) -> float | None:
+    """Return the ``Retry-After`` delay in seconds, if present and valid."""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def _remaining(policy: RetryPolicy, started: float) -> float | None:
+    if policy.deadline is None:
+        return None
+    return policy.deadline - (time.monotonic() - started)
+
+
+def call_with_retry(
+    policy: RetryPolicy,
+    send: Callable[[float], httpx.Response],
+    timeout: float,
+) -> httpx.Response:
+    """Call ``send(timeout)`` until it succeeds or the policy gives up.
+
+    ``send`` must raise (e.g. via ``raise_for_status``) on failure.  Each
+    attempt's timeout is clipped to what is left of the deadline.  The last
+    error is re-raised when retries are exhausted.
+    """
+    started = time.monotonic()
+    attempt = 1
+    while True:
+        remaining = _remaining(policy, started)
+        try:
+            return send(timeout if remaining is None else min(timeout, remaining))
+        except httpx.HTTPError as e:
+            if attempt >= policy.max_attempts or not policy.is_retryable(e):
+                raise
+            delay = policy.backoff(attempt, e)
+            remaining = _remaining(policy, started)
+            if remaining is not None and delay >= remaining:
+                raise
+        time.sleep(delay)
+        attempt += 1
+
+
+async def acall_with_retry(
+    policy: RetryPolicy,
+    send: Callable[[float], Awaitable[httpx.Response]],
+    timeout: float,
+) -> httpx.Response:
+    """Async counterpart of :func:`call_with_retry`."""
+    started = time.monotonic()
+    attempt = 1
+    while True:
+        remaining = _remaining(policy, started)
+        try:
+            return await send(
+                timeout if remaining is None else min(timeout, remaining)
+            )
+        except httpx.HTTPError as e:
+            if attempt >= policy.max_attempts or not policy.is_retryable(e):
+                raise
+            delay = policy.backoff(attempt, e)
+            remaining = _remaining(policy, started)
+            if remaining is not None and delay >= remaining:
+                raise
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+# ── hedged requests ───────────────────────────────────────────────────
+
+
+@dataclass
+class HedgePolicy:
+    """When to fire a duplicate request for a slow call.
+
+    If the first request has not answered after the hedge delay, a second
+    identical request is sent and whichever answers first wins.  The delay
+    is either fixed or derived from a percentile of recently observed
+    latencies.
+
+    Attributes:
+        delay: Fixed hedge delay in seconds.  ``None`` uses the percentile.
+        percentile: Latency percentile used as the adaptive delay.
+        min_samples: Observations required before adaptive hedging starts.
+        window: Number of recent latencies kept.
+        min_delay: Lower bound for the adaptive delay.
+    """
+
+    delay: float | None = None
+    percentile: float = 0.95
+    min_samples: int = 20
+    window: int = 200
+    min_delay: float = 0.05
+    _latencies: deque[float] = field(init=False, repr=False)
+    _lock: threading.Lock = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._latencies = deque(maxlen=self.window)
+        self._lock = threading.Lock()
+
+    def record(self, latency: float) -> None:
+        """Record the latency of a successful request."""
+        with self._lock:
+            self._latencies.append(latency)
+
+    def current_delay(self) -> float | None:
+        """Return the hedge delay, or ``None`` if hedging is not active yet."""
+        if self.delay is not None:
+            return self.delay
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, int(self.percentile * len(ordered)))
+        return max(self.min_delay, ordered[index])
+
+
+def hedged_call(
+    executor: Executor,
+    send: Callable[[], httpx.Response],
+    delay: float,
+) -> httpx.Response:
+    """Run ``send`` and, if it is still pending after ``delay``, a duplicate.
+
+    Returns the first successful response; raises only if both fail.  The
+    losing request runs to completion in the background and is discarded.
+    """
+    primary = executor.submit(send)
+    done, _ = wait([primary], timeout=delay)
+    if done:
+        return primary.result()
+    pending = {primary, executor.submit(send)}
+    error: BaseException | None = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                return future.result()
+            error = future.exception()
+    raise error
+
+
+async def ahedged_call(
+    send: Callable[[], Awaitable[httpx.Response]],
+    delay: float,
+) -> httpx.Response:
+    """Async counterpart of :func:`hedged_call`; the loser is cancelled."""
+    primary = asyncio.ensure_future(send())
+    pending = {primary}
+    error: BaseException | None = None
+    # Cancel whatever is still running on every way out, including the
+    # caller being cancelled or timing out during the hedge delay.
+    try:
+        done, _ = await asyncio.wait(pending, timeout=delay)
+        if done:
+            return primary.result()
+        pending.add(asyncio.ensure_future(send()))
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+    finally:
+        for task in pending:
+            task.cancel()
+    raise error
@@ -1,12 +1,30 @@
-"""JSON schema loading utilities."""
+"""JSON schema loading, validation, and compiled-schema cache."""
 
+from __future__ import annotations
+
+import hashlib
 import json
 import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Union
+
+DEFAULT_MAX_SCHEMAS = 256
+
+# Type hints that are lower-cased during normalization.  Anything else
+# ("5-digit zip code", ...) is a free-form description and kept as written.
+KNOWN_TYPES = frozenset({"string", "number", "integer", "boolean", "currency"})
+
+_DATE_HINT = re.compile(r"date\s*\((.*)\)", re.IGNORECASE | re.DOTALL)
 
 
 def load_schema(schema_input: str | dict) -> dict:
     """Load a schema from a JSON string, file path, or dict.
 
+    No validation or caching is done; the client uses
+    :func:`compile_schema` instead.
+
     Args:
         schema_input: JSON string, path to a .json file, or dict.
 
@@ -27,3 +45,212 @@ def load_schema(schema_input: str | dict) -> dict:
         return json.loads(schema_input)
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON schema: {e}") from e
+
+
+class CompiledSchema(dict):
+    """A validated schema with its serialized form and fingerprint precomputed.
+
+    It is a ``dict`` holding the fields as written (order and type-hint
+    spelling preserved), so it can be used anywhere a schema dict is
+    accepted and is sent to the server unchanged.  Normalization only
+    affects :attr:`fingerprint` and :attr:`normalized`.  Treat it as
+    read-only: the attributes are not updated on mutation.
+
+    Attributes:
+        json: The schema serialized as compact UTF-8 JSON, spliced into
+            request bodies without re-serializing.
+        normalized: The fields with type hints normalized (see
+            :func:`validate_schema`), used for typed decoding.
+        fingerprint: SHA-256 of the normalized form with sorted keys, stable
+            across field order, whitespace, and type-hint spelling.
+    """
+
+    json: bytes
+    normalized: dict
+    fingerprint: str
+
+    def __init__(self, fields: dict, normalized: dict | None = None) -> None:
+        super().__init__(fields)
+        self.json = _dumps(fields).encode()
+        self.normalized = validate_schema(fields) if normalized is None else normalized
+        canonical = _dumps(self.normalized, sort_keys=True)
+        self.fingerprint = hashlib.sha256(canonical.encode()).hexdigest()
+
+    def __repr__(self) -> str:
+        return f"CompiledSchema({dict.__repr__(self)})"
+
+
+def _dumps(value: Any, *, sort_keys: bool = False) -> str:
+    return json.dumps(
+        value, ensure_ascii=False, separators=(",", ":"), sort_keys=sort_keys
+    )
+
+
+def normalize_hint(hint: str) -> str:
+    """Normalize a type hint: trim and collapse whitespace, lower-case types.
+
+    ``" Number "`` becomes ``"number"`` and ``"Date(MM/DD/YYYY)"`` becomes
+    ``"date (MM/DD/YYYY)"`` (the format itself is case-sensitive and kept);
+    descriptive hints only have whitespace collapsed.
+    """
+    hint = " ".join(hint.split())
+    if hint.lower() in KNOWN_TYPES:
+        return hint.lower()
+    match = _DATE_HINT.fullmatch(hint)
+    if match:
+        return f"date ({match.group(1).strip()})"
+    return hint
+
+
+def _normalize(value: Any, path: str) -> Any:
+    """Validate and normalize one schema value; ``path`` names it in errors.
+
+    Only type hint strings, objects and one-item lists are normalized;
+    anything else (numbers, ``null``, lists of several items) is passed
+    through as written for the server to interpret.
+    """
+    if isinstance(value, str):
+        hint = normalize_hint(value)
+        if not hint:
+            raise ValueError(f"Invalid schema: {path} has an empty type hint")
+        return hint
+    if isinstance(value, dict):
+        return _normalize_object(value, path)
+    if isinstance(value, list) and len(value) == 1:
+        return [_normalize(value[0], f"{path}[0]")]
+    return value
+
+
+def _normalize_object(fields: dict, path: str) -> dict:
+    normalized = {}
+    for name, value in fields.items():
+        if not isinstance(name, str) or not name.strip():
+            raise ValueError(f"Invalid schema: {path} has an empty field name")
+        field_path = f"{path}.{name}" if path else name
+        normalized[name] = _normalize(value, field_path)
+    return normalized
+
+
+def is_json_schema(schema: dict) -> bool:
+    """Whether a parsed schema is a JSON Schema document, not a field map.
+
+    Recognized by a ``$schema`` key, or by ``"type": "object"`` together
+    with a ``properties`` object (as in ``assets/schemas``).
+    """
+    return "$schema" in schema or (
+        schema.get("type") == "object" and isinstance(schema.get("properties"), dict)
+    )
+
+
+def validate_schema(schema: Any) -> dict:
+    """Check a parsed schema's structure and return its normalized form.
+
+    Fields map names to a type hint string, a nested object, or a one-item
+    list describing each element (for tables and line items); other values
+    are kept as written.  JSON Schema documents (see :func:`is_json_schema`)
+    are returned unchanged, since their strings are not type hints.
+
+    Raises:
+        ValueError: Naming the offending field.
+    """
+    if not isinstance(schema, dict):
+        raise ValueError(
+            f"Invalid schema: expected a JSON object, got {type(schema).__name__}"
+        )
+    if is_json_schema(schema):
+        return schema
+    return _normalize_object(schema, "")
+
+
+SchemaInput = Union[str, dict, CompiledSchema]
+
+
+class SchemaRegistry:
+    """Memoizes compiled schemas so repeated calls do no parsing work.
+
+    Files are keyed on path, modification time, and size, so edits are
+    picked up; JSON strings are keyed on their content.  Dicts are compiled
+    on every call (they may be mutated); compile them once with
+    :func:`compile_schema` and pass the result to skip that.
+
+    Args:
+        max_entries: Least recently used entries beyond this are dropped.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_SCHEMAS) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, CompiledSchema] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def compile(self, schema_input: SchemaInput) -> CompiledSchema:
+        """Load, validate, and fingerprint a schema, reusing earlier work.
+
+        Args:
+            schema_input: JSON string, path to a .json file, dict, or
+                :class:`CompiledSchema` (returned as is).
+
+        Raises:
+            ValueError: If the input is not valid JSON or not a valid schema.
+        """
+        if isinstance(schema_input, CompiledSchema):
+            return schema_input
+        if isinstance(schema_input, dict):
+            return CompiledSchema(schema_input, validate_schema(schema_input))
+        key = self._key(schema_input)
+        with self._lock:
+            compiled = self._entries.get(key)
+            if compiled is not None:
+                self._entries.move_to_end(key)
+                return compiled
+        fields = load_schema(schema_input)
+        compiled = CompiledSchema(fields, validate_schema(fields))
+        with self._lock:
+            self._entries[key] = compiled
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return compiled
+
+    @staticmethod
+    def _key(schema_input: str) -> tuple:
+        if not schema_input.lstrip().startswith(("{", "[")):
+            try:
+                stat = os.stat(schema_input)
+            except (OSError, ValueError):
+                pass
+            else:
+                path = os.path.abspath(schema_input)
+                return ("path", path, stat.st_mtime_ns, stat.st_size)
+        return ("json", schema_input)
+
+    def clear(self) -> None:
+        """Forget every compiled schema."""
+        with self._lock:
+            self._entries.clear()
+
+
+_registry = SchemaRegistry()
+
+
+def compile_schema(schema_input: SchemaInput) -> CompiledSchema:
+    """Compile a schema through the shared :class:`SchemaRegistry`.
+
+    Args:
+        schema_input: JSON string, path to a .json file, dict, or
+            :class:`CompiledSchema`.
+
+    Returns:
+        The validated schema with precomputed JSON bytes and fingerprint.
+
+    Raises:
+        ValueError: If the input is not valid JSON or not a valid schema.
+    """
+    return _registry.compile(schema_input)
+
+
+def get_schema_registry() -> SchemaRegistry:
+    """Return the registry used by :func:`compile_schema`."""
+    return _registry
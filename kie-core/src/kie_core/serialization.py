@@ -0,0 +1,151 @@
+"""JSON serialization with optional fast backends (orjson, msgspec)."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover — optional extra
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover — optional extra
+    msgspec = None
+
+
+class JSONBackend:
+    """Standard-library encoder/decoder; base class for the other backends.
+
+    Output is UTF-8 (non-ASCII characters are not escaped).  Compact output
+    uses no whitespace; ``indent=True`` pretty-prints with two spaces.
+    Subclass and pass an instance to :func:`set_json_backend` to plug in
+    another library.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any, *, indent: bool = False) -> bytes:
+        """Serialize ``obj`` to UTF-8 JSON bytes."""
+        if indent:
+            return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+    def loads(self, data: bytes | str) -> Any:
+        """Parse JSON from bytes or a string."""
+        return json.loads(data)
+
+
+class OrjsonBackend(JSONBackend):
+    """Backend using ``orjson`` (``kie-core[orjson]`` extra)."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise RuntimeError(
+                "orjson is not installed (install the kie-core[orjson] extra)"
+            )
+
+    def dumps(self, obj: Any, *, indent: bool = False) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+
+    def loads(self, data: bytes | str) -> Any:
+        return orjson.loads(data)
+
+
+class MsgspecBackend(JSONBackend):
+    """Backend using ``msgspec`` (``kie-core[msgspec]`` extra)."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        if msgspec is None:
+            raise RuntimeError(
+                "msgspec is not installed (install the kie-core[msgspec] extra)"
+            )
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any, *, indent: bool = False) -> bytes:
+        data = self._encoder.encode(obj)
+        return msgspec.json.format(data, indent=2) if indent else data
+
+    def loads(self, data: bytes | str) -> Any:
+        return self._decoder.decode(data)
+
+
+BACKENDS: dict[str, type[JSONBackend]] = {
+    "orjson": OrjsonBackend,
+    "msgspec": MsgspecBackend,
+    "json": JSONBackend,
+}
+
+_backend: JSONBackend | None = None
+_backend_lock = threading.Lock()
+
+
+def _auto_backend() -> JSONBackend:
+    """Pick ``$KIE_JSON_BACKEND``, else the fastest installed library."""
+    name = os.environ.get("KIE_JSON_BACKEND")
+    if name:
+        return _make_backend(name)
+    if orjson is not None:
+        return OrjsonBackend()
+    if msgspec is not None:
+        return MsgspecBackend()
+    return JSONBackend()
+
+
+def _make_backend(name: str) -> JSONBackend:
+    try:
+        return BACKENDS[name]()
+    except KeyError:
+        raise ValueError(
+            f"Unknown JSON backend {name!r}; expected one of {sorted(BACKENDS)}"
+        ) from None
+
+
+def get_json_backend() -> JSONBackend:
+    """Return the JSON backend in use, choosing one on first call."""
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            _backend = _auto_backend()
+        return _backend
+
+
+def set_json_backend(backend: str | JSONBackend | None) -> None:
+    """Select the JSON backend used by the client and the integrations.
+
+    Args:
+        backend: ``"orjson"``, ``"msgspec"``, ``"json"``, a
+            :class:`JSONBackend` instance, or ``None`` to choose
+            automatically again.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+        RuntimeError: If the requested library is not installed.
+    """
+    global _backend
+    if isinstance(backend, str):
+        backend = _make_backend(backend)
+    with _backend_lock:
+        _backend = backend
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON bytes with the active backend."""
+    return get_json_backend().dumps(obj, indent=indent)
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse JSON with the active backend."""
+    return get_json_backend().loads(data)
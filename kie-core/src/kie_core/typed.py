@@ -0,0 +1,412 @@
+"""Typed decoding of extraction results against the request schema."""
+
+from __future__ import annotations
+
+import datetime
+import math
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable, TypedDict, Union
+
+from kie_core import serialization
+from kie_core.schema import CompiledSchema, SchemaInput, compile_schema
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover — optional extra
+    msgspec = None
+
+try:
+    from pydantic_core import SchemaValidator, ValidationError
+    from pydantic_core import core_schema
+except ImportError:  # pragma: no cover — optional extra
+    SchemaValidator = ValidationError = core_schema = None
+
+DEFAULT_MAX_DECODERS = 256
+
+DECODE_BACKENDS = ("msgspec", "pydantic", "python")
+
+_DATE_TOKENS = re.compile(r"YYYY|YY|MM|DD")
+_STRPTIME = {"YYYY": "%Y", "YY": "%y", "MM": "%m", "DD": "%d"}
+_NUMBER_NOISE = str.maketrans("", "", "$€£¥,_ \u00a0")
+_TRUE = frozenset({"true", "t", "yes", "y", "on", "1"})
+_FALSE = frozenset({"false", "f", "no", "n", "off", "0"})
+
+
+@dataclass
+class TypedResult:
+    """An extraction result decoded against its schema.
+
+    Attributes:
+        values: Field values by name, in schema order, converted to Python
+            types: ``float`` for numbers and currency, ``int``, ``bool``,
+            ``str``, ``datetime.date`` for dates, nested dicts and lists.
+            Missing and invalid fields are ``None``; fields the schema does
+            not define are dropped.
+        missing: Paths (``"line_items[0].qty"``) of fields that were absent
+            or ``null``.
+        invalid: Paths of fields whose value could not be converted, with
+            the reason.
+    """
+
+    values: dict[str, Any]
+    missing: list[str] = field(default_factory=list)
+    invalid: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """Whether every field was present and valid."""
+        return not self.missing and not self.invalid
+
+
+# ── leaf conversions ──────────────────────────────────────────────────
+#
+# The Python conversions accept everything the native decoders accept in
+# lax mode (and produce the same values), plus formatted numbers such as
+# "$1,234.50" and "(12.00)"; the native decoders are only a fast path.
+
+
+def _to_number(value: Any) -> float:
+    if isinstance(value, (int, float)):
+        return float(value)
+    if not isinstance(value, str):
+        raise ValueError(f"expected a number, got {type(value).__name__}")
+    text = value.translate(_NUMBER_NOISE)
+    negative = text.startswith("(") and text.endswith(")")
+    if negative:
+        text = text[1:-1]
+    try:
+        number = float(text)
+    except ValueError:
+        raise ValueError(f"not a number: {value!r}") from None
+    return -number if negative else number
+
+
+def _to_integer(value: Any) -> int:
+    number = _to_number(value)
+    if not math.isfinite(number) or not number.is_integer():
+        raise ValueError(f"not an integer: {value!r}")
+    return int(number)
+
+
+def _to_boolean(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        text = value.strip().lower()
+        if text in _TRUE:
+            return True
+        if text in _FALSE:
+            return False
+    raise ValueError(f"not a boolean: {value!r}")
+
+
+def _to_string(value: Any) -> str:
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    raise ValueError(f"expected a string, got {type(value).__name__}")
+
+
+def _to_any(value: Any) -> Any:
+    return value
+
+
+def _to_date(strptime: str, value: Any) -> datetime.date:
+    if not isinstance(value, str):
+        raise ValueError(f"expected a date string, got {type(value).__name__}")
+    text = value.strip()
+    try:
+        return datetime.datetime.strptime(text, strptime).date()
+    except ValueError:
+        pass
+    try:
+        return datetime.date.fromisoformat(text)
+    except ValueError:
+        raise ValueError(f"not a date in the expected format: {value!r}") from None
+
+
+def date_format(hint: str) -> str | None:
+    """Translate a ``"date (MM/DD/YYYY)"`` hint into a ``strptime`` format.
+
+    ``YYYY``, ``YY``, ``MM`` and ``DD`` are recognized; returns ``None``
+    for other hints.  ISO dates (``2024-01-31``) are always accepted too.
+    """
+    if not hint.startswith("date (") or not hint.endswith(")"):
+        return None
+    spec = hint[len("date (") : -1]
+    if not _DATE_TOKENS.search(spec):
+        return None
+    escaped = spec.replace("%", "%%")
+    return _DATE_TOKENS.sub(lambda m: _STRPTIME[m.group()], escaped)
+
+
+@dataclass(frozen=True)
+class _Leaf:
+    kind: str  # "number", "integer", "boolean", "string", "date" or "any"
+    convert: Callable[[Any], Any]
+    strptime: str | None = None
+
+
+_LEAVES = {
+    "number": _Leaf("number", _to_number),
+    "currency": _Leaf("number", _to_number),
+    "integer": _Leaf("integer", _to_integer),
+    "boolean": _Leaf("boolean", _to_boolean),
+    "string": _Leaf("string", _to_string),
+}
+
+
+def _spec(value: Any) -> Any:
+    """Turn a compiled schema value into a tree of :class:`_Leaf`."""
+    if isinstance(value, dict):
+        return {name: _spec(item) for name, item in value.items()}
+    if isinstance(value, list) and len(value) == 1:
+        return [_spec(value[0])]
+    if not isinstance(value, str):
+        return _Leaf("any", _to_any)
+    leaf = _LEAVES.get(value)
+    if leaf is not None:
+        return leaf
+    strptime = date_format(value)
+    if strptime is not None:
+        return _Leaf("date", partial(_to_date, strptime), strptime)
+    return _Leaf("any", _to_any)
+
+
+def _coerce(
+    value: Any, spec: Any, path: str, missing: list[str], invalid: dict[str, str]
+) -> Any:
+    """Convert one value, recording problems under ``path``."""
+    if value is None:
+        missing.append(path)
+        return None
+    try:
+        if isinstance(spec, dict):
+            if not isinstance(value, dict):
+                raise ValueError(f"expected an object, got {type(value).__name__}")
+            return _coerce_object(value, spec, f"{path}.", missing, invalid)
+        if isinstance(spec, list):
+            if not isinstance(value, list):
+                raise ValueError(f"expected a list, got {type(value).__name__}")
+            return [
+                _coerce(item, spec[0], f"{path}[{i}]", missing, invalid)
+                for i, item in enumerate(value)
+            ]
+        return spec.convert(value)
+    except ValueError as e:
+        invalid[path] = str(e)
+        return None
+
+
+def _coerce_object(
+    value: dict, spec: dict, prefix: str, missing: list[str], invalid: dict[str, str]
+) -> dict:
+    return {
+        name: _coerce(value.get(name), item, prefix + name, missing, invalid)
+        for name, item in spec.items()
+    }
+
+
+# ── native fast paths ─────────────────────────────────────────────────
+#
+# Native decoders are compiled with every field required and non-null, so
+# a successful decode means a complete, valid result and needs no further
+# checks.  Anything else falls back to the Python path for the details.
+
+
+class _FormattedDate(datetime.date):
+    """Base for the per-format date types handed to msgspec's ``dec_hook``."""
+
+    strptime = "%Y-%m-%d"
+
+    def __reduce__(self) -> tuple:
+        return datetime.date, (self.year, self.month, self.day)
+
+
+def _msgspec_hook(kind: type, value: Any) -> Any:
+    if issubclass(kind, _FormattedDate):
+        parsed = _to_date(kind.strptime, value)
+        return kind(parsed.year, parsed.month, parsed.day)
+    raise NotImplementedError
+
+
+_JSON_VALUE = Union[str, int, float, bool, list, dict]
+
+
+def _msgspec_type(spec: Any) -> Any:
+    if isinstance(spec, dict):
+        fields = {name: _msgspec_type(item) for name, item in spec.items()}
+        return TypedDict("Record", fields)  # type: ignore[misc]
+    if isinstance(spec, list):
+        return list[_msgspec_type(spec[0])]  # type: ignore[misc]
+    if spec.kind == "date":
+        return type("date", (_FormattedDate,), {"strptime": spec.strptime})
+    return {
+        "number": float,
+        "integer": int,
+        "boolean": bool,
+        "string": str,
+    }.get(spec.kind, _JSON_VALUE)
+
+
+def _pydantic_schema(spec: Any) -> Any:
+    if isinstance(spec, dict):
+        return core_schema.typed_dict_schema(
+            {
+                name: core_schema.typed_dict_field(_pydantic_schema(item))
+                for name, item in spec.items()
+            }
+        )
+    if isinstance(spec, list):
+        return core_schema.list_schema(_pydantic_schema(spec[0]))
+    if spec.kind == "date":
+        return core_schema.no_info_plain_validator_function(spec.convert)
+    if spec.kind == "any":
+        return core_schema.union_schema(
+            [
+                core_schema.str_schema(strict=True),
+                core_schema.bool_schema(strict=True),
+                core_schema.int_schema(strict=True),
+                core_schema.float_schema(strict=True),
+                core_schema.list_schema(),
+                core_schema.dict_schema(),
+            ]
+        )
+    return {
+        "number": core_schema.float_schema,
+        "integer": core_schema.int_schema,
+        "boolean": core_schema.bool_schema,
+        "string": core_schema.str_schema,
+    }[spec.kind]()
+
+
+class ResultDecoder:
+    """Decodes extraction results into typed values for one schema.
+
+    The schema is compiled once into a native decoder — msgspec or
+    pydantic-core — that parses response bytes straight into typed values
+    in a single pass.  Results with missing or unconvertible fields fall
+    back to a Python pass that converts what it can and records the rest
+    in :attr:`TypedResult.missing` and :attr:`TypedResult.invalid`; both
+    paths produce the same values.
+
+    Args:
+        schema: JSON schema as a dict, JSON string, path to a ``.json``
+            file, or :class:`~kie_core.schema.CompiledSchema`.
+        backend: ``"msgspec"``, ``"pydantic"`` or ``"python"``.  Defaults
+            to the first one installed.
+
+    Raises:
+        ValueError: If the schema or backend name is invalid.
+        RuntimeError: If the requested library is not installed.
+    """
+
+    def __init__(self, schema: SchemaInput, *, backend: str | None = None) -> None:
+        self.schema: CompiledSchema = compile_schema(schema)
+        self.backend = _check_backend(backend)
+        self._spec: dict = _spec(self.schema.normalized)
+        self._decode_bytes: Callable[[bytes | str], dict] | None = None
+        self._convert: Callable[[dict], dict] | None = None
+        self._errors: tuple[type[Exception], ...] = ()
+        if self.backend == "msgspec":
+            kind = _msgspec_type(self._spec)
+            decoder = msgspec.json.Decoder(kind, strict=False, dec_hook=_msgspec_hook)
+            self._decode_bytes = decoder.decode
+            self._convert = partial(
+                msgspec.convert, type=kind, strict=False, dec_hook=_msgspec_hook
+            )
+            self._errors = (msgspec.ValidationError,)
+        elif self.backend == "pydantic":
+            validator = SchemaValidator(_pydantic_schema(self._spec))
+            self._decode_bytes = validator.validate_json
+            self._convert = validator.validate_python
+            self._errors = (ValidationError,)
+
+    def decode(self, data: bytes | str | dict) -> TypedResult:
+        """Decode a raw response body or an already parsed result.
+
+        Raises:
+            ValueError: If ``data`` is not valid JSON or not a JSON object.
+        """
+        if self._convert is not None:
+            try:
+                if isinstance(data, dict):
+                    return TypedResult(self._convert(data))
+                return TypedResult(self._decode_bytes(data))
+            except self._errors:
+                pass
+        if not isinstance(data, dict):
+            data = serialization.loads(data)
+        if not isinstance(data, dict):
+            raise ValueError(
+                f"Expected a JSON object result, got {type(data).__name__}"
+            )
+        missing: list[str] = []
+        invalid: dict[str, str] = {}
+        values = _coerce_object(data, self._spec, "", missing, invalid)
+        return TypedResult(values, missing, invalid)
+
+
+def _check_backend(backend: str | None) -> str:
+    if backend is None:
+        if msgspec is not None:
+            return "msgspec"
+        if core_schema is not None:
+            return "pydantic"
+        return "python"
+    if backend not in DECODE_BACKENDS:
+        raise ValueError(
+            f"Unknown decode backend {backend!r}; expected one of {DECODE_BACKENDS}"
+        )
+    if backend == "msgspec" and msgspec is None:
+        raise RuntimeError(
+            "msgspec is not installed (install the kie-core[msgspec] extra)"
+        )
+    if backend == "pydantic" and core_schema is None:
+        raise RuntimeError(
+            "pydantic-core is not installed (install the kie-core[pydantic] extra)"
+        )
+    return backend
+
+
+_decoders: OrderedDict[tuple[str, str], ResultDecoder] = OrderedDict()
+_decoders_lock = threading.Lock()
+
+
+def compile_decoder(
+    schema: SchemaInput, *, backend: str | None = None
+) -> ResultDecoder:
+    """Return the :class:`ResultDecoder` for a schema, building it once.
+
+    Decoders are memoized on the schema fingerprint and backend.
+    """
+    schema = compile_schema(schema)
+    key = (schema.fingerprint, _check_backend(backend))
+    with _decoders_lock:
+        decoder = _decoders.get(key)
+        if decoder is not None:
+            _decoders.move_to_end(key)
+            return decoder
+    decoder = ResultDecoder(schema, backend=key[1])
+    with _decoders_lock:
+        _decoders[key] = decoder
+        while len(_decoders) > DEFAULT_MAX_DECODERS:
+            _decoders.popitem(last=False)
+    return decoder
+
+
+def decode_result(
+    result: bytes | str | dict, schema: SchemaInput, *, backend: str | None = None
+) -> TypedResult:
+    """Decode one extraction result against its schema.
+
+    Shorthand for ``compile_decoder(schema, backend=backend).decode(result)``.
+    """
+    return compile_decoder(schema, backend=backend).decode(result)
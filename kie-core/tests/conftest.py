@@ -4,6 +4,8 @@ import json
 
 import pytest
 
+from kie_core.retry import RetryPolicy
+
 
 @pytest.fixture()
 def sample_image(tmp_path):
@@ -45,3 +47,9 @@ def mock_endpoint():
 def mock_result():
     """Return a typical extraction result."""
     return {"vendor_name": "Acme Corp", "total_amount": 1234.56}
+
+
+@pytest.fixture(autouse=True)
+def _no_backoff(monkeypatch):
+    """Skip retry backoff delays so error-path tests stay fast."""
+    monkeypatch.setattr(RetryPolicy, "backoff", lambda self, attempt, error=None: 0.0)
@@ -0,0 +1,222 @@
+"""Tests for kie_core.batch — essential + comprehensive."""
+
+import asyncio
+import json
+import threading
+
+import httpx
+import pytest
+import respx
+
+from kie_core.batch import (
+    BatchResult,
+    extract_many,
+    extract_many_async,
+    extract_schemas,
+    extract_schemas_async,
+)
+from kie_core.client import AsyncKIEClient, KIEClient
+from kie_core.document import prepare_document
+
+MOCK_ENDPOINT = "http://testserver/v1/extract"
+
+
+@pytest.fixture()
+def sample_images(tmp_path):
+    """Create several minimal PNG-like files."""
+    paths = []
+    for i in range(5):
+        img = tmp_path / f"doc{i}.png"
+        img.write_bytes(b"\x89PNG\r\n\x1a\n" + bytes([i]) * 100)
+        paths.append(str(img))
+    return paths
+
+
+# ── essential ─────────────────────────────────────────────────────────
+
+
+class TestExtractManyEssential:
+    """Core batch tests."""
+
+    @respx.mock
+    def test_sync_all_succeed(self, sample_images, mock_result):
+        respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        results = list(
+            extract_many(sample_images, {"x": "string"}, endpoint=MOCK_ENDPOINT)
+        )
+        assert sorted(r.index for r in results) == list(range(5))
+        assert all(r.ok and r.result == mock_result for r in results)
+
+    @respx.mock
+    async def test_async_all_succeed(self, sample_images, mock_result):
+        respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        results = [
+            r
+            async for r in extract_many_async(
+                sample_images, {"x": "string"}, endpoint=MOCK_ENDPOINT
+            )
+        ]
+        assert sorted(r.index for r in results) == list(range(5))
+        assert all(r.ok for r in results)
+
+    @respx.mock
+    def test_errors_collected_per_item(self, sample_images, mock_result):
+        respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        paths = sample_images[:2] + ["/no/such/file.png"]
+        results = {r.index: r for r in extract_many(paths, {}, endpoint=MOCK_ENDPOINT)}
+        assert results[0].ok and results[1].ok
+        assert isinstance(results[2].error, FileNotFoundError)
+        assert results[2].result is None
+        assert results[2].document_path == "/no/such/file.png"
+
+
+# ── comprehensive ─────────────────────────────────────────────────────
+
+
+class TestExtractManyComprehensive:
+    """Concurrency bounds and edge cases."""
+
+    def test_invalid_concurrency(self, sample_images):
+        with pytest.raises(ValueError, match="concurrency"):
+            list(extract_many(sample_images, {}, concurrency=0))
+
+    def test_empty_input(self):
+        assert list(extract_many([], {})) == []
+
+    def test_sync_concurrency_bound(self, sample_images):
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        class Recording(KIEClient):
+            def extract_document(self, *args, **kwargs):
+                with lock:
+                    state["active"] += 1
+                    state["peak"] = max(state["peak"], state["active"])
+                threading.Event().wait(0.02)
+                with lock:
+                    state["active"] -= 1
+                return {}
+
+        with Recording() as client:
+            results = list(
+                extract_many(sample_images * 3, {}, concurrency=2, client=client)
+            )
+        assert len(results) == 15
+        assert state["peak"] <= 2
+
+    async def test_async_concurrency_bound(self, sample_images):
+        state = {"active": 0, "peak": 0}
+
+        class Recording(AsyncKIEClient):
+            async def extract_document(self, *args, **kwargs):
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+                await asyncio.sleep(0.01)
+                state["active"] -= 1
+                return {}
+
+        async with Recording() as client:
+            results = [
+                r
+                async for r in extract_many_async(
+                    sample_images * 3, {}, concurrency=3, client=client
+                )
+            ]
+        assert len(results) == 15
+        assert state["peak"] == 3
+
+    @respx.mock
+    async def test_async_errors_collected(self, sample_images):
+        respx.post(MOCK_ENDPOINT).mock(return_value=httpx.Response(500, text="boom"))
+        results = [
+            r
+            async for r in extract_many_async(
+                sample_images[:2], {}, endpoint=MOCK_ENDPOINT
+            )
+        ]
+        assert all(isinstance(r.error, RuntimeError) for r in results)
+
+    def test_schema_loaded_once(self, sample_images):
+        with pytest.raises(ValueError, match="Invalid JSON schema"):
+            list(extract_many(sample_images, "{bad json"))
+
+    def test_batch_result_ok(self):
+        assert BatchResult(0, "a", result={}).ok
+        assert not BatchResult(0, "a", error=RuntimeError()).ok
+
+
+# ── multiple schemas ──────────────────────────────────────────────────
+
+SCHEMAS = {
+    "header": {"vendor_name": "string"},
+    "totals": {"total_amount": "number"},
+    "lines": {"line_items": [{"description": "string"}]},
+}
+
+
+def _echo_schema(request):
+    return httpx.Response(200, json=json.loads(request.content)["schema"])
+
+
+class TestExtractSchemas:
+    """One document, several schemas, one encoding."""
+
+    @respx.mock
+    def test_sync_results_by_name(self, sample_images):
+        respx.post(MOCK_ENDPOINT).mock(side_effect=_echo_schema)
+        results = extract_schemas(sample_images[0], SCHEMAS, endpoint=MOCK_ENDPOINT)
+        assert list(results) == list(SCHEMAS)
+        assert results == SCHEMAS
+
+    @respx.mock
+    async def test_async_results_by_name(self, sample_images):
+        respx.post(MOCK_ENDPOINT).mock(side_effect=_echo_schema)
+        results = await extract_schemas_async(
+            prepare_document(sample_images[0]), SCHEMAS, endpoint=MOCK_ENDPOINT
+        )
+        assert results == SCHEMAS
+
+    def test_document_read_once(self, sample_images, monkeypatch):
+        import kie_core.batch as batch
+
+        calls = []
+        monkeypatch.setattr(
+            batch,
+            "prepare_document",
+            lambda path: calls.append(path) or prepare_document(path),
+        )
+
+        class Recording(KIEClient):
+            def extract_document(self, document, schema, **kwargs):
+                assert document.doc_type == "image"
+                return schema
+
+        with Recording() as client:
+            extract_schemas(sample_images[0], SCHEMAS, client=client)
+        assert calls == [sample_images[0]]
+
+    @respx.mock
+    async def test_async_failure_raises(self, sample_images):
+        respx.post(MOCK_ENDPOINT).mock(return_value=httpx.Response(400, text="bad"))
+        with pytest.raises(RuntimeError, match="400"):
+            await extract_schemas_async(
+                sample_images[0], SCHEMAS, endpoint=MOCK_ENDPOINT
+            )
+
+    def test_invalid_concurrency(self, sample_images):
+        with pytest.raises(ValueError, match="concurrency"):
+            extract_schemas(sample_images[0], SCHEMAS, concurrency=0)
+
+    @respx.mock
+    def test_document_bytes(self, sample_images):
+        respx.post(MOCK_ENDPOINT).mock(side_effect=_echo_schema)
+        with open(sample_images[0], "rb") as f:
+            data = f.read()
+        results = extract_schemas(data, SCHEMAS, endpoint=MOCK_ENDPOINT)
+        assert results == SCHEMAS
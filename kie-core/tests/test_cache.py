@@ -0,0 +1,185 @@
+"""Tests for kie_core.cache — essential + comprehensive."""
+
+import httpx
+import pytest
+import respx
+
+from kie_core.cache import MemoryCache, SQLiteCache, cache_key
+from kie_core.client import (
+    AsyncKIEClient,
+    KIEClient,
+    extract_document,
+    get_default_client,
+    set_default_cache,
+)
+from kie_core.document import encode_document
+
+MOCK_ENDPOINT = "http://testserver/v1/extract"
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cache(request, tmp_path):
+    """Each cache backend, empty."""
+    if request.param == "memory":
+        yield MemoryCache()
+    else:
+        backend = SQLiteCache(tmp_path / "cache" / "results.db")
+        yield backend
+        backend.close()
+
+
+# ── essential ─────────────────────────────────────────────────────────
+
+
+class TestCacheEssential:
+    """Backend behaviour and client integration."""
+
+    def test_get_set(self, cache, mock_result):
+        assert cache.get("k") is None
+        cache.set("k", mock_result)
+        assert cache.get("k") == mock_result
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+        assert cache.stats.hit_rate == 0.5
+
+    @respx.mock
+    def test_extract_document_hits_cache(self, cache, sample_image, mock_result):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        with KIEClient(MOCK_ENDPOINT, cache=cache) as client:
+            first = client.extract_document(str(sample_image), {"x": "string"})
+            second = client.extract_document(str(sample_image), {"x": "string"})
+        assert first == second == mock_result
+        assert route.call_count == 1
+        assert cache.stats.hits == 1
+
+    @respx.mock
+    async def test_async_extract_hits_cache(self, cache, mock_result):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        async with AsyncKIEClient(MOCK_ENDPOINT, cache=cache) as client:
+            await client.extract("aGVsbG8=", "image", {"x": "string"})
+            result = await client.extract("aGVsbG8=", "image", {"x": "string"})
+        assert result == mock_result
+        assert route.call_count == 1
+
+
+# ── comprehensive ─────────────────────────────────────────────────────
+
+
+class TestCacheKey:
+    """Key derivation."""
+
+    def test_schema_key_order_ignored(self):
+        assert cache_key("d", {"a": "string", "b": "number"}) == cache_key(
+            "d", {"b": "number", "a": "string"}
+        )
+
+    @pytest.mark.parametrize(
+        "other",
+        [
+            ("d2", {"a": "string"}, None),
+            ("d", {"a": "number"}, None),
+            ("d", {"a": "string"}, "m"),
+        ],
+    )
+    def test_inputs_change_key(self, other):
+        assert cache_key("d", {"a": "string"}) != cache_key(*other)
+
+
+class TestCacheComprehensive:
+    """Eviction, expiry, and sharing across entry points."""
+
+    def test_memory_lru_eviction(self):
+        cache = MemoryCache(max_entries=2)
+        cache.set("a", {"v": 1})
+        cache.set("b", {"v": 2})
+        cache.get("a")
+        cache.set("c", {"v": 3})
+        assert cache.get("b") is None
+        assert cache.get("a") == {"v": 1}
+        assert len(cache) == 2
+
+    def test_memory_ttl(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr("kie_core.cache.time.monotonic", lambda: now[0])
+        cache = MemoryCache(ttl=10)
+        cache.set("a", {"v": 1})
+        now[0] += 11
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_sqlite_ttl(self, tmp_path, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr("kie_core.cache.time.time", lambda: now[0])
+        cache = SQLiteCache(tmp_path / "c.db", ttl=10)
+        cache.set("a", {"v": 1})
+        now[0] += 11
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_sqlite_persists(self, tmp_path):
+        SQLiteCache(tmp_path / "c.db").set("a", {"名前": "値"})
+        assert SQLiteCache(tmp_path / "c.db").get("a") == {"名前": "値"}
+
+    def test_memory_returns_copies(self):
+        cache = MemoryCache()
+        value = {"items": [1]}
+        cache.set("a", value)
+        value["items"].append(2)
+        cache.get("a")["items"].append(3)
+        assert cache.get("a") == {"items": [1]}
+
+    def test_clear(self, cache):
+        cache.set("a", {})
+        cache.clear()
+        assert cache.get("a") is None
+
+    @respx.mock
+    def test_extract_and_extract_document_share_entries(self, sample_image):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json={"a": 1})
+        )
+        with KIEClient(MOCK_ENDPOINT, cache=MemoryCache()) as client:
+            client.extract_document(str(sample_image), {"a": "number"})
+            client.extract(*encode_document(sample_image), {"a": "number"})
+        assert route.call_count == 1
+
+    @respx.mock
+    def test_model_is_part_of_key(self, sample_image):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json={})
+        )
+        with KIEClient(MOCK_ENDPOINT, cache=MemoryCache()) as client:
+            client.extract_document(str(sample_image), {}, model="m1")
+            client.extract_document(str(sample_image), {}, model="m2")
+        assert route.call_count == 2
+
+    @respx.mock
+    def test_errors_not_cached(self, sample_image):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            side_effect=[httpx.Response(400), httpx.Response(200, json={})]
+        )
+        cache = MemoryCache()
+        with KIEClient(MOCK_ENDPOINT, cache=cache) as client:
+            with pytest.raises(RuntimeError):
+                client.extract_document(str(sample_image), {})
+            assert client.extract_document(str(sample_image), {}) == {}
+        assert route.call_count == 2
+
+    @respx.mock
+    def test_set_default_cache(self, sample_image):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json={})
+        )
+        cache = MemoryCache()
+        set_default_cache(cache)
+        try:
+            assert get_default_client().cache is cache
+            extract_document(str(sample_image), {}, endpoint=MOCK_ENDPOINT)
+            extract_document(str(sample_image), {}, endpoint=MOCK_ENDPOINT)
+        finally:
+            set_default_cache(None)
+        assert route.call_count == 1
+        assert get_default_client().cache is None
@@ -1,21 +1,40 @@
 """Tests for kie_core.client — essential + comprehensive."""
 
+import asyncio
+import base64
+import io
 import json
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.parser import BytesParser
+from unittest.mock import patch
 
 import httpx
 import pytest
 import respx
 
+from kie_core import client as client_module
 from kie_core.client import (
     DEFAULT_ENDPOINT,
+    AsyncKIEClient,
+    KIEClient,
     _build_payload,
+    _MultipartPayload,
+    _PreparedPayload,
+    _StreamingPayload,
     extract,
     extract_async,
     extract_document,
     extract_document_async,
+    get_default_async_client,
+    get_default_client,
     get_endpoint,
 )
+from kie_core.cache import MemoryCache, SQLiteCache
+from kie_core.retry import NO_RETRY
+from kie_core.document import encode_document, prepare_document
 
 MOCK_ENDPOINT = "http://testserver/v1/extract"
 
@@ -211,6 +230,771 @@ class TestExtractDocument:
             extract_document("/no/such/file.png", {"x": "string"})
 
 
+# ── pooled clients ────────────────────────────────────────────────────
+
+
+class TestKIEClient:
+    """Tests for the long-lived pooled clients."""
+
+    @respx.mock
+    def test_reuses_connection_pool(self, mock_result):
+        respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        with KIEClient(MOCK_ENDPOINT) as client:
+            pool = client._http
+            assert client.extract("b64", "image", {"x": "string"}) == mock_result
+            assert client.extract("b64", "image", {"x": "string"}) == mock_result
+            assert client._http is pool
+        assert client.is_closed
+
+    @respx.mock
+    def test_per_call_endpoint_override(self):
+        other = "http://other/v1/extract"
+        route = respx.post(other).mock(return_value=httpx.Response(200, json={}))
+        with KIEClient(MOCK_ENDPOINT) as client:
+            client.extract("b64", "image", {}, endpoint=other)
+        assert route.called
+
+    @respx.mock
+    def test_extract_document(self, sample_image, mock_result):
+        respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        with KIEClient(MOCK_ENDPOINT) as client:
+            result = client.extract_document(str(sample_image), '{"x": "string"}')
+        assert result == mock_result
+
+    @respx.mock
+    def test_error_translation(self):
+        respx.post(MOCK_ENDPOINT).mock(return_value=httpx.Response(503, text="busy"))
+        with KIEClient(MOCK_ENDPOINT) as client:
+            with pytest.raises(RuntimeError, match="API request failed.*503"):
+                client.extract("b64", "image", {})
+
+    def test_pool_limits(self):
+        with KIEClient(max_connections=7, max_keepalive_connections=3) as client:
+            pool = client._http._transport._pool
+            assert pool._max_connections == 7
+            assert pool._max_keepalive_connections == 3
+
+    def test_default_client_is_shared(self):
+        assert get_default_client() is get_default_client()
+
+    def test_default_client_recreated_after_close(self):
+        client = get_default_client()
+        client.close()
+        assert get_default_client() is not client
+
+    @respx.mock
+    async def test_async_client(self, sample_image, mock_result):
+        respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        async with AsyncKIEClient(MOCK_ENDPOINT) as client:
+            assert await client.extract("b64", "image", {}) == mock_result
+            result = await client.extract_document(str(sample_image), {"x": "string"})
+        assert result == mock_result
+        assert client.is_closed
+
+    async def test_default_async_client_is_per_loop(self):
+        assert get_default_async_client() is get_default_async_client()
+
+
+# ── streaming uploads ─────────────────────────────────────────────────
+
+
+class TestStreamingUpload:
+    """Large documents are streamed from disk instead of encoded in memory."""
+
+    def test_body_matches_json_payload(self, sample_pdf):
+        schema = {"vendor": "string", "名前": "string"}
+        body = _StreamingPayload(sample_pdf, schema, model="m1", chunk_size=4)
+        raw = b"".join(body)
+        doc_base64, doc_type = encode_document(sample_pdf)
+        assert json.loads(raw) == _build_payload(doc_base64, doc_type, schema, "m1")
+        assert len(raw) == body.content_length
+
+    def test_body_is_reiterable(self, sample_image):
+        body = _StreamingPayload(sample_image, {})
+        assert b"".join(body) == b"".join(body)
+
+    @respx.mock
+    def test_sync_streams_above_threshold(self, sample_pdf, mock_result):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        with KIEClient(MOCK_ENDPOINT, stream_threshold=1) as client:
+            result = client.extract_document(str(sample_pdf), {"x": "string"})
+        assert result == mock_result
+        request = route.calls[0].request
+        assert "transfer-encoding" not in request.headers
+        payload = json.loads(request.read())
+        assert payload["document"]["type"] == "pdf"
+        assert payload["schema"] == {"x": "string"}
+
+    @respx.mock
+    async def test_async_streams_above_threshold(self, sample_image, mock_result):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        async with AsyncKIEClient(MOCK_ENDPOINT, stream_threshold=1) as client:
+            result = await client.extract_document(str(sample_image), {})
+        assert result == mock_result
+        payload = json.loads(await route.calls[0].request.aread())
+        assert payload["document"]["content"] == encode_document(sample_image)[0]
+
+    def test_streaming_missing_file(self):
+        with KIEClient(stream_threshold=0) as client:
+            with pytest.raises(FileNotFoundError, match="Document not found"):
+                client.extract_document("/no/such/file.pdf", {})
+
+
+# ── prepared documents ────────────────────────────────────────────────
+
+
+class TestPreparedUpload:
+    """A PreparedDocument is sent without re-encoding."""
+
+    def test_body_matches_json_payload(self, sample_pdf):
+        schema = {"vendor": "string", "名前": "string"}
+        prepared = prepare_document(sample_pdf)
+        body = _PreparedPayload(prepared, schema, model="m1")
+        raw = b"".join(body)
+        doc_base64, doc_type = encode_document(sample_pdf)
+        assert json.loads(raw) == _build_payload(doc_base64, doc_type, schema, "m1")
+        assert len(raw) == body.content_length
+
+    @respx.mock
+    def test_sync_extract_prepared(self, sample_image, mock_result):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        prepared = prepare_document(sample_image)
+        with KIEClient(MOCK_ENDPOINT) as client:
+            for schema in ({"a": "string"}, {"b": "number"}):
+                assert client.extract_document(prepared, schema) == mock_result
+        payloads = [json.loads(call.request.read()) for call in route.calls]
+        assert [p["schema"] for p in payloads] == [{"a": "string"}, {"b": "number"}]
+        assert all(p["document"]["content"] == prepared.doc_base64 for p in payloads)
+
+    @respx.mock
+    async def test_async_extract_prepared(self, sample_pdf, mock_result):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        prepared = prepare_document(sample_pdf)
+        async with AsyncKIEClient(MOCK_ENDPOINT) as client:
+            result = await client.extract_document(prepared, {}, model="m1")
+        assert result == mock_result
+        payload = json.loads(await route.calls[0].request.aread())
+        assert payload["document"]["type"] == "pdf"
+        assert payload["options"] == {"model": "m1"}
+
+    @respx.mock
+    def test_prepared_shares_cache_with_path(self, sample_image, mock_result):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        with KIEClient(MOCK_ENDPOINT, cache=MemoryCache()) as client:
+            client.extract_document(str(sample_image), {"x": "string"})
+            client.extract_document(prepare_document(sample_image), {"x": "string"})
+        assert route.call_count == 1
+
+
+# ── multipart uploads ─────────────────────────────────────────────────
+
+
+def _parse_multipart(request: httpx.Request) -> dict:
+    """Return ``{part name: (payload bytes, content type)}`` for a request."""
+    header = f"Content-Type: {request.headers['content-type']}\r\n\r\n".encode()
+    message = BytesParser().parsebytes(header + request.content)
+    return {
+        part.get_param("name", header="content-disposition"): (
+            part.get_payload(decode=True),
+            part.get_content_type(),
+        )
+        for part in message.get_payload()
+    }
+
+
+class TestMultipartUpload:
+    """Raw-bytes uploads with fallback to the JSON envelope."""
+
+    def test_body_parts(self, sample_pdf):
+        schema = {"名前": "string"}
+        body = _MultipartPayload(sample_pdf, schema, model="m1", chunk_size=4)
+        request = httpx.Request(
+            "POST", MOCK_ENDPOINT, content=b"".join(body), headers=body.headers
+        )
+        parts = _parse_multipart(request)
+        assert parts["document"] == (sample_pdf.read_bytes(), "application/pdf")
+        assert json.loads(parts["schema"][0]) == schema
+        assert parts["type"][0] == b"pdf"
+        assert parts["model"][0] == b"m1"
+        assert len(request.content) == body.content_length
+
+    def test_prepared_body_sends_raw_bytes(self, sample_image):
+        body = _MultipartPayload(prepare_document(sample_image), {})
+        request = httpx.Request(
+            "POST", MOCK_ENDPOINT, content=b"".join(body), headers=body.headers
+        )
+        parts = _parse_multipart(request)
+        assert parts["document"][0] == sample_image.read_bytes()
+        assert "model" not in parts
+
+    @respx.mock
+    def test_sync_multipart(self, sample_image, mock_result):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        with KIEClient(MOCK_ENDPOINT, upload="multipart") as client:
+            assert client.extract_document(str(sample_image), {}) == mock_result
+        request = route.calls[0].request
+        assert request.headers["content-type"].startswith("multipart/form-data")
+        assert _parse_multipart(request)["document"][0] == sample_image.read_bytes()
+
+    @respx.mock
+    async def test_async_multipart(self, sample_pdf, mock_result):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        async with AsyncKIEClient(MOCK_ENDPOINT, upload="multipart") as client:
+            assert await client.extract_document(str(sample_pdf), {}) == mock_result
+        request = route.calls[0].request
+        await request.aread()
+        assert _parse_multipart(request)["type"][0] == b"pdf"
+
+    @respx.mock
+    def test_falls_back_to_json_and_sticks(self, sample_image, mock_result):
+        def handler(request):
+            if request.headers["content-type"].startswith("multipart/"):
+                return httpx.Response(415, text="unsupported")
+            return httpx.Response(200, json=mock_result)
+
+        route = respx.post(MOCK_ENDPOINT).mock(side_effect=handler)
+        with KIEClient(MOCK_ENDPOINT, upload="multipart") as client:
+            assert client.extract_document(str(sample_image), {}) == mock_result
+            assert client.extract_document(str(sample_image), {}) == mock_result
+        types = [c.request.headers["content-type"] for c in route.calls]
+        assert types[0].startswith("multipart/")
+        assert types[1:] == ["application/json", "application/json"]
+
+    @respx.mock
+    async def test_async_falls_back_to_json(self, sample_image, mock_result):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            side_effect=[
+                httpx.Response(400, text="Unsupported content type"),
+                httpx.Response(200, json=mock_result),
+            ]
+        )
+        async with AsyncKIEClient(MOCK_ENDPOINT, upload="multipart") as client:
+            assert await client.extract_document(str(sample_image), {}) == mock_result
+        payload = json.loads(await route.calls[1].request.aread())
+        assert payload["document"]["type"] == "image"
+
+    @respx.mock
+    def test_failed_fallback_keeps_multipart(self, sample_image):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(415, text="unsupported")
+        )
+        with KIEClient(MOCK_ENDPOINT, upload="multipart") as client:
+            with pytest.raises(RuntimeError, match="415"):
+                client.extract_document(str(sample_image), {})
+            assert not client._multipart_rejected
+        assert route.call_count == 2
+
+    @respx.mock
+    @pytest.mark.parametrize("status", [400, 404, 422])
+    def test_validation_error_not_a_rejection(self, sample_image, status):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(status, text="total: bad schema")
+        )
+        with KIEClient(MOCK_ENDPOINT, upload="multipart") as client:
+            with pytest.raises(RuntimeError, match=str(status)):
+                client.extract_document(str(sample_image), {})
+            assert not client._multipart_rejected
+        assert route.call_count == 1
+
+    @respx.mock
+    def test_file_object_falls_back_to_json(self, sample_image, mock_result):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            side_effect=[
+                httpx.Response(415, text="unsupported"),
+                httpx.Response(200, json=mock_result),
+            ]
+        )
+        document = sample_image.read_bytes()
+        source = io.BytesIO(b"skip" + document)
+        source.seek(4)
+        with KIEClient(MOCK_ENDPOINT, upload="multipart") as client:
+            assert client.extract_document(source, {}) == mock_result
+            assert client._multipart_rejected
+        payload = json.loads(route.calls[1].request.read())
+        assert base64.b64decode(payload["document"]["content"]) == document
+
+    @respx.mock
+    async def test_async_iterator_has_no_fallback(self, sample_image):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(415, text="unsupported")
+        )
+
+        async def chunks():
+            yield sample_image.read_bytes()
+
+        async with AsyncKIEClient(MOCK_ENDPOINT, upload="multipart") as client:
+            with pytest.raises(RuntimeError, match="415"):
+                await client.extract_document(chunks(), {})
+        assert route.call_count == 1
+
+    @respx.mock
+    def test_server_error_not_a_rejection(self, sample_image):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(500, text="boom")
+        )
+        with KIEClient(MOCK_ENDPOINT, upload="multipart", retry=NO_RETRY) as client:
+            with pytest.raises(RuntimeError, match="500"):
+                client.extract_document(str(sample_image), {})
+        assert route.call_count == 1
+
+    def test_invalid_upload_mode(self):
+        with pytest.raises(ValueError, match="upload"):
+            KIEClient(upload="xml")
+
+    def test_multipart_missing_file(self):
+        with KIEClient(upload="multipart") as client:
+            with pytest.raises(FileNotFoundError, match="Document not found"):
+                client.extract_document("/no/such/file.pdf", {})
+
+
+# ── in-memory and streamed inputs ─────────────────────────────────────
+
+
+class _OneShot(io.RawIOBase):
+    """A readable, non-seekable stream, like a socket or pipe."""
+
+    def __init__(self, data: bytes) -> None:
+        self._data = io.BytesIO(data)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        chunk = self._data.read(len(buffer))
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+
+async def _achunks(data: bytes, size: int = 5):
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+class TestDocumentInputs:
+    """Bytes, file objects and async iterators are streamed, not written to disk."""
+
+    @pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview, io.BytesIO])
+    @respx.mock
+    def test_sync_inputs(self, sample_pdf, mock_result, wrap):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        with KIEClient(MOCK_ENDPOINT) as client:
+            result = client.extract_document(wrap(sample_pdf.read_bytes()), {})
+        assert result == mock_result
+        request = route.calls[0].request
+        assert "content-length" in request.headers
+        payload = json.loads(request.read())
+        assert payload["document"] == {
+            "content": encode_document(sample_pdf)[0],
+            "type": "pdf",
+        }
+
+    @respx.mock
+    def test_one_shot_stream_is_chunked(self, sample_image, mock_result):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        with KIEClient(MOCK_ENDPOINT) as client:
+            client.extract_document(_OneShot(sample_image.read_bytes()), {})
+        request = route.calls[0].request
+        assert request.headers["transfer-encoding"] == "chunked"
+        payload = json.loads(request.read())
+        assert payload["document"]["content"] == encode_document(sample_image)[0]
+        assert payload["document"]["type"] == "image"
+
+    @respx.mock
+    def test_one_shot_stream_not_retried(self, sample_image):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(503, text="busy")
+        )
+        with KIEClient(MOCK_ENDPOINT) as client:
+            with pytest.raises(RuntimeError, match="503"):
+                client.extract_document(_OneShot(sample_image.read_bytes()), {})
+        assert route.call_count == 1
+
+    @respx.mock
+    def test_seekable_stream_retried(self, sample_image, mock_result):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            side_effect=[
+                httpx.Response(503, text="busy"),
+                httpx.Response(200, json=mock_result),
+            ]
+        )
+        stream = io.BytesIO(b"junk" + sample_image.read_bytes())
+        stream.seek(4)
+        with KIEClient(MOCK_ENDPOINT) as client:
+            assert client.extract_document(stream, {}) == mock_result
+        bodies = [json.loads(call.request.read()) for call in route.calls]
+        assert bodies[0] == bodies[1]
+        assert bodies[1]["document"]["content"] == encode_document(sample_image)[0]
+
+    @respx.mock
+    async def test_async_iterator(self, sample_pdf, mock_result):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        async with AsyncKIEClient(MOCK_ENDPOINT) as client:
+            result = await client.extract_document(
+                _achunks(sample_pdf.read_bytes()), {"x": "string"}
+            )
+        assert result == mock_result
+        payload = json.loads(await route.calls[0].request.aread())
+        assert payload["document"]["content"] == encode_document(sample_pdf)[0]
+        assert payload["document"]["type"] == "pdf"
+        assert payload["schema"] == {"x": "string"}
+
+    @respx.mock
+    async def test_async_iterator_multipart(self, sample_image, mock_result):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        async with AsyncKIEClient(MOCK_ENDPOINT, upload="multipart") as client:
+            await client.extract_document(_achunks(sample_image.read_bytes()), {})
+        request = route.calls[0].request
+        await request.aread()
+        parts = _parse_multipart(request)
+        assert parts["document"][0] == sample_image.read_bytes()
+        assert parts["type"][0] == b"image"
+
+    @respx.mock
+    def test_bytes_multipart(self, sample_image, mock_result):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        with KIEClient(MOCK_ENDPOINT, upload="multipart") as client:
+            client.extract_document(sample_image.read_bytes(), {})
+        parts = _parse_multipart(route.calls[0].request)
+        assert parts["document"][0] == sample_image.read_bytes()
+
+    def test_sync_client_rejects_async_iterator(self, sample_image):
+        with KIEClient(MOCK_ENDPOINT) as client:
+            with pytest.raises(TypeError, match="AsyncKIEClient"):
+                client.extract_document(_achunks(b"data"), {})
+
+    @respx.mock
+    def test_bytes_share_cache_with_path(self, sample_image, mock_result):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        with KIEClient(MOCK_ENDPOINT, cache=MemoryCache()) as client:
+            client.extract_document(str(sample_image), {})
+            client.extract_document(sample_image.read_bytes(), {})
+            client.extract_document(io.BytesIO(sample_image.read_bytes()), {})
+        assert route.call_count == 1
+
+
+# ── event-loop offloading ─────────────────────────────────────────────
+
+
+class _RecordingExecutor(ThreadPoolExecutor):
+    """Thread pool that remembers the name of every function it runs."""
+
+    def __init__(self):
+        super().__init__(max_workers=2)
+        self.calls = []
+
+    def submit(self, fn, /, *args, **kwargs):
+        self.calls.append(fn.__name__)
+        return super().submit(fn, *args, **kwargs)
+
+
+class TestOffload:
+    """Large documents are read and encoded off the event loop."""
+
+    @pytest.mark.parametrize("upload", ["json", "multipart"])
+    @respx.mock
+    async def test_large_documents_offloaded(self, sample_pdf, mock_result, upload):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        executor = _RecordingExecutor()
+        async with AsyncKIEClient(
+            MOCK_ENDPOINT,
+            stream_threshold=1,
+            offload_threshold=1,
+            executor=executor,
+            upload=upload,
+        ) as client:
+            assert await client.extract_document(sample_pdf, {}) == mock_result
+        executor.shutdown()
+        assert executor.calls[:2] == ["_document_digest", "_upload_requests"]
+        assert "next" in executor.calls  # body chunks
+        document = (
+            sample_pdf.read_bytes()
+            if upload == "multipart"
+            else encode_document(sample_pdf)[0].encode()
+        )
+        assert document in await route.calls[0].request.aread()
+
+    @respx.mock
+    async def test_small_documents_inline(self, sample_image, mock_result):
+        respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        executor = _RecordingExecutor()
+        async with AsyncKIEClient(MOCK_ENDPOINT, executor=executor) as client:
+            await client.extract_document(sample_image, {})
+            await client.extract_document(sample_image.read_bytes(), {"x": "string"})
+        executor.shutdown()
+        assert executor.calls == []
+
+    @respx.mock
+    async def test_unknown_size_streams_offloaded(self, sample_image, mock_result):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        threads = set()
+        original = client_module._document_digest
+
+        def digest(document):
+            threads.add(threading.current_thread().name)
+            return original(document)
+
+        async with AsyncKIEClient(MOCK_ENDPOINT) as client:
+            with patch.object(client_module, "_document_digest", digest):
+                await client.extract_document(
+                    io.BytesIO(sample_image.read_bytes()), {}
+                )
+        assert [name.startswith("kie-io") for name in threads] == [True]
+        payload = json.loads(await route.calls[0].request.aread())
+        assert payload["document"]["content"] == encode_document(sample_image)[0]
+
+    @respx.mock
+    async def test_extract_offloaded(self, mock_result):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        executor = _RecordingExecutor()
+        async with AsyncKIEClient(
+            MOCK_ENDPOINT, offload_threshold=4, executor=executor
+        ) as client:
+            await client.extract("AAAA", "image", {"x": "string"})
+        executor.shutdown()
+        assert executor.calls == ["_digest_base64", "_serialize_payload"]
+        assert json.loads(route.calls[0].request.content)["document"] == {
+            "content": "AAAA",
+            "type": "image",
+        }
+
+    @respx.mock
+    async def test_persistent_cache_offloaded(self, tmp_path, mock_result):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        executor = _RecordingExecutor()
+        async with AsyncKIEClient(
+            MOCK_ENDPOINT, cache=SQLiteCache(tmp_path / "c.db"), executor=executor
+        ) as client:
+            for _ in range(2):
+                assert await client.extract("AAAA", "image", {}) == mock_result
+        executor.shutdown()
+        assert executor.calls == ["get", "set", "get"]
+        assert route.call_count == 1
+
+    @respx.mock
+    async def test_memory_cache_inline(self, mock_result):
+        respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        executor = _RecordingExecutor()
+        async with AsyncKIEClient(
+            MOCK_ENDPOINT, cache=MemoryCache(), executor=executor
+        ) as client:
+            await client.extract("AAAA", "image", {})
+        executor.shutdown()
+        assert executor.calls == []
+
+    @respx.mock
+    async def test_disabled(self, sample_pdf, mock_result):
+        respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        executor = _RecordingExecutor()
+        async with AsyncKIEClient(
+            MOCK_ENDPOINT,
+            stream_threshold=1,
+            offload_threshold=None,
+            executor=executor,
+        ) as client:
+            await client.extract_document(io.BytesIO(sample_pdf.read_bytes()), {})
+            await client.extract_document(sample_pdf, {})
+        executor.shutdown()
+        assert executor.calls == []
+
+
+# ── single-flight ─────────────────────────────────────────────────────
+
+
+def _slow(mock_result, delay=0.2):
+    def respond(request):
+        time.sleep(delay)
+        return httpx.Response(200, json=mock_result)
+
+    return respond
+
+
+class TestSingleFlight:
+    """Concurrent identical extractions share one request."""
+
+    @respx.mock
+    def test_threads_share_request(self, sample_image, mock_result):
+        route = respx.post(MOCK_ENDPOINT).mock(side_effect=_slow(mock_result))
+        results = []
+        with KIEClient(MOCK_ENDPOINT) as client:
+            threads = [
+                threading.Thread(
+                    target=lambda: results.append(
+                        client.extract_document(sample_image, {"x": "string"})
+                    )
+                )
+                for _ in range(5)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert route.call_count == 1
+        assert results == [mock_result] * 5
+        assert len({id(result) for result in results}) == 5
+
+    @respx.mock
+    async def test_tasks_share_request(self, sample_image, mock_result):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        async with AsyncKIEClient(MOCK_ENDPOINT) as client:
+            calls = [
+                client.extract_document(sample_image, {"x": "string"})
+                for _ in range(5)
+            ]
+            calls.append(
+                client.extract_document(sample_image.read_bytes(), {"x": "string"})
+            )
+            results = await asyncio.gather(*calls)
+        assert route.call_count == 1
+        assert results == [mock_result] * 6
+        results[0]["vendor_name"] = "changed"
+        assert results[1]["vendor_name"] == "Acme Corp"
+
+    @respx.mock
+    async def test_distinct_requests_not_merged(self, sample_image, sample_pdf):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json={})
+        )
+        async with AsyncKIEClient(MOCK_ENDPOINT) as client:
+            await asyncio.gather(
+                client.extract_document(sample_image, {"x": "string"}),
+                client.extract_document(sample_image, {"y": "string"}),
+                client.extract_document(sample_image, {"x": "string"}, model="m"),
+                client.extract_document(sample_pdf, {"x": "string"}),
+            )
+            await client.extract_document(sample_pdf, {"x": "string"})
+        assert route.call_count == 5
+
+    @respx.mock
+    def test_extract_key_not_decoded_without_cache(self, mock_result):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            side_effect=_slow(mock_result, delay=0.1)
+        )
+        with KIEClient(MOCK_ENDPOINT) as client:
+            with patch.object(client_module.base64, "b64decode") as decode:
+                with ThreadPoolExecutor(3) as pool:
+                    calls = [
+                        pool.submit(client.extract, "AAAA", "image", {})
+                        for _ in range(3)
+                    ]
+                    assert [call.result() for call in calls] == [mock_result] * 3
+        decode.assert_not_called()
+        assert route.call_count == 1
+
+    @respx.mock
+    async def test_disabled(self, sample_image):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json={})
+        )
+        async with AsyncKIEClient(MOCK_ENDPOINT, single_flight=False) as client:
+            await asyncio.gather(
+                *(client.extract_document(sample_image, {}) for _ in range(3))
+            )
+        assert route.call_count == 3
+
+    @respx.mock
+    async def test_error_shared_then_forgotten(self, sample_image, mock_result):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            side_effect=[httpx.Response(400), httpx.Response(200, json=mock_result)]
+        )
+        async with AsyncKIEClient(MOCK_ENDPOINT) as client:
+            results = await asyncio.gather(
+                *(client.extract_document(sample_image, {}) for _ in range(3)),
+                return_exceptions=True,
+            )
+            assert all(isinstance(r, RuntimeError) for r in results)
+            assert await client.extract_document(sample_image, {}) == mock_result
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_cancelled_caller_does_not_cancel_others(
+        self, sample_image, mock_result
+    ):
+        release = asyncio.Event()
+
+        async def respond(request):
+            await release.wait()
+            return httpx.Response(200, json=mock_result)
+
+        route = respx.post(MOCK_ENDPOINT).mock(side_effect=respond)
+        async with AsyncKIEClient(MOCK_ENDPOINT) as client:
+            first = asyncio.create_task(client.extract_document(sample_image, {}))
+            second = asyncio.create_task(client.extract_document(sample_image, {}))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            await asyncio.sleep(0.01)
+            release.set()
+            assert await second == mock_result
+        assert first.cancelled()
+        assert route.call_count == 1
+
+    @respx.mock
+    def test_with_cache(self, sample_image, mock_result):
+        route = respx.post(MOCK_ENDPOINT).mock(side_effect=_slow(mock_result, 0.1))
+        cache = MemoryCache()
+        with KIEClient(MOCK_ENDPOINT, cache=cache) as client:
+            threads = [
+                threading.Thread(
+                    target=client.extract_document, args=(sample_image, {})
+                )
+                for _ in range(3)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            client.extract_document(sample_image, {})
+        assert route.call_count == 1
+        assert cache.stats.hits == 1
+
+
 # ── get_endpoint ──────────────────────────────────────────────────────
 
 
@@ -1,10 +1,25 @@
 """Tests for kie_core.document — essential + comprehensive."""
 
 import base64
+import hashlib
+import io
+import json
+import os
+import threading
 
 import pytest
 
-from kie_core.document import encode_document
+from kie_core.document import (
+    PreparedDocument,
+    base64_length,
+    detect_document_type,
+    encode_document,
+    hash_document,
+    iter_base64,
+    iter_chunks,
+    prepare_document,
+    read_document,
+)
 
 
 # ── essential ─────────────────────────────────────────────────────────
@@ -79,3 +94,129 @@ class TestEncodeDocumentComprehensive:
         b64, doc_type = encode_document(f)
         assert doc_type == "image"
         assert len(b64) > 1_000_000
+
+
+# ── streaming ─────────────────────────────────────────────────────────
+
+
+class TestIterBase64:
+    """Chunked base64 encoding."""
+
+    @pytest.mark.parametrize("size", [0, 1, 2, 3, 4, 1000, 4097])
+    @pytest.mark.parametrize("chunk_size", [3, 4, 1024])
+    def test_matches_one_shot(self, tmp_path, size, chunk_size):
+        f = tmp_path / "doc.bin"
+        f.write_bytes(bytes(range(256)) * (size // 256) + bytes(range(size % 256)))
+        streamed = b"".join(iter_base64(f, chunk_size))
+        assert streamed == base64.b64encode(f.read_bytes())
+        assert len(streamed) == base64_length(size)
+
+    def test_not_found_raises(self):
+        with pytest.raises(FileNotFoundError, match="Document not found"):
+            list(iter_base64("/nonexistent/file.png"))
+
+    def test_detect_document_type(self, sample_pdf, sample_image):
+        assert detect_document_type(sample_pdf) == "pdf"
+        assert detect_document_type(sample_image) == "image"
+
+
+# ── memory-mapped reading ─────────────────────────────────────────────
+
+
+@pytest.fixture()
+def fifo(tmp_path):
+    """A named pipe fed with ``b"%PDF" + 10 KB`` from a writer thread."""
+    if not hasattr(os, "mkfifo"):
+        pytest.skip("named pipes not supported")
+    path = tmp_path / "doc.fifo"
+    os.mkfifo(path)
+    data = b"%PDF" + os.urandom(10_000)
+
+    def write():
+        with open(path, "wb") as f:
+            f.write(data)
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    yield path, data
+    writer.join()
+
+
+class TestMappedReading:
+    """Regular files are mapped; pipes and file objects are read."""
+
+    def test_regular_file_is_mapped(self, sample_pdf):
+        with read_document(sample_pdf) as data:
+            assert isinstance(data, memoryview)
+            assert data.readonly
+            assert bytes(data) == sample_pdf.read_bytes()
+
+    def test_empty_file_falls_back(self, tmp_path):
+        empty = tmp_path / "empty.png"
+        empty.write_bytes(b"")
+        with read_document(empty) as data:
+            assert data == b""
+        assert list(iter_chunks(empty)) == []
+
+    def test_chunks_are_views(self, sample_image):
+        chunks = [bytes(c) for c in iter_chunks(sample_image, chunk_size=7)]
+        assert all(len(c) <= 7 for c in chunks)
+        assert b"".join(chunks) == sample_image.read_bytes()
+
+    def test_file_object(self, sample_pdf):
+        raw = sample_pdf.read_bytes()
+        assert hash_document(io.BytesIO(raw)) == hashlib.sha256(raw).hexdigest()
+        assert b"".join(iter_base64(io.BytesIO(raw), 4)) == base64.b64encode(raw)
+
+    def test_pipe(self, fifo):
+        path, data = fifo
+        b64, doc_type = encode_document(path)
+        assert doc_type == "pdf"
+        assert base64.b64decode(b64) == data
+
+    def test_pipe_chunks(self, fifo):
+        path, data = fifo
+        assert b"".join(iter_base64(path, 1000)) == base64.b64encode(data)
+
+    def test_hash_matches_read_bytes(self, sample_image):
+        expected = hashlib.sha256(sample_image.read_bytes()).hexdigest()
+        assert hash_document(sample_image, chunk_size=5) == expected
+
+    def test_read_not_found(self):
+        with pytest.raises(FileNotFoundError, match="Document not found"):
+            with read_document("/nonexistent/file.pdf"):
+                pass
+
+
+# ── prepared documents ────────────────────────────────────────────────
+
+
+class TestPreparedDocument:
+    """Encode once, reuse the serialized fragment."""
+
+    def test_matches_encode_document(self, sample_pdf):
+        prepared = prepare_document(sample_pdf)
+        doc_base64, doc_type = encode_document(sample_pdf)
+        assert prepared.doc_base64 == doc_base64
+        assert prepared.doc_type == doc_type == "pdf"
+        assert prepared.size == sample_pdf.stat().st_size
+
+    def test_document_json_fragment(self, sample_image):
+        prepared = prepare_document(sample_image)
+        assert json.loads(prepared.document_json) == {
+            "content": encode_document(sample_image)[0],
+            "type": "image",
+        }
+
+    def test_digest(self, sample_image):
+        prepared = prepare_document(sample_image)
+        assert prepared.digest == hashlib.sha256(sample_image.read_bytes()).hexdigest()
+
+    def test_from_bytes_with_explicit_type(self):
+        prepared = PreparedDocument(b"", doc_type="pdf")
+        assert prepared.content == b""
+        assert json.loads(prepared.document_json) == {"content": "", "type": "pdf"}
+
+    def test_not_found_raises(self):
+        with pytest.raises(FileNotFoundError, match="Document not found"):
+            prepare_document("/nonexistent/file.pdf")
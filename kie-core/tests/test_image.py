@@ -0,0 +1,183 @@
+"""Tests for kie_core.image — essential + comprehensive."""
+
+import base64
+import io
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+import httpx
+import pytest
+import respx
+
+from kie_core import image as image_module
+from kie_core.client import AsyncKIEClient, KIEClient
+from kie_core.image import ImagePreprocessor
+
+Image = pytest.importorskip("PIL.Image")
+ImageOps = pytest.importorskip("PIL.ImageOps")
+
+MOCK_ENDPOINT = "http://testserver/v1/extract"
+
+
+def _photo(size=(1600, 1200), mode="RGB", fmt="PNG", exif=None):
+    """Encode a noisy image, so compression has something to do."""
+    img = Image.effect_noise(size, 64).convert(mode)
+    out = io.BytesIO()
+    options = {"exif": exif} if exif is not None else {}
+    img.save(out, format=fmt, **options)
+    return out.getvalue()
+
+
+def _uploaded(route):
+    """Decode the image the client sent."""
+    body = json.loads(route.calls[0].request.content)
+    return Image.open(io.BytesIO(base64.b64decode(body["document"]["content"])))
+
+
+# ── essential ─────────────────────────────────────────────────────────
+
+
+class TestImagePreprocessorEssential:
+    """Downscaling, recompression and reporting."""
+
+    def test_downscales_to_max_dimension(self):
+        result = ImagePreprocessor(1024).process(_photo())
+        with Image.open(io.BytesIO(result.data)) as img:
+            assert max(img.size) == 1024
+            assert img.size == (1024, 768)
+            assert img.format == "JPEG"
+        assert result.reencoded
+        assert result.bytes_saved == result.original_size - result.size > 0
+
+    def test_grayscale(self):
+        result = ImagePreprocessor(512, grayscale=True).process(_photo())
+        with Image.open(io.BytesIO(result.data)) as img:
+            assert img.mode == "L"
+
+    def test_webp(self):
+        result = ImagePreprocessor(512, format="webp", quality=60).process(_photo())
+        with Image.open(io.BytesIO(result.data)) as img:
+            assert img.format == "WEBP"
+
+    def test_stats_and_callback(self):
+        seen = []
+        preprocessor = ImagePreprocessor(800, on_result=seen.append)
+        preprocessor.process(_photo())
+        preprocessor.process(_photo((1200, 900)))
+        assert preprocessor.stats.documents == 2
+        assert preprocessor.stats.bytes_saved == sum(r.bytes_saved for r in seen)
+
+    @respx.mock
+    def test_client_uploads_preprocessed_image(self, tmp_path, mock_result):
+        path = tmp_path / "photo.png"
+        path.write_bytes(_photo())
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        preprocessor = ImagePreprocessor(1000)
+        with KIEClient(MOCK_ENDPOINT, preprocessor=preprocessor) as client:
+            assert client.extract_document(path, {"a": "string"}) == mock_result
+        assert max(_uploaded(route).size) == 1000
+        assert preprocessor.stats.documents == 1
+
+    @respx.mock
+    async def test_async_client_uses_executor(self, tmp_path, mock_result):
+        path = tmp_path / "photo.png"
+        path.write_bytes(_photo())
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        with ProcessPoolExecutor(1) as pool:
+            preprocessor = ImagePreprocessor(640, executor=pool)
+            async with AsyncKIEClient(
+                MOCK_ENDPOINT, preprocessor=preprocessor
+            ) as client:
+                await client.extract_document(str(path), {"a": "string"})
+        assert max(_uploaded(route).size) == 640
+        assert preprocessor.stats.bytes_saved > 0
+
+
+# ── comprehensive ─────────────────────────────────────────────────────
+
+
+class TestImagePreprocessorComprehensive:
+    """Edge cases."""
+
+    def test_strips_exif_and_applies_orientation(self):
+        exif = Image.Exif()
+        exif[0x0112] = 6  # rotate 90° clockwise on display
+        exif[0x010F] = "Camera maker"
+        data = _photo((400, 200), fmt="JPEG", exif=exif.tobytes())
+        result = ImagePreprocessor(quality=40).process(data)
+        with Image.open(io.BytesIO(result.data)) as img:
+            assert img.size == (200, 400)
+            assert not img.getexif()
+
+    def test_keeps_exif_when_asked(self):
+        exif = Image.Exif()
+        exif[0x010F] = "Camera maker"
+        data = _photo((400, 200), fmt="JPEG", exif=exif.tobytes())
+        result = ImagePreprocessor(quality=40, strip_exif=False).process(data)
+        with Image.open(io.BytesIO(result.data)) as img:
+            assert img.getexif()[0x010F] == "Camera maker"
+
+    def test_kept_exif_not_rotated_twice(self):
+        exif = Image.Exif()
+        exif[0x0112] = 6
+        exif[0x010F] = "Camera maker"
+        data = _photo((400, 200), fmt="JPEG", exif=exif.tobytes())
+        result = ImagePreprocessor(quality=40, strip_exif=False).process(data)
+        with Image.open(io.BytesIO(result.data)) as img:
+            assert img.getexif()[0x010F] == "Camera maker"
+            assert 0x0112 not in img.getexif()
+            assert ImageOps.exif_transpose(img).size == (200, 400)
+
+    def test_alpha_converted_for_jpeg(self):
+        result = ImagePreprocessor(256).process(_photo((512, 512), mode="RGBA"))
+        with Image.open(io.BytesIO(result.data)) as img:
+            assert img.mode == "RGB"
+
+    def test_keeps_original_when_not_smaller(self):
+        data = _photo((64, 64), fmt="JPEG")
+        result = ImagePreprocessor(quality=100).process(data)
+        assert not result.reencoded
+        assert result.data == data
+        assert result.bytes_saved == 0
+
+    def test_multi_page_tiff_passes_through(self):
+        pages = [Image.effect_noise((1200, 1200), 64).convert("RGB") for _ in range(3)]
+        out = io.BytesIO()
+        pages[0].save(out, format="TIFF", save_all=True, append_images=pages[1:])
+        data = out.getvalue()
+        preprocessor = ImagePreprocessor(max_dimension=600)
+        result = preprocessor.process(data)
+        assert not result.reencoded
+        assert result.data == data
+        assert preprocessor.process_document(data) == data
+
+    def test_undecodable_image_passes_through(self, sample_image):
+        data = sample_image.read_bytes()
+        preprocessor = ImagePreprocessor()
+        assert preprocessor.process_document(data) == data
+
+    def test_pdfs_and_streams_untouched(self, sample_pdf):
+        preprocessor = ImagePreprocessor()
+        assert preprocessor.process_document(sample_pdf) is sample_pdf
+        stream = io.BytesIO(_photo((64, 64)))
+        assert preprocessor.process_document(stream) is stream
+        assert preprocessor.stats.documents == 0
+
+    def test_missing_document_left_to_client(self, tmp_path):
+        missing = tmp_path / "missing.png"
+        assert ImagePreprocessor().process_document(missing) is missing
+
+    def test_invalid_options(self):
+        with pytest.raises(ValueError, match="format"):
+            ImagePreprocessor(format="GIF")
+        with pytest.raises(ValueError, match="quality"):
+            ImagePreprocessor(quality=0)
+
+    def test_missing_pillow(self, monkeypatch):
+        monkeypatch.setattr(image_module, "Image", None)
+        with pytest.raises(RuntimeError, match="Pillow is not installed"):
+            ImagePreprocessor()
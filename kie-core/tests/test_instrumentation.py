@@ -0,0 +1,275 @@
+"""Tests for kie_core.instrumentation — essential + comprehensive."""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+import respx
+
+from kie_core import instrumentation as instrumentation_module
+from kie_core.cache import MemoryCache
+from kie_core.client import AsyncKIEClient, KIEClient
+from kie_core.instrumentation import (
+    Instrumentation,
+    MultiInstrumentation,
+    OpenTelemetryInstrumentation,
+    PrometheusInstrumentation,
+    current_integration,
+    find_instrumentation,
+    get_instrumentation,
+    integration_scope,
+    set_instrumentation,
+)
+
+MOCK_ENDPOINT = "http://testserver/v1/extract"
+
+
+class Recording(Instrumentation):
+    """Keeps every event it receives."""
+
+    def __init__(self):
+        self.started = []
+        self.phases = []
+        self.attempts = []
+        self.finished = []
+
+    def extraction_started(self, ctx):
+        self.started.append(ctx)
+
+    def phase_finished(self, ctx, phase, start, duration):
+        self.phases.append((phase, duration))
+
+    def attempt_finished(self, ctx, attempt, start, duration, status, error):
+        self.attempts.append((attempt, status, error))
+
+    def extraction_finished(self, ctx):
+        self.finished.append(ctx)
+
+
+@pytest.fixture(autouse=True)
+def _global_instrumentation(monkeypatch):
+    """Start every test without global instrumentation and restore it after."""
+    monkeypatch.setattr(instrumentation_module, "_instrumentation", None)
+    monkeypatch.setattr(instrumentation_module, "_configured", True)
+
+
+@pytest.fixture()
+def local_server():
+    """A real HTTP server, so the transport reports its trace events."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers["Content-Length"]))
+            body = json.dumps({"vendor_name": "Acme Corp"}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/v1/extract"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+# ── essential ─────────────────────────────────────────────────────────
+
+
+class TestInstrumentationEssential:
+    """Hooks see phases, sizes, attempts and outcomes."""
+
+    @respx.mock
+    def test_phases_and_sizes(self, sample_image, mock_result):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        recording = Recording()
+        with KIEClient(MOCK_ENDPOINT, instrumentation=recording) as client:
+            client.extract_document(sample_image, {"a": "string"})
+        (ctx,) = recording.finished
+        assert recording.started == [ctx]
+        assert {"hash", "prepare", "parse"} <= set(ctx.phases)
+        assert ctx.operation == "extract_document"
+        assert ctx.outcome == "ok"
+        assert ctx.status == 200
+        assert ctx.request_bytes == len(route.calls[0].request.content)
+        assert ctx.response_bytes == len(route.calls[0].response.content)
+        assert ctx.duration >= sum(ctx.phases.values()) > 0
+
+    @respx.mock
+    def test_retries(self, sample_image, mock_result):
+        respx.post(MOCK_ENDPOINT).mock(
+            side_effect=[httpx.Response(503), httpx.Response(200, json=mock_result)]
+        )
+        recording = Recording()
+        with KIEClient(MOCK_ENDPOINT, instrumentation=recording) as client:
+            client.extract_document(sample_image, {"a": "string"})
+        assert [(n, status) for n, status, _ in recording.attempts] == [
+            (1, 503),
+            (2, 200),
+        ]
+        assert recording.finished[0].retries == 1
+
+    @respx.mock
+    def test_cache_hit(self, sample_image, mock_result):
+        respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        recording = Recording()
+        with KIEClient(
+            MOCK_ENDPOINT, cache=MemoryCache(), instrumentation=recording
+        ) as client:
+            client.extract_document(sample_image, {"a": "string"})
+            client.extract_document(sample_image, {"a": "string"})
+        assert [ctx.outcome for ctx in recording.finished] == ["ok", "cache_hit"]
+        assert recording.finished[1].attempts == 0
+
+    def test_transport_phases(self, sample_image, local_server):
+        recording = Recording()
+        with KIEClient(local_server, instrumentation=recording) as client:
+            client.extract_document(sample_image, {"a": "string"})
+        assert {"connect", "upload", "server", "download"} <= set(
+            recording.finished[0].phases
+        )
+
+    @respx.mock
+    def test_global_instrumentation_and_label(self, sample_image, mock_result):
+        respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        recording = Recording()
+        set_instrumentation(recording)
+        with KIEClient(MOCK_ENDPOINT) as client:
+            with integration_scope("mcp"):
+                assert current_integration() == "mcp"
+                client.extract_document(sample_image, {"a": "string"})
+            client.extract_document(sample_image, {"a": "number"})
+        assert [ctx.integration for ctx in recording.finished] == ["mcp", "core"]
+
+
+# ── comprehensive ─────────────────────────────────────────────────────
+
+
+class TestInstrumentationComprehensive:
+    """Errors, async paths, and the exporters."""
+
+    @respx.mock
+    def test_error_outcome(self, sample_image):
+        respx.post(MOCK_ENDPOINT).mock(return_value=httpx.Response(400))
+        recording = Recording()
+        with KIEClient(MOCK_ENDPOINT, instrumentation=recording) as client:
+            with pytest.raises(RuntimeError):
+                client.extract_document(sample_image, {"a": "string"})
+        (ctx,) = recording.finished
+        assert ctx.outcome == "error"
+        assert isinstance(ctx.error, RuntimeError)
+        assert recording.attempts[0][1] == 400
+
+    @respx.mock
+    async def test_async_shared_flight(self, sample_image, mock_result):
+        async def slow(request):
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json=mock_result)
+
+        respx.post(MOCK_ENDPOINT).mock(side_effect=slow)
+        recording = Recording()
+        async with AsyncKIEClient(MOCK_ENDPOINT, instrumentation=recording) as client:
+            await asyncio.gather(
+                client.extract_document(sample_image, {"a": "string"}),
+                client.extract_document(sample_image, {"a": "string"}),
+            )
+        assert sorted(ctx.outcome for ctx in recording.finished) == ["ok", "shared"]
+
+    @respx.mock
+    async def test_async_extract(self, mock_result):
+        respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        recording = Recording()
+        async with AsyncKIEClient(MOCK_ENDPOINT, instrumentation=recording) as client:
+            with integration_scope("langchain"):
+                await client.extract("AAAA", "image", {"a": "string"})
+        (ctx,) = recording.finished
+        assert (ctx.operation, ctx.integration, ctx.attempts) == (
+            "extract",
+            "langchain",
+            1,
+        )
+
+    @respx.mock
+    def test_prometheus(self, sample_image, mock_result):
+        prometheus_client = pytest.importorskip("prometheus_client")
+        respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        registry = prometheus_client.CollectorRegistry()
+        prometheus = PrometheusInstrumentation(registry)
+        with KIEClient(MOCK_ENDPOINT, instrumentation=prometheus) as client:
+            client.extract_document(sample_image, {"a": "string"})
+        labels = {"integration": "core"}
+        sample = registry.get_sample_value
+        assert sample("kie_extractions_total", dict(labels, outcome="ok")) == 1
+        assert sample("kie_attempts_total", dict(labels, status="200")) == 1
+        assert sample("kie_in_flight", labels) == 0
+        assert sample("kie_phase_seconds_count", dict(labels, phase="parse")) == 1
+        assert sample("kie_request_bytes_count", labels) == 1
+        body, content_type = prometheus.render()
+        assert b"kie_extraction_seconds_bucket" in body
+        assert content_type.startswith("text/plain")
+
+    @respx.mock
+    def test_opentelemetry(self, sample_image, mock_result):
+        pytest.importorskip("opentelemetry.sdk")
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+            InMemorySpanExporter,
+        )
+
+        respx.post(MOCK_ENDPOINT).mock(
+            side_effect=[httpx.Response(503), httpx.Response(200, json=mock_result)]
+        )
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        otel = OpenTelemetryInstrumentation(provider)
+        with KIEClient(MOCK_ENDPOINT, instrumentation=otel) as client:
+            client.extract_document(sample_image, {"a": "string"})
+        spans = {span.name: span for span in exporter.get_finished_spans()}
+        root = spans["kie.extract_document"]
+        assert spans["kie.parse"].parent.span_id == root.context.span_id
+        assert root.attributes["kie.attempts"] == 2
+        assert root.attributes["kie.outcome"] == "ok"
+        assert [event.name for event in root.events] == ["kie.attempt"] * 2
+
+    def test_multi_and_find(self):
+        first, second = Recording(), Recording()
+        set_instrumentation([first, second])
+        combined = get_instrumentation()
+        assert isinstance(combined, MultiInstrumentation)
+        assert find_instrumentation(Recording) is first
+        assert find_instrumentation(PrometheusInstrumentation) is None
+
+    def test_configured_from_environment(self, monkeypatch):
+        pytest.importorskip("opentelemetry")
+        monkeypatch.setattr(instrumentation_module, "_configured", False)
+        monkeypatch.setenv("KIE_INSTRUMENTATION", "otel")
+        assert isinstance(get_instrumentation(), OpenTelemetryInstrumentation)
+
+    def test_unknown_name(self):
+        with pytest.raises(ValueError, match="Unknown instrumentation"):
+            set_instrumentation("statsd")
+
+    def test_missing_library(self, monkeypatch):
+        monkeypatch.setattr(instrumentation_module, "prometheus_client", None)
+        with pytest.raises(RuntimeError, match="prometheus_client is not installed"):
+            PrometheusInstrumentation()
@@ -0,0 +1,221 @@
+"""Tests for kie_core.journal — essential + comprehensive."""
+
+import base64
+import json
+import multiprocessing
+import os
+import time
+
+import httpx
+import pytest
+import respx
+
+from kie_core import journal as journal_module
+from kie_core.client import KIEClient
+from kie_core.journal import BatchJournal, run_batch
+
+MOCK_ENDPOINT = "http://testserver/v1/extract"
+
+
+@pytest.fixture()
+def documents(tmp_path):
+    """Five small documents with distinct content."""
+    paths = []
+    for i in range(5):
+        path = tmp_path / "docs" / f"doc{i}.png"
+        path.parent.mkdir(exist_ok=True)
+        path.write_bytes(b"\x89PNG\r\n\x1a\n" + bytes([i]) * 50)
+        paths.append(str(path))
+    return paths
+
+
+def _lines(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def _decoded(request):
+    return base64.b64decode(json.loads(request.content)["document"]["content"])
+
+
+def _work_through(journal_path, output, keys, queue):
+    journal = BatchJournal(journal_path)
+    done = []
+    for key in keys:
+        if journal.claim(key, key):
+            journal.complete(key, key, {"pid": os.getpid()}, output)
+            done.append(key)
+    queue.put(done)
+
+
+# ── essential ─────────────────────────────────────────────────────────
+
+
+class TestRunBatchEssential:
+    """Journaled batches resume where they stopped."""
+
+    @respx.mock
+    def test_writes_results_and_journal(self, tmp_path, documents, mock_result):
+        respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        output = tmp_path / "out" / "results.jsonl"
+        with KIEClient(MOCK_ENDPOINT) as client:
+            summary = run_batch(documents, {"a": "string"}, output, client=client)
+        assert (summary.completed, summary.failed, summary.skipped) == (5, 0, 0)
+        records = _lines(output)
+        assert sorted(r["document"] for r in records) == documents
+        assert all(r["result"] == mock_result for r in records)
+        entries = BatchJournal(f"{output}.journal").entries()
+        assert {e["status"] for e in entries.values()} == {"done"}
+
+    @respx.mock
+    def test_rerun_skips_completed(self, tmp_path, documents, mock_result):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        output = tmp_path / "results.jsonl"
+        with KIEClient(MOCK_ENDPOINT) as client:
+            run_batch(documents[:3], {"a": "string"}, output, client=client)
+            summary = run_batch(documents, {"a": "string"}, output, client=client)
+        assert (summary.completed, summary.skipped) == (2, 3)
+        assert route.call_count == 5
+        assert len(_lines(output)) == 5
+
+    @respx.mock
+    def test_rerun_retries_failures(self, tmp_path, documents, mock_result):
+        state = {"healthy": False}
+
+        def respond(request):
+            if not state["healthy"] and bytes([1]) * 50 in _decoded(request):
+                return httpx.Response(400, json={"detail": "bad"})
+            return httpx.Response(200, json=mock_result)
+
+        route = respx.post(MOCK_ENDPOINT).mock(side_effect=respond)
+        output = tmp_path / "results.jsonl"
+        with KIEClient(MOCK_ENDPOINT) as client:
+            first = run_batch(documents, {"a": "string"}, output, client=client)
+            state["healthy"] = True
+            second = run_batch(documents, {"a": "string"}, output, client=client)
+        assert (first.completed, first.failed) == (4, 1)
+        assert (second.completed, second.skipped) == (1, 4)
+        assert route.call_count == 6
+        assert [r["document"] for r in _lines(output)].count(documents[1]) == 1
+
+
+# ── comprehensive ─────────────────────────────────────────────────────
+
+
+class TestBatchJournalComprehensive:
+    """Claims, leases and the on-disk format."""
+
+    def test_claim_once(self, tmp_path):
+        journal = BatchJournal(tmp_path / "j")
+        assert journal.claim("k", "doc")
+        assert not journal.claim("k", "doc")
+
+    def test_read_result_by_offset(self, tmp_path):
+        journal = BatchJournal(tmp_path / "j")
+        output = tmp_path / "out.jsonl"
+        for i in range(3):
+            journal.claim(f"k{i}", f"doc{i}")
+            journal.complete(f"k{i}", f"doc{i}", {"n": i}, output)
+        assert journal.read_result("k1", output) == {"n": 1}
+        assert journal.status("k2")["offset"] > journal.status("k1")["offset"]
+        assert journal.read_result("missing", output) is None
+
+    def test_retry_failed_false(self, tmp_path):
+        journal = BatchJournal(tmp_path / "j")
+        journal.claim("k", "doc")
+        journal.fail("k", "doc", RuntimeError("boom"))
+        assert journal.status("k")["error"] == "boom"
+        assert not journal.claim("k", "doc", retry_failed=False)
+        assert journal.claim("k", "doc")
+
+    def test_claims_of_dead_process_are_taken_over(self, tmp_path):
+        path = tmp_path / "j"
+        first = BatchJournal(path)
+        first.claim("k", "doc")
+        # Same process, new run: the old run is gone.
+        assert BatchJournal(path).claim("k", "doc")
+
+        other = BatchJournal(path)
+        entry = {
+            "key": "live",
+            "document": "d",
+            "status": "claimed",
+            "host": other._host,
+            "pid": os.getppid(),
+            "time": time.time(),
+        }
+        dead = dict(entry, key="dead", pid=2**22 + 12345)
+        with path.open("ab") as f:
+            f.write((json.dumps(entry) + "\n" + json.dumps(dead) + "\n").encode())
+        assert not other.claim("live", "d")
+        assert other.claim("dead", "d")
+
+    def test_lease_expiry(self, tmp_path):
+        path = tmp_path / "j"
+        entry = {
+            "key": "k",
+            "document": "d",
+            "status": "claimed",
+            "host": "elsewhere",
+            "pid": 1,
+            "time": time.time(),
+        }
+        path.write_text(json.dumps(entry) + "\n")
+        assert not BatchJournal(path).claim("k", "d")
+        assert BatchJournal(path, lease=0).claim("k", "d")
+
+    def test_torn_line_is_dropped(self, tmp_path):
+        path = tmp_path / "j"
+        journal = BatchJournal(path)
+        journal.claim("a", "doc")
+        with path.open("ab") as f:
+            f.write(b'{"key": "b", "sta')
+        journal.claim("c", "doc")
+        fresh = BatchJournal(path)
+        assert set(fresh.entries()) == {"a", "c"}
+
+    def test_processes_share_work(self, tmp_path):
+        ctx = multiprocessing.get_context("fork")
+        keys = [f"k{i}" for i in range(60)]
+        queue = ctx.Queue()
+        output = tmp_path / "out.jsonl"
+        workers = [
+            ctx.Process(
+                target=_work_through, args=(tmp_path / "j", output, keys, queue)
+            )
+            for _ in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        claimed = [key for _ in workers for key in queue.get(timeout=30)]
+        for worker in workers:
+            worker.join()
+        assert sorted(claimed) == sorted(keys)
+        assert sorted(r["key"] for r in _lines(output)) == sorted(keys)
+
+    @respx.mock
+    def test_missing_document_recorded(self, tmp_path, documents, mock_result):
+        respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        output = tmp_path / "results.jsonl"
+        with KIEClient(MOCK_ENDPOINT) as client:
+            summary = run_batch(
+                [documents[0], str(tmp_path / "gone.png")],
+                {"a": "string"},
+                output,
+                journal=tmp_path / "custom.journal",
+                client=client,
+            )
+        assert (summary.completed, summary.failed) == (1, 1)
+        entries = BatchJournal(tmp_path / "custom.journal").entries()
+        statuses = sorted(e["status"] for e in entries.values())
+        assert statuses == ["done", "failed"]
+
+    def test_requires_fcntl(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(journal_module, "fcntl", None)
+        with pytest.raises(RuntimeError, match="fcntl"):
+            BatchJournal(tmp_path / "j")
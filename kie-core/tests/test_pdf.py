@@ -0,0 +1,169 @@
+"""Tests for kie_core.pdf — essential + comprehensive."""
+
+import base64
+import io
+import json
+
+import httpx
+import pytest
+import respx
+
+from kie_core import pdf as pdf_module
+from kie_core.batch import extract_pages, extract_pages_async
+from kie_core.client import AsyncKIEClient, KIEClient
+from kie_core.document import prepare_document
+from kie_core.pdf import (
+    merge_page_results,
+    parse_page_range,
+    select_pages,
+    split_pages,
+)
+
+pypdf = pytest.importorskip("pypdf")
+
+MOCK_ENDPOINT = "http://testserver/v1/extract"
+
+
+@pytest.fixture()
+def multipage_pdf(tmp_path):
+    """A 5-page PDF whose page N is N * 100 points wide."""
+    writer = pypdf.PdfWriter()
+    for number in range(1, 6):
+        writer.add_blank_page(width=number * 100, height=200)
+    path = tmp_path / "multi.pdf"
+    with path.open("wb") as f:
+        writer.write(f)
+    return path
+
+
+def _widths(data):
+    """Page numbers of a PDF built from the fixture, from their widths."""
+    reader = pypdf.PdfReader(io.BytesIO(data))
+    return [round(page.mediabox.width) // 100 for page in reader.pages]
+
+
+def _uploaded(request):
+    body = json.loads(request.content)
+    return base64.b64decode(body["document"]["content"])
+
+
+def _per_page_result(request):
+    (page,) = _widths(_uploaded(request))
+    result = {"vendor_name": "Acme" if page == 2 else None, "line_items": [page]}
+    return httpx.Response(200, json=result)
+
+
+# ── essential ─────────────────────────────────────────────────────────
+
+
+class TestPageSelectionEssential:
+    """Slicing, splitting and merging."""
+
+    def test_select_range(self, multipage_pdf):
+        assert _widths(select_pages(multipage_pdf, "1-2,5")) == [1, 2, 5]
+
+    def test_select_numbers_and_predicate(self, multipage_pdf):
+        assert _widths(select_pages(multipage_pdf, [4, 2])) == [2, 4]
+        odd = select_pages(multipage_pdf, lambda number, page: number % 2)
+        assert _widths(odd) == [1, 3, 5]
+
+    def test_split(self, multipage_pdf):
+        parts = split_pages(multipage_pdf, "2-3")
+        assert [number for number, _ in parts] == [2, 3]
+        assert [_widths(data) for _, data in parts] == [[2], [3]]
+
+    def test_merge(self):
+        merged = merge_page_results(
+            [
+                {"vendor": None, "total": "", "items": [1]},
+                {"vendor": "Acme", "total": "10", "items": [2, 3]},
+                {"vendor": "Other", "total": "99", "items": []},
+            ]
+        )
+        assert merged == {"vendor": "Acme", "total": "10", "items": [1, 2, 3]}
+
+    @respx.mock
+    def test_client_uploads_selected_pages(self, multipage_pdf, mock_result):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        with KIEClient(MOCK_ENDPOINT) as client:
+            result = client.extract_document(
+                multipage_pdf, {"a": "string"}, pages="1-2"
+            )
+        assert result == mock_result
+        assert _widths(_uploaded(route.calls[0].request)) == [1, 2]
+
+    @respx.mock
+    def test_extract_pages(self, multipage_pdf):
+        respx.post(MOCK_ENDPOINT).mock(side_effect=_per_page_result)
+        with KIEClient(MOCK_ENDPOINT) as client:
+            merged = extract_pages(
+                multipage_pdf, {"vendor_name": "string"}, pages="1-3", client=client
+            )
+        assert merged == {"vendor_name": "Acme", "line_items": [1, 2, 3]}
+
+    @respx.mock
+    async def test_extract_pages_async(self, multipage_pdf):
+        route = respx.post(MOCK_ENDPOINT).mock(side_effect=_per_page_result)
+        async with AsyncKIEClient(MOCK_ENDPOINT) as client:
+            merged = await extract_pages_async(
+                multipage_pdf, {"vendor_name": "string"}, concurrency=2, client=client
+            )
+        assert merged["line_items"] == [1, 2, 3, 4, 5]
+        assert route.call_count == 5
+
+
+# ── comprehensive ─────────────────────────────────────────────────────
+
+
+class TestPageSelectionComprehensive:
+    """Inputs and errors."""
+
+    def test_parse_page_range(self):
+        assert parse_page_range("1-2, 5, 2", 10) == [0, 1, 4]
+        assert parse_page_range("8-", 10) == [7, 8, 9]
+        assert parse_page_range("3-20", 4) == [2, 3]
+        for bad in ("0", "3-1", "a-b", "1-x"):
+            with pytest.raises(ValueError, match="Invalid page range"):
+                parse_page_range(bad, 10)
+
+    def test_input_kinds(self, multipage_pdf):
+        data = multipage_pdf.read_bytes()
+        assert _widths(select_pages(data, "3")) == [3]
+        assert _widths(select_pages(memoryview(data), "3")) == [3]
+        assert _widths(select_pages(io.BytesIO(data), "3")) == [3]
+        assert _widths(select_pages(prepare_document(multipage_pdf), "3")) == [3]
+        assert _widths(select_pages(str(multipage_pdf), "3")) == [3]
+
+    def test_no_pages_selected(self, multipage_pdf):
+        with pytest.raises(ValueError, match="No pages selected"):
+            select_pages(multipage_pdf, "9-")
+
+    def test_rejects_images(self, sample_image):
+        with pytest.raises(ValueError, match="requires a PDF"):
+            select_pages(sample_image, "1")
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError, match="Document not found"):
+            select_pages(tmp_path / "missing.pdf", "1")
+
+    async def test_rejects_async_iterators(self, multipage_pdf):
+        async def chunks():
+            yield multipage_pdf.read_bytes()
+
+        async with AsyncKIEClient(MOCK_ENDPOINT) as client:
+            with pytest.raises(TypeError, match="seekable"):
+                await client.extract_document(chunks(), {"a": "string"}, pages="1")
+
+    @respx.mock
+    def test_extract_pages_failure(self, multipage_pdf):
+        respx.post(MOCK_ENDPOINT).mock(return_value=httpx.Response(400))
+        with KIEClient(MOCK_ENDPOINT) as client:
+            with pytest.raises(RuntimeError):
+                extract_pages(multipage_pdf, {"a": "string"}, client=client)
+
+    def test_missing_pypdf(self, monkeypatch, multipage_pdf):
+        monkeypatch.setattr(pdf_module, "pypdf", None)
+        with pytest.raises(RuntimeError, match="pypdf is not installed"):
+            select_pages(multipage_pdf, "1")
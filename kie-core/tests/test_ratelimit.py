@@ -0,0 +1,222 @@
+"""Tests for kie_core.ratelimit — essential + comprehensive."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+import respx
+
+from kie_core import ratelimit
+from kie_core.client import (
+    AsyncKIEClient,
+    KIEClient,
+    get_default_async_client,
+    get_default_client,
+    set_default_limiters,
+)
+from kie_core.ratelimit import (
+    AdaptiveConcurrencyLimiter,
+    FileTokenBucket,
+    TokenBucket,
+    get_default_concurrency_limiter,
+    get_default_rate_limiter,
+)
+from kie_core.retry import NO_RETRY
+
+MOCK_ENDPOINT = "http://testserver/v1/extract"
+
+
+@pytest.fixture()
+def reset_defaults(monkeypatch):
+    """Forget the process-wide limiters before and after the test."""
+    monkeypatch.setattr(ratelimit, "_defaults_loaded", False)
+    monkeypatch.setattr(ratelimit, "_default_rate_limiter", None)
+    monkeypatch.setattr(ratelimit, "_default_concurrency_limiter", None)
+    yield
+    set_default_limiters(None, None)
+    monkeypatch.setattr(ratelimit, "_defaults_loaded", False)
+
+
+# ── essential ─────────────────────────────────────────────────────────
+
+
+class TestTokenBucketEssential:
+    """Requests-per-second budget."""
+
+    def test_burst_then_throttle(self):
+        bucket = TokenBucket(rate=20, burst=2)
+        started = time.monotonic()
+        for _ in range(4):
+            bucket.acquire()
+        # two tokens free, two more at 20/s
+        assert 0.08 <= time.monotonic() - started < 0.5
+
+    async def test_async_throttle(self):
+        bucket = TokenBucket(rate=50, burst=1)
+        started = time.monotonic()
+        await asyncio.gather(*(bucket.aacquire() for _ in range(4)))
+        assert 0.05 <= time.monotonic() - started < 0.5
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError, match="rate"):
+            TokenBucket(0)
+
+
+class TestAdaptiveLimiterEssential:
+    """AIMD concurrency limit."""
+
+    def test_grows_on_success(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=2, max_limit=4)
+        for _ in range(20):
+            with limiter.slot():
+                pass
+        assert limiter.limit == 4
+        assert limiter.in_flight == 0
+
+    def test_shrinks_on_overload(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=8)
+        limiter.acquire()
+        limiter.release(overloaded=True)
+        assert limiter.limit == 4
+
+    @respx.mock
+    def test_client_backs_off_on_429(self):
+        respx.post(MOCK_ENDPOINT).mock(return_value=httpx.Response(429))
+        limiter = AdaptiveConcurrencyLimiter(initial=8)
+        with KIEClient(
+            MOCK_ENDPOINT, retry=NO_RETRY, concurrency_limiter=limiter
+        ) as client:
+            with pytest.raises(RuntimeError, match="429"):
+                client.extract("b64", "image", {})
+        assert limiter.limit == 4
+        assert limiter.in_flight == 0
+
+
+# ── comprehensive ─────────────────────────────────────────────────────
+
+
+class TestAdaptiveLimiterComprehensive:
+    """Blocking, cooldown, and latency gating."""
+
+    def test_sync_blocks_at_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=1, max_limit=1)
+        limiter.acquire()
+        acquired = threading.Event()
+
+        def worker():
+            limiter.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        assert not acquired.wait(0.05)
+        limiter.release(latency=0.01)
+        assert acquired.wait(1)
+        thread.join()
+
+    async def test_async_bound_respected(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=2, max_limit=2)
+        state = {"active": 0, "peak": 0}
+
+        async def job():
+            async with limiter.aslot():
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+                await asyncio.sleep(0.01)
+                state["active"] -= 1
+
+        await asyncio.gather(*(job() for _ in range(10)))
+        assert state["peak"] == 2
+        assert limiter.in_flight == 0
+
+    async def test_cancelled_waiter_does_not_leak(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=1, max_limit=1)
+        await limiter.aacquire()
+        waiter = asyncio.ensure_future(limiter.aacquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        limiter.release(latency=0.0)
+        await asyncio.wait_for(limiter.aacquire(), 1)
+        assert limiter.in_flight == 1
+
+    def test_cooldown_groups_failures(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=16, cooldown=60)
+        for _ in range(3):
+            limiter.acquire()
+        for _ in range(3):
+            limiter.release(overloaded=True)
+        assert limiter.limit == 8
+
+    def test_min_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=2, min_limit=2, cooldown=0)
+        limiter.acquire()
+        limiter.release(overloaded=True)
+        assert limiter.limit == 2
+
+    def test_slow_success_does_not_grow(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=2, latency_threshold=0.5)
+        for _ in range(10):
+            limiter.acquire()
+            limiter.release(latency=1.0)
+        assert limiter.limit == 2
+
+    def test_non_overload_error_is_neutral(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=4)
+        with pytest.raises(ValueError):
+            with limiter.slot():
+                raise ValueError
+        assert limiter.limit == 4
+        assert limiter.in_flight == 0
+
+
+class TestFileTokenBucket:
+    """Cross-process budget through a shared file."""
+
+    def test_shared_budget(self, tmp_path):
+        path = tmp_path / "bucket"
+        first = FileTokenBucket(path, rate=1, burst=2)
+        second = FileTokenBucket(path, rate=1, burst=2)
+        assert first._reserve() == 0
+        assert second._reserve() == 0
+        assert first._reserve() > 0.5
+
+
+class TestDefaults:
+    """Process-wide limiters shared by the default clients."""
+
+    def test_unconfigured(self, reset_defaults, monkeypatch):
+        monkeypatch.delenv("KIE_RATE_LIMIT", raising=False)
+        monkeypatch.delenv("KIE_MAX_CONCURRENCY", raising=False)
+        assert get_default_rate_limiter() is None
+        assert get_default_concurrency_limiter() is None
+
+    def test_from_env(self, reset_defaults, monkeypatch, tmp_path):
+        monkeypatch.setenv("KIE_RATE_LIMIT", "5")
+        monkeypatch.setenv("KIE_RATE_LIMIT_FILE", str(tmp_path / "bucket"))
+        monkeypatch.setenv("KIE_MAX_CONCURRENCY", "32")
+        bucket = get_default_rate_limiter()
+        assert isinstance(bucket, FileTokenBucket) and bucket.rate == 5
+        assert get_default_concurrency_limiter().max_limit == 32
+        assert get_default_rate_limiter() is bucket
+
+    async def test_set_default_limiters_shared(self, reset_defaults):
+        bucket = TokenBucket(10)
+        limiter = AdaptiveConcurrencyLimiter()
+        set_default_limiters(bucket, limiter)
+        for client in (get_default_client(), get_default_async_client()):
+            assert client.rate_limiter is bucket
+            assert client.concurrency_limiter is limiter
+
+    @respx.mock
+    async def test_async_client_uses_limiters(self):
+        respx.post(MOCK_ENDPOINT).mock(return_value=httpx.Response(200, json={}))
+        limiter = AdaptiveConcurrencyLimiter(initial=1, max_limit=1)
+        async with AsyncKIEClient(
+            MOCK_ENDPOINT, rate_limiter=TokenBucket(1000), concurrency_limiter=limiter
+        ) as client:
+            await asyncio.gather(*(client.extract("b", "image", {}) for _ in range(5)))
+        assert limiter.in_flight == 0
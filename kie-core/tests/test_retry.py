@@ -0,0 +1,298 @@
+"""Tests for kie_core.retry — essential + comprehensive."""
+
+import asyncio
+import base64
+import io
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+import respx
+
+from kie_core.client import AsyncKIEClient, KIEClient
+from kie_core.retry import NO_RETRY, HedgePolicy, RetryPolicy, ahedged_call
+
+MOCK_ENDPOINT = "http://testserver/v1/extract"
+
+
+def _status_error(status, headers=None):
+    request = httpx.Request("POST", MOCK_ENDPOINT)
+    response = httpx.Response(status, headers=headers, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+# ── essential ─────────────────────────────────────────────────────────
+
+
+class TestRetryEssential:
+    """Client-level retry behaviour."""
+
+    @respx.mock
+    def test_retries_503_then_succeeds(self, mock_result):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            side_effect=[httpx.Response(503), httpx.Response(200, json=mock_result)]
+        )
+        with KIEClient(MOCK_ENDPOINT) as client:
+            assert client.extract("b64", "image", {}) == mock_result
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_async_retries_429_then_succeeds(self, mock_result):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            side_effect=[httpx.Response(429), httpx.Response(200, json=mock_result)]
+        )
+        async with AsyncKIEClient(MOCK_ENDPOINT) as client:
+            assert await client.extract("b64", "image", {}) == mock_result
+        assert route.call_count == 2
+
+    @respx.mock
+    def test_client_error_not_retried(self):
+        route = respx.post(MOCK_ENDPOINT).mock(return_value=httpx.Response(400))
+        with KIEClient(MOCK_ENDPOINT) as client:
+            with pytest.raises(RuntimeError, match="400"):
+                client.extract("b64", "image", {})
+        assert route.call_count == 1
+
+    @respx.mock
+    def test_gives_up_after_max_attempts(self):
+        route = respx.post(MOCK_ENDPOINT).mock(return_value=httpx.Response(502))
+        with KIEClient(MOCK_ENDPOINT, retry=RetryPolicy(max_attempts=4)) as client:
+            with pytest.raises(RuntimeError, match="502"):
+                client.extract("b64", "image", {})
+        assert route.call_count == 4
+
+
+# ── comprehensive ─────────────────────────────────────────────────────
+
+
+class TestRetryComprehensive:
+    """Policy decisions and edge cases."""
+
+    @respx.mock
+    def test_connect_error_retried(self):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            side_effect=[httpx.ConnectError("refused"), httpx.Response(200, json={})]
+        )
+        with KIEClient(MOCK_ENDPOINT) as client:
+            assert client.extract("b64", "image", {}) == {}
+        assert route.call_count == 2
+
+    @respx.mock
+    def test_read_timeout_not_retried_by_default(self):
+        route = respx.post(MOCK_ENDPOINT).mock(side_effect=httpx.ReadTimeout("slow"))
+        with KIEClient(MOCK_ENDPOINT) as client:
+            with pytest.raises(RuntimeError, match="timed out"):
+                client.extract("b64", "image", {})
+        assert route.call_count == 1
+
+    @respx.mock
+    def test_read_timeout_retried_when_enabled(self):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            side_effect=[httpx.ReadTimeout("slow"), httpx.Response(200, json={})]
+        )
+        policy = RetryPolicy(retry_on_timeout=True)
+        with KIEClient(MOCK_ENDPOINT, retry=policy) as client:
+            assert client.extract("b64", "image", {}) == {}
+        assert route.call_count == 2
+
+    @respx.mock
+    def test_no_retry(self):
+        route = respx.post(MOCK_ENDPOINT).mock(return_value=httpx.Response(503))
+        with KIEClient(MOCK_ENDPOINT, retry=NO_RETRY) as client:
+            with pytest.raises(RuntimeError, match="503"):
+                client.extract("b64", "image", {})
+        assert route.call_count == 1
+
+    @respx.mock
+    def test_streamed_body_resent_on_retry(self, sample_pdf):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            side_effect=[httpx.Response(503), httpx.Response(200, json={})]
+        )
+        with KIEClient(MOCK_ENDPOINT, stream_threshold=0) as client:
+            client.extract_document(str(sample_pdf), {})
+        bodies = [call.request.read() for call in route.calls]
+        assert bodies[0] == bodies[1] and bodies[0]
+
+    def test_is_retryable(self):
+        policy = RetryPolicy()
+        assert policy.is_retryable(_status_error(503))
+        assert not policy.is_retryable(_status_error(404))
+        assert policy.is_retryable(httpx.RemoteProtocolError("dropped"))
+        assert not policy.is_retryable(httpx.ReadTimeout("slow"))
+        assert not policy.is_retryable(ValueError())
+
+
+class TestBackoff:
+    """Delay computation (real backoff, not the conftest stub)."""
+
+    @pytest.fixture(autouse=True)
+    def _no_backoff(self):
+        """Override the conftest stub so the real schedule is exercised."""
+
+    def test_exponential_without_jitter(self):
+        policy = RetryPolicy(backoff_base=1.0, backoff_max=5.0, jitter=False)
+        assert [policy.backoff(n) for n in (1, 2, 3, 4)] == [1.0, 2.0, 4.0, 5.0]
+
+    def test_jitter_within_bounds(self):
+        policy = RetryPolicy(backoff_base=1.0)
+        assert all(0 <= policy.backoff(3) <= 4.0 for _ in range(50))
+
+    def test_retry_after_seconds(self):
+        policy = RetryPolicy(backoff_max=60)
+        assert policy.backoff(1, _status_error(429, {"Retry-After": "7"})) == 7.0
+
+    def test_retry_after_capped(self):
+        policy = RetryPolicy(backoff_max=5)
+        assert policy.backoff(1, _status_error(429, {"Retry-After": "120"})) == 5
+
+    def test_retry_after_http_date(self):
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        error = _status_error(503, {"Retry-After": format_datetime(when, usegmt=True)})
+        assert 25 <= RetryPolicy(backoff_max=60).backoff(1, error) <= 30
+
+    @respx.mock
+    def test_deadline_stops_retries(self):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(503, headers={"Retry-After": "10"})
+        )
+        policy = RetryPolicy(max_attempts=5, deadline=1.0)
+        with KIEClient(MOCK_ENDPOINT, retry=policy) as client:
+            started = time.monotonic()
+            with pytest.raises(RuntimeError, match="503"):
+                client.extract("b64", "image", {})
+        assert route.call_count == 1
+        assert time.monotonic() - started < 1.0
+
+
+class TestHedging:
+    """Duplicate requests for slow calls."""
+
+    def test_sync_hedge_wins(self, mock_result):
+        calls = []
+        lock = threading.Lock()
+
+        def handler(request):
+            with lock:
+                calls.append(request)
+                first = len(calls) == 1
+            if first:
+                time.sleep(0.5)
+                return httpx.Response(200, json={"slow": True})
+            return httpx.Response(200, json=mock_result)
+
+        hedge = HedgePolicy(delay=0.05)
+        with KIEClient(
+            MOCK_ENDPOINT, hedge=hedge, transport=httpx.MockTransport(handler)
+        ) as client:
+            assert client.extract("b64", "image", {}) == mock_result
+        assert len(calls) == 2
+
+    async def test_async_hedge_wins_and_cancels_loser(self, mock_result):
+        calls = []
+
+        async def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                await asyncio.sleep(5)
+                return httpx.Response(200, json={"slow": True})
+            return httpx.Response(200, json=mock_result)
+
+        hedge = HedgePolicy(delay=0.05)
+        async with AsyncKIEClient(
+            MOCK_ENDPOINT, hedge=hedge, transport=httpx.MockTransport(handler)
+        ) as client:
+            started = time.monotonic()
+            assert await client.extract("b64", "image", {}) == mock_result
+        assert len(calls) == 2
+        assert time.monotonic() - started < 1.0
+
+    def test_file_objects_not_hedged(self, sample_image):
+        """Attempts would share the read position and corrupt both bodies."""
+        document = sample_image.read_bytes() * 64
+        bodies = []
+
+        def handler(request):
+            bodies.append(request.read())
+            time.sleep(0.05)
+            return httpx.Response(200, json={})
+
+        with KIEClient(
+            MOCK_ENDPOINT,
+            hedge=HedgePolicy(delay=0),
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            client.extract_document(io.BytesIO(document), {"a": "string"})
+        assert len(bodies) == 1
+        content = json.loads(bodies[0])["document"]["content"]
+        assert base64.b64decode(content) == document
+
+    async def test_async_file_objects_not_hedged(self, sample_image):
+        document = sample_image.read_bytes() * 64
+        bodies = []
+
+        async def handler(request):
+            bodies.append(await request.aread())
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={})
+
+        async with AsyncKIEClient(
+            MOCK_ENDPOINT,
+            hedge=HedgePolicy(delay=0),
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            await client.extract_document(io.BytesIO(document), {"a": "string"})
+        assert len(bodies) == 1
+        content = json.loads(bodies[0])["document"]["content"]
+        assert base64.b64decode(content) == document
+
+    @pytest.mark.parametrize("timeout", [0.05, 0.3])
+    async def test_cancelled_caller_cancels_requests(self, timeout):
+        """Nothing is left running, whether cancelled before or after the hedge."""
+        started, cancelled = [], []
+
+        async def send():
+            started.append(True)
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(ahedged_call(send, delay=0.2), timeout)
+        await asyncio.sleep(0)
+        assert len(started) == (1 if timeout < 0.2 else 2)
+        assert cancelled == started
+
+    async def test_fast_request_not_hedged(self):
+        calls = []
+
+        async def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={})
+
+        async with AsyncKIEClient(
+            MOCK_ENDPOINT,
+            hedge=HedgePolicy(delay=1.0),
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            await client.extract("b64", "image", {})
+        assert len(calls) == 1
+
+    def test_adaptive_delay(self):
+        hedge = HedgePolicy(min_samples=10, min_delay=0.0)
+        for latency in range(9):
+            hedge.record(latency / 10)
+        assert hedge.current_delay() is None
+        for latency in range(9, 100):
+            hedge.record(latency / 10)
+        assert hedge.current_delay() == pytest.approx(9.5)
+
+    def test_adaptive_delay_floor(self):
+        hedge = HedgePolicy(min_samples=1, min_delay=0.2)
+        hedge.record(0.01)
+        assert hedge.current_delay() == 0.2
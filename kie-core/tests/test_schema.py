@@ -1,10 +1,29 @@
 """Tests for kie_core.schema — essential + comprehensive."""
 
 import json
+import os
+from pathlib import Path
 
+import httpx
 import pytest
-
-from kie_core.schema import load_schema
+import respx
+
+from kie_core.cache import cache_key
+from kie_core.client import KIEClient
+from kie_core.schema import (
+    CompiledSchema,
+    SchemaRegistry,
+    compile_schema,
+    is_json_schema,
+    load_schema,
+    normalize_hint,
+    validate_schema,
+)
+
+MOCK_ENDPOINT = "http://testserver/v1/extract"
+ASSET_SCHEMAS = sorted(
+    (Path(__file__).parents[2] / "assets" / "schemas").glob("*.json")
+)
 
 
 # ── essential ─────────────────────────────────────────────────────────
@@ -30,6 +49,72 @@ class TestLoadSchemaEssential:
             load_schema("{bad json")
 
 
+class TestCompileSchemaEssential:
+    """Validation, normalization and memoization."""
+
+    def test_normalizes_hints(self):
+        schema = compile_schema(
+            {"total": " Number ", "date": "Date(MM/DD/YYYY)", "zip": "5-digit  ZIP"}
+        )
+        assert schema.normalized == {
+            "total": "number",
+            "date": "date (MM/DD/YYYY)",
+            "zip": "5-digit ZIP",
+        }
+
+    def test_rejects_invalid_fields(self):
+        with pytest.raises(ValueError, match="items\\[0\\].qty has an empty"):
+            compile_schema({"items": [{"qty": " "}]})
+        with pytest.raises(ValueError, match="expected a JSON object"):
+            compile_schema("[1, 2]")
+
+    def test_passes_unrecognized_values_through(self):
+        schema = {"qty": 3, "flag": None, "pair": ["Number", "string"], "e": []}
+        assert compile_schema(schema) == schema
+
+    @pytest.mark.parametrize("path", ASSET_SCHEMAS, ids=lambda p: p.name)
+    def test_bundled_assets_compile(self, path):
+        schema = compile_schema(str(path))
+        assert schema == json.loads(path.read_text())
+        assert schema.fingerprint
+
+    def test_json_keeps_field_order(self):
+        schema = compile_schema('{"b": "string", "a": "number"}')
+        assert schema.json == b'{"b":"string","a":"number"}'
+
+    def test_wire_form_keeps_spelling(self):
+        schema = compile_schema({"total": " Number ", "date": "Date(MM/DD/YYYY)"})
+        assert schema == {"total": " Number ", "date": "Date(MM/DD/YYYY)"}
+        assert schema.json == b'{"total":" Number ","date":"Date(MM/DD/YYYY)"}'
+        assert schema.fingerprint == compile_schema(schema.normalized).fingerprint
+
+    def test_fingerprint_ignores_order_and_spelling(self):
+        first = compile_schema({"a": "Number", "b": "string"})
+        second = compile_schema({"b": "string", "a": " number"})
+        assert first.fingerprint == second.fingerprint
+        assert first.fingerprint != compile_schema({"a": "string"}).fingerprint
+        assert cache_key("d", {"a": "Number"}) == cache_key("d", {"a": "number"})
+
+    def test_file_memoized_until_modified(self, tmp_path):
+        registry = SchemaRegistry()
+        path = tmp_path / "schema.json"
+        path.write_text('{"a": "string"}')
+        first = registry.compile(str(path))
+        assert registry.compile(str(path)) is first
+        path.write_text('{"a": "number"}')
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert registry.compile(str(path)) == {"a": "number"}
+
+    @respx.mock
+    def test_client_rejects_before_upload(self, sample_image):
+        route = respx.post(MOCK_ENDPOINT).mock(return_value=httpx.Response(200))
+        with KIEClient(MOCK_ENDPOINT) as client:
+            with pytest.raises(ValueError, match="Invalid schema: total"):
+                client.extract_document(sample_image, {"total": ""})
+        assert not route.called
+
+
 # ── comprehensive ─────────────────────────────────────────────────────
 
 
@@ -61,3 +146,59 @@ class TestLoadSchemaComprehensive:
     def test_unicode_values(self):
         schema = {"名前": "string", "金額": "number"}
         assert load_schema(json.dumps(schema)) == schema
+
+
+class TestCompileSchemaComprehensive:
+    """Registry bounds and inputs."""
+
+    def test_compiled_schema_returned_as_is(self):
+        schema = compile_schema({"a": "string"})
+        assert isinstance(schema, CompiledSchema)
+        assert compile_schema(schema) is schema
+
+    def test_json_string_memoized(self):
+        registry = SchemaRegistry()
+        assert registry.compile('{"a": "string"}') is registry.compile(
+            '{"a": "string"}'
+        )
+
+    def test_lru_bound(self):
+        registry = SchemaRegistry(max_entries=2)
+        for name in ("a", "b", "c"):
+            registry.compile(json.dumps({name: "string"}))
+        assert len(registry) == 2
+        registry.clear()
+        assert len(registry) == 0
+
+    def test_empty_schema_and_names(self):
+        assert validate_schema({}) == {}
+        with pytest.raises(ValueError, match="empty field name"):
+            validate_schema({" ": "string"})
+        with pytest.raises(ValueError, match="empty type hint"):
+            validate_schema({"a": "  "})
+
+    def test_json_schema_not_normalized(self):
+        schema = {
+            "type": "object",
+            "properties": {"total": {"type": "number", "description": " Number "}},
+            "required": ["total"],
+        }
+        assert is_json_schema(schema)
+        assert not is_json_schema({"type": "string", "properties": "string"})
+        assert validate_schema(schema) is schema
+
+    def test_normalize_hint(self):
+        assert normalize_hint("BOOLEAN") == "boolean"
+        assert normalize_hint("date ( YYYY-MM-DD )") == "date (YYYY-MM-DD)"
+        assert normalize_hint("Company name") == "Company name"
+
+    @respx.mock
+    def test_request_body_uses_compiled_json(self, sample_image, mock_result):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        with KIEClient(MOCK_ENDPOINT) as client:
+            client.extract_document(sample_image, {"total": "Number"}, model="m")
+        body = json.loads(route.calls[0].request.content)
+        assert body["schema"] == {"total": "Number"}  # sent as written
+        assert body["options"] == {"model": "m"}
@@ -0,0 +1,122 @@
+"""Tests for kie_core.serialization — essential + comprehensive."""
+
+import json
+
+import httpx
+import pytest
+import respx
+
+from kie_core import serialization
+from kie_core.client import KIEClient
+from kie_core.serialization import (
+    JSONBackend,
+    MsgspecBackend,
+    OrjsonBackend,
+    dumps,
+    get_json_backend,
+    loads,
+    set_json_backend,
+)
+
+MOCK_ENDPOINT = "http://testserver/v1/extract"
+
+SAMPLE = {
+    "vendor_name": "Acme Corp",
+    "名前": "山田",
+    "total_amount": 1234.56,
+    "line_items": [{"description": "Widget", "qty": 2}],
+    "paid": None,
+}
+
+AVAILABLE = ["json"]
+if serialization.orjson is not None:
+    AVAILABLE.append("orjson")
+if serialization.msgspec is not None:
+    AVAILABLE.append("msgspec")
+
+
+@pytest.fixture(autouse=True)
+def _restore_backend():
+    yield
+    set_json_backend(None)
+
+
+@pytest.fixture(params=AVAILABLE)
+def backend(request):
+    set_json_backend(request.param)
+    return get_json_backend()
+
+
+# ── essential ─────────────────────────────────────────────────────────
+
+
+class TestSerializationEssential:
+    """Every installed backend behaves like the stdlib."""
+
+    def test_round_trip(self, backend):
+        data = dumps(SAMPLE)
+        assert isinstance(data, bytes)
+        assert loads(data) == SAMPLE
+        assert loads(data.decode()) == SAMPLE
+
+    def test_compact_utf8(self, backend):
+        expected = json.dumps(SAMPLE, ensure_ascii=False, separators=(",", ":"))
+        assert dumps(SAMPLE) == expected.encode()
+
+    def test_indent_matches_stdlib(self, backend):
+        expected = json.dumps(SAMPLE, indent=2, ensure_ascii=False)
+        assert dumps(SAMPLE, indent=True) == expected.encode()
+
+    @respx.mock
+    def test_client_uses_backend(self, backend, mock_result):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=mock_result)
+        )
+        with KIEClient(MOCK_ENDPOINT) as client:
+            result = client.extract("aGVsbG8=", "image", {"名前": "string"})
+        assert result == mock_result
+        request = route.calls[0].request
+        assert request.headers["content-type"] == "application/json"
+        assert json.loads(request.content)["schema"] == {"名前": "string"}
+
+
+# ── comprehensive ─────────────────────────────────────────────────────
+
+
+class TestSerializationComprehensive:
+    """Backend selection."""
+
+    def test_auto_prefers_fast_backend(self, monkeypatch):
+        monkeypatch.delenv("KIE_JSON_BACKEND", raising=False)
+        set_json_backend(None)
+        expected = "orjson" if "orjson" in AVAILABLE else AVAILABLE[-1]
+        assert get_json_backend().name == expected
+
+    def test_env_override(self, monkeypatch):
+        monkeypatch.setenv("KIE_JSON_BACKEND", "json")
+        set_json_backend(None)
+        assert type(get_json_backend()) is JSONBackend
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match="Unknown JSON backend"):
+            set_json_backend("yaml")
+
+    def test_missing_library(self, monkeypatch):
+        monkeypatch.setattr(serialization, "orjson", None)
+        monkeypatch.setattr(serialization, "msgspec", None)
+        with pytest.raises(RuntimeError, match="orjson is not installed"):
+            OrjsonBackend()
+        with pytest.raises(RuntimeError, match="msgspec is not installed"):
+            MsgspecBackend()
+
+    def test_custom_backend(self):
+        class Recording(JSONBackend):
+            calls = 0
+
+            def dumps(self, obj, *, indent=False):
+                Recording.calls += 1
+                return super().dumps(obj, indent=indent)
+
+        set_json_backend(Recording())
+        assert loads(dumps({"a": 1})) == {"a": 1}
+        assert Recording.calls == 1
@@ -0,0 +1,184 @@
+"""Tests for kie_core.typed — essential + comprehensive."""
+
+import copy
+import datetime
+import json
+import pickle
+
+import httpx
+import pytest
+import respx
+
+from kie_core import typed as typed_module
+from kie_core.cache import MemoryCache
+from kie_core.client import AsyncKIEClient, KIEClient
+from kie_core.typed import (
+    ResultDecoder,
+    compile_decoder,
+    date_format,
+    decode_result,
+)
+
+MOCK_ENDPOINT = "http://testserver/v1/extract"
+
+SCHEMA = {
+    "vendor": "string",
+    "total": "currency",
+    "qty": "integer",
+    "paid": "boolean",
+    "due": "date (MM/DD/YYYY)",
+    "zip": "5-digit zip code",
+    "items": [{"description": "string", "amount": "number"}],
+}
+
+COMPLETE = {
+    "vendor": "Acme",
+    "total": "1234.50",
+    "qty": 3,
+    "paid": "true",
+    "due": "01/31/2024",
+    "zip": "12345",
+    "items": [{"description": "Widget", "amount": 2}],
+}
+
+EXPECTED = {
+    "vendor": "Acme",
+    "total": 1234.5,
+    "qty": 3,
+    "paid": True,
+    "due": datetime.date(2024, 1, 31),
+    "zip": "12345",
+    "items": [{"description": "Widget", "amount": 2.0}],
+}
+
+
+@pytest.fixture(params=["python", "msgspec", "pydantic"])
+def backend(request):
+    """Every decode backend that is installed."""
+    if request.param == "msgspec":
+        pytest.importorskip("msgspec")
+    if request.param == "pydantic":
+        pytest.importorskip("pydantic_core")
+    return request.param
+
+
+# ── essential ─────────────────────────────────────────────────────────
+
+
+class TestResultDecoderEssential:
+    """Conversion and flagging, identical across backends."""
+
+    def test_complete_result(self, backend):
+        result = ResultDecoder(SCHEMA, backend=backend).decode(
+            json.dumps(COMPLETE).encode()
+        )
+        assert result.values == EXPECTED
+        assert result.ok
+
+    def test_flags_missing_and_invalid(self, backend):
+        body = dict(COMPLETE, qty="three", due=None, extra="dropped")
+        del body["zip"]
+        body["items"] = [{"description": "Widget"}]
+        result = ResultDecoder(SCHEMA, backend=backend).decode(json.dumps(body))
+        assert result.missing == ["due", "zip", "items[0].amount"]
+        assert list(result.invalid) == ["qty"]
+        assert result.values["qty"] is None
+        assert "extra" not in result.values
+        assert not result.ok
+
+    def test_formatted_numbers(self, backend):
+        body = dict(COMPLETE, total="$1,234.50", qty="3.0")
+        result = ResultDecoder(SCHEMA, backend=backend).decode(body)
+        assert result.values == EXPECTED
+        assert result.ok
+
+    @respx.mock
+    def test_extract_typed(self, sample_image):
+        respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=COMPLETE)
+        )
+        with KIEClient(MOCK_ENDPOINT) as client:
+            result = client.extract_typed(sample_image, SCHEMA)
+        assert result.values == EXPECTED
+
+    @respx.mock
+    async def test_extract_typed_async(self, sample_image):
+        respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=dict(COMPLETE, due=None))
+        )
+        async with AsyncKIEClient(MOCK_ENDPOINT) as client:
+            result = await client.extract_typed(sample_image, SCHEMA)
+        assert result.missing == ["due"]
+
+
+# ── comprehensive ─────────────────────────────────────────────────────
+
+
+class TestResultDecoderComprehensive:
+    """Formats, memoization, and the client paths."""
+
+    def test_date_format(self):
+        assert date_format("date (MM/DD/YYYY)") == "%m/%d/%Y"
+        assert date_format("date (DD.MM.YY)") == "%d.%m.%y"
+        assert date_format("date (written out)") is None
+        assert date_format("string") is None
+
+    def test_dates_accept_iso(self, backend):
+        decoder = ResultDecoder({"due": "date (DD.MM.YYYY)"}, backend=backend)
+        assert decoder.decode({"due": "31.01.2024"}).values["due"] == (
+            datetime.date(2024, 1, 31)
+        )
+        assert decoder.decode({"due": "2024-01-31"}).ok
+        assert "due" in decoder.decode({"due": "Jan 31"}).invalid
+
+    def test_wrong_container_is_invalid(self, backend):
+        result = ResultDecoder(SCHEMA, backend=backend).decode(
+            dict(COMPLETE, items={"amount": 1})
+        )
+        assert "expected a list" in result.invalid["items"]
+
+    def test_unrecognized_schema_values_pass_through(self, backend):
+        decoder = ResultDecoder({"pair": ["number", "string"], "n": 3}, backend=backend)
+        result = decoder.decode({"pair": [1, "x"], "n": "5"})
+        assert result.ok
+        assert result.values == {"pair": [1, "x"], "n": "5"}
+
+    def test_dates_are_plain_dates_after_copy(self, backend):
+        result = ResultDecoder(SCHEMA, backend=backend).decode(COMPLETE)
+        for copied in (copy.deepcopy(result), pickle.loads(pickle.dumps(result))):
+            assert type(copied.values["due"]) is datetime.date
+
+    def test_rejects_non_objects(self, backend):
+        decoder = ResultDecoder(SCHEMA, backend=backend)
+        with pytest.raises(ValueError, match="JSON object"):
+            decoder.decode(b"[1, 2]")
+        with pytest.raises(ValueError):
+            decoder.decode(b"{not json")
+
+    def test_compile_decoder_memoized(self):
+        first = compile_decoder({"a": "Number", "b": "string"}, backend="python")
+        second = compile_decoder({"b": "string", "a": "number"}, backend="python")
+        assert first is second
+        assert decode_result({"a": "2"}, {"a": "number"}).values == {"a": 2.0}
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match="Unknown decode backend"):
+            ResultDecoder(SCHEMA, backend="yaml")
+
+    def test_missing_library(self, monkeypatch):
+        monkeypatch.setattr(typed_module, "msgspec", None)
+        with pytest.raises(RuntimeError, match="msgspec is not installed"):
+            ResultDecoder(SCHEMA, backend="msgspec")
+
+    @respx.mock
+    def test_cache_holds_plain_results(self, sample_image):
+        route = respx.post(MOCK_ENDPOINT).mock(
+            return_value=httpx.Response(200, json=COMPLETE)
+        )
+        cache = MemoryCache()
+        with KIEClient(MOCK_ENDPOINT, cache=cache) as client:
+            typed = client.extract_typed(sample_image, SCHEMA)
+            plain = client.extract_document(sample_image, SCHEMA)
+        assert typed.values == EXPECTED
+        assert plain == COMPLETE
+        assert route.call_count == 1
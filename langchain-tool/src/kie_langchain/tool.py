@@ -2,13 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import warnings
-from typing import Any, Type
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from pathlib import Path
+from typing import Annotated, Any, AsyncIterator, Iterator, Sequence, Type
 
+from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables.config import ContextThreadPoolExecutor, get_config_list
 from langchain_core.tools import BaseTool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, WithJsonSchema
 
 from kie_core import extract_document, extract_document_async
+from kie_core.batch import DEFAULT_CONCURRENCY
+from kie_core.document import DocumentInput
+from kie_core.instrumentation import integration_scope
+from kie_core.schema import compile_schema
 
 # Pydantic warns that "schema" shadows BaseModel.schema(); this is intentional
 # because "schema" is the natural parameter name for LLM-facing tool input.
@@ -20,7 +30,10 @@ class ExtractDocumentInput(BaseModel):
 
     model_config = {"protected_namespaces": ()}
 
-    document_path: str = Field(
+    # LLMs see a string path.  Programmatic callers may also pass the
+    # document itself: bytes, a binary file object, or an async iterator of
+    # chunks, which are streamed without being written to disk.
+    document_path: Annotated[Any, WithJsonSchema({"type": "string"})] = Field(
         description="Path to the document file (PNG, JPG, TIFF, PDF, etc.)"
     )
     schema: dict = Field(  # noqa: A003
@@ -35,8 +48,50 @@ class ExtractDocumentInput(BaseModel):
     )
 
 
+def _dedup_key(input_: Any) -> tuple | None:
+    """Return a key shared by inputs that extract the same thing, else ``None``.
+
+    Only argument dicts naming the document by path qualify: tool calls need
+    one message per call id, and in-memory documents are not compared.
+    """
+    if not isinstance(input_, dict) or input_.get("type") == "tool_call":
+        return None
+    document_path, schema = input_.get("document_path"), input_.get("schema")
+    if not isinstance(document_path, (str, Path)) or not isinstance(schema, dict):
+        return None
+    try:
+        fingerprint = compile_schema(schema).fingerprint
+    except ValueError:
+        return None  # let the call itself report the invalid schema
+    return str(document_path), fingerprint, input_.get("model")
+
+
+def _group_duplicates(inputs: Sequence[Any]) -> dict[int, list[int]]:
+    """Map the index of each distinct input to all indexes sharing its result."""
+    groups: dict[int, list[int]] = {}
+    leaders: dict[tuple, int] = {}
+    for index, input_ in enumerate(inputs):
+        key = _dedup_key(input_)
+        leader = index if key is None else leaders.setdefault(key, index)
+        groups.setdefault(leader, []).append(index)
+    return groups
+
+
+def _fan_out(indexes: list[int], output: Any) -> Iterator[tuple[int, Any]]:
+    """Yield ``output`` for every index, giving duplicates their own copy."""
+    yield indexes[0], output
+    for index in indexes[1:]:
+        yield index, output if isinstance(output, Exception) else copy.deepcopy(output)
+
+
 class KIEExtractDocumentTool(BaseTool):
-    """LangChain tool that extracts structured data from documents via the KIE API."""
+    """LangChain tool that extracts structured data from documents via the KIE API.
+
+    ``batch``/``abatch`` and their ``*_as_completed`` variants go through the
+    pooled default clients with at most ``max_concurrency`` extractions in
+    flight (a ``max_concurrency`` in the run config takes precedence), and
+    run identical inputs (same path, schema, and model) only once.
+    """
 
     name: str = "extract_document"
     description: str = (
@@ -44,23 +99,135 @@ class KIEExtractDocumentTool(BaseTool):
         "using a JSON schema. Returns extracted field values as JSON."
     )
     args_schema: Type[BaseModel] = ExtractDocumentInput
+    max_concurrency: int = DEFAULT_CONCURRENCY
 
     def _run(
         self,
-        document_path: str,
+        document_path: DocumentInput,
         schema: dict,
         model: str | None = None,
         **kwargs: Any,
     ) -> dict:
         """Execute extraction synchronously."""
-        return extract_document(document_path, schema, model=model)
+        with integration_scope("langchain"):
+            return extract_document(document_path, schema, model=model)
 
     async def _arun(
         self,
-        document_path: str,
+        document_path: DocumentInput,
         schema: dict,
         model: str | None = None,
         **kwargs: Any,
     ) -> dict:
         """Execute extraction asynchronously."""
-        return await extract_document_async(document_path, schema, model=model)
+        with integration_scope("langchain"):
+            return await extract_document_async(document_path, schema, model=model)
+
+    def _concurrency(self, configs: list[RunnableConfig], groups: int) -> int:
+        limit = configs[0].get("max_concurrency") or self.max_concurrency
+        return max(1, min(limit, groups))
+
+    def batch(
+        self,
+        inputs: list[Any],
+        config: RunnableConfig | list[RunnableConfig] | None = None,
+        *,
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> list[Any]:
+        """Run many extractions concurrently; outputs in input order."""
+        outputs: list[Any] = [None] * len(inputs)
+        for index, output in self.batch_as_completed(
+            inputs, config, return_exceptions=return_exceptions, **kwargs
+        ):
+            outputs[index] = output
+        return outputs
+
+    def batch_as_completed(
+        self,
+        inputs: Sequence[Any],
+        config: RunnableConfig | Sequence[RunnableConfig] | None = None,
+        *,
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> Iterator[tuple[int, Any]]:
+        """Run many extractions concurrently, yielding ``(index, output)``."""
+        if not inputs:
+            return
+        configs = get_config_list(config, len(inputs))
+        groups = _group_duplicates(inputs)
+
+        def invoke(index: int) -> Any:
+            try:
+                return self.invoke(inputs[index], configs[index], **kwargs)
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                return e
+
+        workers = self._concurrency(configs, len(groups))
+        with ContextThreadPoolExecutor(max_workers=workers) as pool:
+            futures: dict[Future, int] = {
+                pool.submit(invoke, leader): leader for leader in groups
+            }
+            try:
+                while futures:
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        leader = futures.pop(future)
+                        yield from _fan_out(groups[leader], future.result())
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    async def abatch(
+        self,
+        inputs: list[Any],
+        config: RunnableConfig | list[RunnableConfig] | None = None,
+        *,
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> list[Any]:
+        """Async counterpart of :meth:`batch`."""
+        outputs: list[Any] = [None] * len(inputs)
+        async for index, output in self.abatch_as_completed(
+            inputs, config, return_exceptions=return_exceptions, **kwargs
+        ):
+            outputs[index] = output
+        return outputs
+
+    async def abatch_as_completed(
+        self,
+        inputs: Sequence[Any],
+        config: RunnableConfig | Sequence[RunnableConfig] | None = None,
+        *,
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> AsyncIterator[tuple[int, Any]]:
+        """Async counterpart of :meth:`batch_as_completed`."""
+        if not inputs:
+            return
+        configs = get_config_list(config, len(inputs))
+        groups = _group_duplicates(inputs)
+        semaphore = asyncio.Semaphore(self._concurrency(configs, len(groups)))
+
+        async def invoke(index: int) -> tuple[int, Any]:
+            async with semaphore:
+                try:
+                    return index, await self.ainvoke(
+                        inputs[index], configs[index], **kwargs
+                    )
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    return index, e
+
+        tasks = [asyncio.create_task(invoke(leader)) for leader in groups]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                leader, output = await next_done
+                for item in _fan_out(groups[leader], output):
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
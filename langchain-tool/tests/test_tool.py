@@ -1,12 +1,38 @@
 """Tests for kie_langchain — essential + comprehensive."""
 
+import asyncio
+import io
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from kie_core.instrumentation import current_integration
 from kie_langchain import KIEExtractDocumentTool
 
 
+def _inputs(*paths):
+    return [{"document_path": path, "schema": {"x": "string"}} for path in paths]
+
+
+def _echo(path, schema, model=None):
+    return {"path": path}
+
+
+class _Tracker:
+    """Async extraction stand-in that records how many calls overlap."""
+
+    def __init__(self):
+        self.running = 0
+        self.peak = 0
+
+    async def extract(self, path, schema, model=None):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        return {"path": path}
+
+
 # ── essential ─────────────────────────────────────────────────────────
 
 
@@ -37,6 +63,25 @@ class TestToolEssential:
             result = await tool._arun(str(sample_image), {"vendor_name": "string"})
         assert result == mock_result
 
+    def test_batch_ordered_and_deduplicated(self):
+        tool = KIEExtractDocumentTool()
+        inputs = _inputs("a.pdf", "b.pdf", "a.pdf", "c.pdf")
+        with patch(
+            "kie_langchain.tool.extract_document", side_effect=_echo
+        ) as mock_fn:
+            outputs = tool.batch(inputs)
+        assert outputs == [{"path": p} for p in ("a.pdf", "b.pdf", "a.pdf", "c.pdf")]
+        assert mock_fn.call_count == 3
+        assert outputs[0] is not outputs[2]
+
+    async def test_abatch_bounded(self):
+        tool = KIEExtractDocumentTool(max_concurrency=2)
+        tracker = _Tracker()
+        with patch("kie_langchain.tool.extract_document_async", side_effect=tracker.extract):
+            outputs = await tool.abatch(_inputs(*(f"{i}.pdf" for i in range(6))))
+        assert outputs == [{"path": f"{i}.pdf"} for i in range(6)]
+        assert tracker.peak == 2
+
     def test_pydantic_input_schema(self):
         tool = KIEExtractDocumentTool()
         schema = tool.args_schema.model_json_schema()
@@ -110,3 +155,106 @@ class TestToolComprehensive:
         ):
             result = tool._run(str(sample_image), {"x": "string"})
         assert isinstance(result, dict)
+
+    def test_path_is_string_in_schema(self):
+        tool = KIEExtractDocumentTool()
+        props = tool.args_schema.model_json_schema()["properties"]
+        assert props["document_path"]["type"] == "string"
+
+    @pytest.mark.parametrize("wrap", [bytes, io.BytesIO])
+    def test_invoke_with_document_bytes(self, sample_image, mock_result, wrap):
+        tool = KIEExtractDocumentTool()
+        document = wrap(sample_image.read_bytes())
+        with patch(
+            "kie_langchain.tool.extract_document", return_value=mock_result
+        ) as mock_fn:
+            result = tool.invoke({"document_path": document, "schema": {}})
+        assert result == mock_result
+        assert mock_fn.call_args.args[0] is document
+
+    async def test_ainvoke_with_async_iterator(self, mock_result):
+        async def chunks():
+            yield b"%PDF"
+
+        tool = KIEExtractDocumentTool()
+        stream = chunks()
+        with patch(
+            "kie_langchain.tool.extract_document_async",
+            new_callable=AsyncMock,
+            return_value=mock_result,
+        ) as mock_fn:
+            await tool.ainvoke({"document_path": stream, "schema": {}})
+        assert mock_fn.call_args.args[0] is stream
+
+    async def test_calls_are_labelled_langchain(self, sample_image, mock_result):
+        seen = []
+
+        def record(*args, **kwargs):
+            seen.append(current_integration())
+            return mock_result
+
+        async def arecord(*args, **kwargs):
+            return record()
+
+        tool = KIEExtractDocumentTool()
+        with patch("kie_langchain.tool.extract_document", side_effect=record):
+            tool._run(str(sample_image), {"a": "string"})
+        with patch("kie_langchain.tool.extract_document_async", side_effect=arecord):
+            await tool._arun(str(sample_image), {"a": "string"})
+        assert seen == ["langchain", "langchain"]
+
+    def test_batch_as_completed_yields_every_index(self):
+        tool = KIEExtractDocumentTool()
+        paths = ("a.pdf", "b.pdf", "a.pdf")
+        with patch("kie_langchain.tool.extract_document", side_effect=_echo):
+            pairs = list(tool.batch_as_completed(_inputs(*paths)))
+        assert sorted(index for index, _ in pairs) == [0, 1, 2]
+        assert all(output == {"path": paths[i]} for i, output in pairs)
+        assert tool.batch([]) == []
+
+    def test_batch_exceptions(self):
+        def extract(path, schema, model=None):
+            if path == "bad.pdf":
+                raise RuntimeError("API request failed (500): error")
+            return {"path": path}
+
+        tool = KIEExtractDocumentTool()
+        inputs = _inputs("a.pdf", "bad.pdf")
+        with patch("kie_langchain.tool.extract_document", side_effect=extract):
+            outputs = tool.batch(inputs, return_exceptions=True)
+            with pytest.raises(RuntimeError, match="API request failed"):
+                tool.batch(inputs)
+        assert outputs[0] == {"path": "a.pdf"}
+        assert isinstance(outputs[1], RuntimeError)
+
+    async def test_abatch_as_completed_config_concurrency(self):
+        tool = KIEExtractDocumentTool()
+        tracker = _Tracker()
+        with patch("kie_langchain.tool.extract_document_async", side_effect=tracker.extract):
+            pairs = [
+                pair
+                async for pair in tool.abatch_as_completed(
+                    _inputs("a.pdf", "b.pdf", "c.pdf", "a.pdf"),
+                    {"max_concurrency": 1},
+                )
+            ]
+        assert sorted(index for index, _ in pairs) == [0, 1, 2, 3]
+        assert tracker.peak == 1
+
+    def test_tool_calls_are_not_deduplicated(self, mock_result):
+        tool = KIEExtractDocumentTool()
+        calls = [
+            {
+                "type": "tool_call",
+                "id": f"call_{i}",
+                "name": "extract_document",
+                "args": {"document_path": "a.pdf", "schema": {"x": "string"}},
+            }
+            for i in range(2)
+        ]
+        with patch(
+            "kie_langchain.tool.extract_document", return_value=mock_result
+        ) as mock_fn:
+            messages = tool.batch(calls)
+        assert [m.tool_call_id for m in messages] == ["call_0", "call_1"]
+        assert mock_fn.call_count == 2
@@ -2,8 +2,7 @@
 
 import os
 
-from mcp.server.transport_security import TransportSecuritySettings
-
+from kie_mcp_server import http_app
 from kie_mcp_server.server import server
 
 
@@ -13,19 +12,15 @@ def main() -> None:
     Transport is selected via the ``MCP_TRANSPORT`` environment variable:
 
     - ``stdio`` (default) — for local MCP clients (Claude Code, Cursor, etc.)
-    - ``streamable-http`` — for remote access from Claude.ai connectors
+    - ``streamable-http`` — for remote access from Claude.ai connectors,
+      configured by the ``MCP_*`` variables read in
+      :meth:`~kie_mcp_server.http_app.HTTPOptions.from_env`
     """
     transport = os.environ.get("MCP_TRANSPORT", "stdio")
 
     if transport == "streamable-http":
-        server.settings.host = os.environ.get("MCP_HOST", "0.0.0.0")
-        server.settings.port = int(os.environ.get("MCP_PORT", "8080"))
-
-        # Disable DNS rebinding protection when binding to all interfaces
-        # (typically behind a reverse proxy like Caddy that handles this).
-        server.settings.transport_security = TransportSecuritySettings(
-            enable_dns_rebinding_protection=False,
-        )
+        http_app.run()
+        return
 
     server.run(transport=transport)
 
@@ -0,0 +1,122 @@
+"""Bounded, expiring store for documents uploaded to the MCP server."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import threading
+import time
+from collections import OrderedDict
+
+from kie_core.document import PreparedDocument
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_TTL = 3600.0
+HANDLE_PREFIX = "kie-blob:"
+
+
+def is_handle(document_content: str) -> bool:
+    """Whether a ``document_content`` argument is a blob handle.
+
+    Handles contain ``-`` and ``:``, which never occur in base64.
+    """
+    return document_content.startswith(HANDLE_PREFIX)
+
+
+class BlobStore:
+    """In-memory documents addressed by handle, evicted by age and total size.
+
+    Uploads are decoded, hashed, and re-encoded once into a
+    :class:`~kie_core.document.PreparedDocument`, so every later extraction
+    sends the stored bytes as-is.  Handles are derived from the content
+    digest: uploading the same document again returns the same handle.
+
+    Args:
+        max_bytes: Upper bound of encoded bytes kept; least recently used
+            documents are evicted first.
+        ttl: Seconds a document is kept after it was last uploaded or used.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl: float = DEFAULT_TTL,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, PreparedDocument]] = (
+            OrderedDict()
+        )
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Encoded bytes currently held."""
+        return self._size
+
+    def put(self, document_content: str, document_type: str | None = None) -> str:
+        """Store a base64-encoded document and return its handle.
+
+        Raises:
+            ValueError: If the content is not valid base64 or larger than
+                :attr:`max_bytes`.
+        """
+        try:
+            data = base64.b64decode(document_content, validate=True)
+        except binascii.Error:
+            raise ValueError("document_content is not valid base64") from None
+        prepared = PreparedDocument(data, document_type)
+        size = len(prepared.content)
+        if size > self.max_bytes:
+            raise ValueError(
+                f"Document is too large to upload ({size} bytes encoded, "
+                f"limit {self.max_bytes})"
+            )
+        handle = HANDLE_PREFIX + prepared.digest[:32]
+        now = time.monotonic()
+        with self._lock:
+            self._evict_expired(now)
+            self._discard(handle)
+            self._entries[handle] = (now + self.ttl, prepared)
+            self._size += size
+            while self._size > self.max_bytes:
+                self._discard(next(iter(self._entries)))
+        return handle
+
+    def get(self, handle: str) -> PreparedDocument | None:
+        """Return the document for ``handle``, or ``None`` if unknown or expired."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(handle)
+            if entry is None:
+                return None
+            if entry[0] <= now:
+                self._discard(handle)
+                return None
+            self._entries[handle] = (now + self.ttl, entry[1])
+            self._entries.move_to_end(handle)
+            return entry[1]
+
+    def clear(self) -> None:
+        """Remove every document."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _discard(self, handle: str) -> None:
+        entry = self._entries.pop(handle, None)
+        if entry is not None:
+            self._size -= len(entry[1].content)
+
+    def _evict_expired(self, now: float) -> None:
+        # Expiry refreshes on use and entries move to the end when used, so
+        # the oldest deadlines are at the front.
+        while self._entries:
+            handle, (expires, _) = next(iter(self._entries.items()))
+            if expires > now:
+                break
+            self._discard(handle)
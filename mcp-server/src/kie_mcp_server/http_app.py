@@ -0,0 +1,226 @@
+"""Production streamable-http app: worker processes and load shedding."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from dataclasses import dataclass
+
+from mcp.server.transport_security import TransportSecuritySettings
+from starlette.responses import PlainTextResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from kie_mcp_server.server import server
+
+DEFAULT_WORKERS = 1
+DEFAULT_MAX_IN_FLIGHT = 16
+DEFAULT_MAX_QUEUE = 64
+DEFAULT_QUEUE_TIMEOUT = 30.0
+DEFAULT_MAX_BODY_BYTES = 64 * 1024 * 1024
+
+
+@dataclass
+class HTTPOptions:
+    """Settings of the streamable-http server, read from ``MCP_*`` variables.
+
+    Attributes:
+        host: Bind address (``MCP_HOST``).
+        port: Listen port (``MCP_PORT``).
+        workers: Worker processes (``MCP_WORKERS``).  With more than one, the
+            server runs stateless, since sessions cannot span processes.
+        max_in_flight: Requests one process works on at once
+            (``MCP_MAX_IN_FLIGHT``).
+        max_queue: Requests one process lets wait for a slot
+            (``MCP_MAX_QUEUE``); any more are answered with 503.
+        queue_timeout: Seconds a request waits for a slot before it is
+            answered with 503 (``MCP_QUEUE_TIMEOUT``).
+        max_body_bytes: Largest accepted request body (``MCP_MAX_BODY_BYTES``).
+    """
+
+    host: str = "0.0.0.0"
+    port: int = 8080
+    workers: int = DEFAULT_WORKERS
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT
+    max_queue: int = DEFAULT_MAX_QUEUE
+    queue_timeout: float = DEFAULT_QUEUE_TIMEOUT
+    max_body_bytes: int = DEFAULT_MAX_BODY_BYTES
+
+    @classmethod
+    def from_env(cls) -> HTTPOptions:
+        """Build options from the environment, defaulting unset variables."""
+        env = os.environ.get
+        return cls(
+            host=env("MCP_HOST", cls.host),
+            port=int(env("MCP_PORT", cls.port)),
+            workers=int(env("MCP_WORKERS", cls.workers)),
+            max_in_flight=int(env("MCP_MAX_IN_FLIGHT", cls.max_in_flight)),
+            max_queue=int(env("MCP_MAX_QUEUE", cls.max_queue)),
+            queue_timeout=float(env("MCP_QUEUE_TIMEOUT", cls.queue_timeout)),
+            max_body_bytes=int(env("MCP_MAX_BODY_BYTES", cls.max_body_bytes)),
+        )
+
+
+def _content_length(scope: Scope) -> int | None:
+    for name, value in scope["headers"]:
+        if name == b"content-length":
+            try:
+                return int(value)
+            except ValueError:
+                return None
+    return None
+
+
+class LoadShedder:
+    """ASGI middleware capping the requests one process works on.
+
+    ``POST`` requests, which carry the MCP messages and so every tool call,
+    take one of ``max_in_flight`` slots.  Up to ``max_queue`` more wait for
+    a slot, for at most ``queue_timeout`` seconds.  Anything beyond that is
+    answered with ``503`` and ``Retry-After`` before its body is read, so an
+    overloaded process sheds load instead of buffering uploads until it runs
+    out of memory.  Requests declaring a body larger than ``max_body_bytes``
+    get ``413`` without taking a slot; bodies without a ``Content-Length``
+    (chunked uploads) are counted as they are received and answered with
+    ``413`` once they exceed it.  Other methods (the ``GET`` event stream,
+    ``DELETE``) and non-HTTP scopes pass straight through.
+
+    Args:
+        app: The ASGI app to protect.
+        max_in_flight: Requests handled at once.
+        max_queue: Requests allowed to wait for a slot.
+        queue_timeout: Seconds a request may wait; ``None`` waits forever.
+        max_body_bytes: Largest request body accepted; ``None`` for no limit.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        queue_timeout: float | None = DEFAULT_QUEUE_TIMEOUT,
+        max_body_bytes: int | None = None,
+    ) -> None:
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        if max_queue < 0:
+            raise ValueError("max_queue must not be negative")
+        self.app = app
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.max_body_bytes = max_body_bytes
+        self.waiting = 0
+        self._slots = asyncio.Semaphore(max_in_flight)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+        length = _content_length(scope)
+        if self.max_body_bytes is not None and (length or 0) > self.max_body_bytes:
+            response = PlainTextResponse("Request body too large\n", 413)
+            await response(scope, receive, send)
+            return
+        if not await self._acquire():
+            response = PlainTextResponse(
+                "Server overloaded, retry later\n", 503, {"Retry-After": "1"}
+            )
+            await response(scope, receive, send)
+            return
+        try:
+            if self.max_body_bytes is None:
+                await self.app(scope, receive, send)
+            else:
+                await self._limit_body(scope, receive, send)
+        finally:
+            self._slots.release()
+
+    async def _limit_body(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run the app, answering ``413`` once the body read exceeds the limit.
+
+        The app then sees the client disconnect, and whatever it tries to
+        send afterwards is dropped.
+        """
+        received = 0
+        started = rejected = False
+
+        async def limited_receive() -> Message:
+            nonlocal received, rejected
+            if rejected:
+                return {"type": "http.disconnect"}
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_bytes and not started:
+                    rejected = True
+                    response = PlainTextResponse("Request body too large\n", 413)
+                    await response(scope, receive, send)
+                    return {"type": "http.disconnect"}
+            return message
+
+        async def guarded_send(message: Message) -> None:
+            nonlocal started
+            if rejected:
+                return
+            if message["type"] == "http.response.start":
+                started = True
+            await send(message)
+
+        await self.app(scope, limited_receive, guarded_send)
+
+    async def _acquire(self) -> bool:
+        """Take a slot, waiting in the queue if there is room; ``False`` if not."""
+        if not self._slots.locked():
+            await self._slots.acquire()
+            return True
+        if self.waiting >= self.max_queue:
+            return False
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self.waiting -= 1
+        return True
+
+
+def create_app(options: HTTPOptions | None = None) -> ASGIApp:
+    """Configure the server for HTTP and return its load-shedding ASGI app.
+
+    Called once in every worker process, with options from the environment.
+    """
+    options = options or HTTPOptions.from_env()
+    server.settings.stateless_http = options.workers > 1
+    # Newer mcp releases cap bodies themselves (4 MiB by default); older ones
+    # have no such setting, and the limit is left to LoadShedder alone.
+    if "max_request_body_size" in type(server.settings).model_fields:
+        server.settings.max_request_body_size = options.max_body_bytes
+    # Disable DNS rebinding protection when binding to all interfaces
+    # (typically behind a reverse proxy like Caddy that handles this).
+    server.settings.transport_security = TransportSecuritySettings(
+        enable_dns_rebinding_protection=False,
+    )
+    return LoadShedder(
+        server.streamable_http_app(),
+        max_in_flight=options.max_in_flight,
+        max_queue=options.max_queue,
+        queue_timeout=options.queue_timeout,
+        max_body_bytes=options.max_body_bytes,
+    )
+
+
+def run(options: HTTPOptions | None = None) -> None:
+    """Serve :func:`create_app` with uvicorn in ``options.workers`` processes."""
+    import uvicorn
+
+    options = options or HTTPOptions.from_env()
+    uvicorn.run(
+        "kie_mcp_server.http_app:create_app",
+        factory=True,
+        host=options.host,
+        port=options.port,
+        workers=options.workers,
+        log_level=server.settings.log_level.lower(),
+    )
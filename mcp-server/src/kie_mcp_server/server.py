@@ -2,14 +2,58 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import os
 
 from mcp.server.fastmcp import FastMCP
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
 
-from kie_core import extract_async
+from kie_core import extract_async, extract_document_async
+from kie_core.client import DEFAULT_OFFLOAD_THRESHOLD
+from kie_core.instrumentation import (
+    PrometheusInstrumentation,
+    find_instrumentation,
+    integration_scope,
+)
+from kie_core.serialization import dumps
+from kie_mcp_server.blobs import (
+    DEFAULT_MAX_BYTES,
+    DEFAULT_TTL,
+    BlobStore,
+    is_handle,
+)
 
 server = FastMCP("kie-doc-extractor")
 
+blobs = BlobStore(
+    max_bytes=int(os.environ.get("MCP_BLOB_MAX_BYTES", DEFAULT_MAX_BYTES)),
+    ttl=float(os.environ.get("MCP_BLOB_TTL", DEFAULT_TTL)),
+)
+
+
+@server.tool()
+async def upload_document(document_content: str, document_type: str) -> str:
+    """Upload a document once to extract several schemas from it.
+
+    Pass the returned ``document_id`` as ``document_content`` to
+    ``extract_document`` instead of resending the base64 content.  Uploads
+    expire after a period without use; upload again if an id is rejected.
+
+    Args:
+        document_content: Base64-encoded document content.
+        document_type: Document type -- "pdf" or "image".
+
+    Returns:
+        JSON string with ``document_id`` and ``expires_in`` (seconds without
+        use after which the upload is dropped).
+    """
+    if len(document_content) < DEFAULT_OFFLOAD_THRESHOLD:
+        handle = blobs.put(document_content, document_type)
+    else:  # decoding and hashing megabytes would stall the event loop
+        handle = await asyncio.to_thread(blobs.put, document_content, document_type)
+    return dumps({"document_id": handle, "expires_in": blobs.ttl}).decode()
+
 
 @server.tool()
 async def extract_document(
@@ -21,14 +65,45 @@ async def extract_document(
     """Extract structured data from a document using a JSON schema.
 
     Args:
-        document_content: Base64-encoded document content.
-        document_type: Document type -- "pdf" or "image".
+        document_content: Base64-encoded document content, or a
+                          ``document_id`` returned by ``upload_document``.
+        document_type: Document type -- "pdf" or "image" (uploaded documents
+                       keep the type they were uploaded with).
         schema: JSON schema where keys are field names and values are type hints
                 (e.g. "string", "number", "date (MM/DD/YYYY)").
         model: Optional model ID for extraction.
 
     Returns:
         Extracted field values as a JSON string.
+
+    Raises:
+        ValueError: If ``document_content`` is an unknown or expired
+            ``document_id``.
+    """
+    with integration_scope("mcp"):
+        if is_handle(document_content):
+            document = blobs.get(document_content)
+            if document is None:
+                raise ValueError(
+                    f"Unknown or expired document_id {document_content!r}; "
+                    "upload the document again"
+                )
+            result = await extract_document_async(document, schema, model=model)
+        else:
+            result = await extract_async(
+                document_content, document_type, schema, model=model
+            )
+    return dumps(result, indent=True).decode()
+
+
+@server.custom_route("/metrics", methods=["GET"])
+async def metrics(request: Request) -> Response:
+    """Serve Prometheus metrics (streamable-http transport only).
+
+    Enabled with ``KIE_INSTRUMENTATION=prometheus``; 404 otherwise.
     """
-    result = await extract_async(document_content, document_type, schema, model=model)
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    prometheus = find_instrumentation(PrometheusInstrumentation)
+    if prometheus is None:
+        return PlainTextResponse("Prometheus instrumentation is off\n", 404)
+    body, content_type = prometheus.render()
+    return Response(body, media_type=content_type)
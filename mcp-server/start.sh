@@ -13,12 +13,14 @@ Options:
   --transport <mode>   Transport mode: "streamable-http" (default) or "stdio"
   --host <address>     Bind address for HTTP mode (default: 0.0.0.0)
   --port <port>        Listen port for HTTP mode (default: 8080)
+  --workers <n>        Worker processes for HTTP mode (default: 1)
   --api-url <url>      KIE extraction API endpoint
                        (default: http://localhost:8000/v1/extract)
   -h, --help           Show this help message
 
 Environment variables (override defaults, overridden by flags):
-  MCP_TRANSPORT, MCP_HOST, MCP_PORT, KIE_API_URL
+  MCP_TRANSPORT, MCP_HOST, MCP_PORT, MCP_WORKERS, MCP_MAX_IN_FLIGHT,
+  MCP_MAX_QUEUE, MCP_QUEUE_TIMEOUT, MCP_MAX_BODY_BYTES, KIE_API_URL
 
 Examples:
   # Streamable HTTP transport (default — for Claude.ai connectors)
@@ -46,6 +48,10 @@ while [[ $# -gt 0 ]]; do
       export MCP_PORT="$2"
       shift 2
       ;;
+    --workers)
+      export MCP_WORKERS="$2"
+      shift 2
+      ;;
     --api-url)
       export KIE_API_URL="$2"
       shift 2
@@ -0,0 +1,105 @@
+"""Tests for kie_mcp_server.blobs — essential + comprehensive."""
+
+import base64
+
+import pytest
+
+from kie_mcp_server import blobs as blobs_module
+from kie_mcp_server.blobs import BlobStore, is_handle
+
+
+def _b64(data: bytes) -> str:
+    return base64.b64encode(data).decode("ascii")
+
+
+class _Clock:
+    """Stand-in for ``time.monotonic`` that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture()
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(blobs_module.time, "monotonic", clock)
+    return clock
+
+
+# ── essential ─────────────────────────────────────────────────────────
+
+
+class TestBlobStoreEssential:
+    """Upload once, fetch by handle."""
+
+    def test_put_and_get(self, sample_b64):
+        doc_b64, doc_type = sample_b64
+        store = BlobStore()
+        handle = store.put(doc_b64, doc_type)
+        assert is_handle(handle)
+        document = store.get(handle)
+        assert document.doc_base64 == doc_b64
+        assert document.doc_type == "image"
+
+    def test_same_content_same_handle(self, sample_b64):
+        doc_b64, doc_type = sample_b64
+        store = BlobStore()
+        assert store.put(doc_b64, doc_type) == store.put(doc_b64, doc_type)
+        assert len(store) == 1
+
+    def test_expires_after_ttl_without_use(self, sample_b64, clock):
+        store = BlobStore(ttl=60)
+        handle = store.put(*sample_b64)
+        clock.now += 50
+        assert store.get(handle) is not None  # use refreshes the deadline
+        clock.now += 50
+        assert store.get(handle) is not None
+        clock.now += 61
+        assert store.get(handle) is None
+        assert store.size == 0
+
+
+# ── comprehensive ─────────────────────────────────────────────────────
+
+
+class TestBlobStoreComprehensive:
+    """Size bound, validation, and handle detection."""
+
+    def test_evicts_least_recently_used(self):
+        documents = [_b64(bytes([i]) * 300) for i in range(3)]
+        store = BlobStore(max_bytes=900)
+        first, second = (store.put(d, "image") for d in documents[:2])
+        store.get(first)
+        third = store.put(documents[2], "image")
+        assert store.get(second) is None
+        assert store.get(first) is not None and store.get(third) is not None
+        assert store.size == 800
+
+    def test_expired_entries_dropped_on_put(self, clock):
+        store = BlobStore(ttl=10)
+        store.put(_b64(b"one"), "image")
+        clock.now += 11
+        store.put(_b64(b"two"), "image")
+        assert len(store) == 1
+
+    def test_rejects_invalid_and_oversized(self):
+        store = BlobStore(max_bytes=8)
+        with pytest.raises(ValueError, match="not valid base64"):
+            store.put("not base64!", "image")
+        with pytest.raises(ValueError, match="too large"):
+            store.put(_b64(b"0123456789"), "image")
+        assert len(store) == 0
+
+    def test_is_handle(self, sample_b64):
+        assert not is_handle(sample_b64[0])
+        assert is_handle("kie-blob:abc")
+
+    def test_clear(self, sample_b64):
+        store = BlobStore()
+        handle = store.put(*sample_b64)
+        store.clear()
+        assert store.get(handle) is None
+        assert store.size == 0
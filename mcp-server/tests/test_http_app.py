@@ -0,0 +1,179 @@
+"""Tests for kie_mcp_server.http_app — essential + comprehensive."""
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+from starlette.requests import ClientDisconnect, Request
+from starlette.responses import PlainTextResponse
+
+from kie_mcp_server import __main__ as entry_point
+from kie_mcp_server.http_app import HTTPOptions, LoadShedder, create_app
+from kie_mcp_server.server import server
+
+
+class _GatedApp:
+    """ASGI app whose requests wait until the gate opens."""
+
+    def __init__(self):
+        self.gate = asyncio.Event()
+        self.entered = 0
+
+    async def __call__(self, scope, receive, send):
+        self.entered += 1
+        await self.gate.wait()
+        await PlainTextResponse("ok")(scope, receive, send)
+
+
+class _BodyApp:
+    """ASGI app reading the whole body and answering with its length."""
+
+    def __init__(self):
+        self.disconnected = False
+
+    async def __call__(self, scope, receive, send):
+        try:
+            body = await Request(scope, receive).body()
+        except ClientDisconnect:
+            self.disconnected = True
+            body = b""
+        await PlainTextResponse(str(len(body)))(scope, receive, send)
+
+
+async def _chunks(count, size=4):
+    for _ in range(count):
+        yield b"x" * size
+
+
+def _client(app):
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://testserver"
+    )
+
+
+async def _until(condition):
+    while not condition():
+        await asyncio.sleep(0.001)
+
+
+# ── essential ─────────────────────────────────────────────────────────
+
+
+class TestLoadShedderEssential:
+    """In-flight cap, bounded queue, and body limit."""
+
+    async def test_sheds_when_queue_is_full(self):
+        app = _GatedApp()
+        shedder = LoadShedder(app, max_in_flight=1, max_queue=1)
+        async with _client(shedder) as client:
+            first = asyncio.create_task(client.post("/mcp", content=b"{}"))
+            await _until(lambda: app.entered == 1)
+            second = asyncio.create_task(client.post("/mcp", content=b"{}"))
+            await _until(lambda: shedder.waiting == 1)
+            rejected = await client.post("/mcp", content=b"{}")
+            app.gate.set()
+            responses = await asyncio.gather(first, second)
+        assert rejected.status_code == 503
+        assert rejected.headers["retry-after"] == "1"
+        assert [r.status_code for r in responses] == [200, 200]
+        assert app.entered == 2
+
+    async def test_queue_timeout(self):
+        app = _GatedApp()
+        shedder = LoadShedder(app, max_in_flight=1, max_queue=4, queue_timeout=0.05)
+        async with _client(shedder) as client:
+            first = asyncio.create_task(client.post("/mcp", content=b"{}"))
+            await _until(lambda: app.entered == 1)
+            late = await client.post("/mcp", content=b"{}")
+            app.gate.set()
+            await first
+        assert late.status_code == 503
+        assert shedder.waiting == 0
+
+    async def test_body_limit(self):
+        app = _GatedApp()
+        app.gate.set()
+        shedder = LoadShedder(app, max_body_bytes=8)
+        async with _client(shedder) as client:
+            too_large = await client.post("/mcp", content=b"x" * 9)
+            fits = await client.post("/mcp", content=b"x" * 8)
+        assert (too_large.status_code, fits.status_code) == (413, 200)
+        assert app.entered == 1
+
+    async def test_chunked_body_limit(self):
+        app = _BodyApp()
+        shedder = LoadShedder(app, max_body_bytes=8)
+        async with _client(shedder) as client:
+            too_large = await client.post("/mcp", content=_chunks(3))
+            fits = await client.post("/mcp", content=_chunks(2))
+        assert "content-length" not in too_large.request.headers
+        assert (too_large.status_code, too_large.text) == (
+            413,
+            "Request body too large\n",
+        )
+        assert app.disconnected
+        assert (fits.status_code, fits.text) == (200, "8")
+
+
+# ── comprehensive ─────────────────────────────────────────────────────
+
+
+class TestLoadShedderComprehensive:
+    """Pass-through, configuration, and the entry point."""
+
+    async def test_event_streams_not_limited(self):
+        app = _GatedApp()
+        shedder = LoadShedder(app, max_in_flight=1, max_queue=0)
+        async with _client(shedder) as client:
+            held = asyncio.create_task(client.post("/mcp", content=b"{}"))
+            await _until(lambda: app.entered == 1)
+            stream = asyncio.create_task(client.get("/mcp"))
+            await _until(lambda: app.entered == 2)
+            assert (await client.post("/mcp", content=b"{}")).status_code == 503
+            app.gate.set()
+            assert [r.status_code for r in await asyncio.gather(held, stream)] == [
+                200,
+                200,
+            ]
+
+    def test_invalid_limits(self):
+        with pytest.raises(ValueError, match="max_in_flight"):
+            LoadShedder(_GatedApp(), max_in_flight=0)
+        with pytest.raises(ValueError, match="max_queue"):
+            LoadShedder(_GatedApp(), max_queue=-1)
+
+    def test_options_from_env(self, monkeypatch):
+        monkeypatch.setenv("MCP_PORT", "9090")
+        monkeypatch.setenv("MCP_WORKERS", "4")
+        monkeypatch.setenv("MCP_QUEUE_TIMEOUT", "2.5")
+        options = HTTPOptions.from_env()
+        assert (options.port, options.workers, options.queue_timeout) == (
+            9090,
+            4,
+            2.5,
+        )
+        assert options.host == "0.0.0.0"
+        assert options.max_in_flight == HTTPOptions.max_in_flight
+
+    def test_create_app(self, monkeypatch):
+        """Builds with the installed mcp, with or without its own body limit."""
+        for name in type(server.settings).model_fields:
+            monkeypatch.setattr(server.settings, name, getattr(server.settings, name))
+        monkeypatch.setattr(server, "_session_manager", None)
+        app = create_app(HTTPOptions(workers=2, max_in_flight=3, max_body_bytes=1024))
+        assert isinstance(app, LoadShedder)
+        assert (app.max_in_flight, app.max_body_bytes) == (3, 1024)
+        assert server.settings.stateless_http
+        assert getattr(server.settings, "max_request_body_size", 1024) == 1024
+
+    def test_main_dispatches_transport(self, monkeypatch):
+        monkeypatch.setenv("MCP_TRANSPORT", "streamable-http")
+        with patch.object(entry_point.http_app, "run") as run_http, patch.object(
+            entry_point.server, "run"
+        ) as run_server:
+            entry_point.main()
+            monkeypatch.setenv("MCP_TRANSPORT", "stdio")
+            entry_point.main()
+        run_http.assert_called_once_with()
+        run_server.assert_called_once_with(transport="stdio")
@@ -1,13 +1,29 @@
 """Tests for kie_mcp_server — essential + comprehensive."""
 
+import importlib
 import json
+import threading
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from kie_mcp_server.server import extract_document, server
+from kie_core import instrumentation
+from kie_core.instrumentation import current_integration
+from kie_mcp_server.blobs import BlobStore
+from kie_mcp_server.server import (
+    blobs,
+    extract_document,
+    metrics,
+    server,
+    upload_document,
+)
+
+# The package re-exports the FastMCP instance as ``server``, which shadows
+# the module of the same name for dotted attribute lookups.
+server_module = importlib.import_module("kie_mcp_server.server")
 
 MOCK_TARGET = "kie_mcp_server.server.extract_async"
+MOCK_DOCUMENT_TARGET = "kie_mcp_server.server.extract_document_async"
 
 
 # ── essential ─────────────────────────────────────────────────────────
@@ -46,6 +62,21 @@ class TestMCPServerEssential:
         parsed = json.loads(result_str)
         assert parsed == mock_result
 
+    async def test_upload_once_extract_twice(self, sample_b64, mock_result):
+        doc_b64, doc_type = sample_b64
+        upload = json.loads(await upload_document(doc_b64, doc_type))
+        handle = upload["document_id"]
+        assert upload["expires_in"] == blobs.ttl
+        with patch(
+            MOCK_DOCUMENT_TARGET, new_callable=AsyncMock, return_value=mock_result
+        ) as mock_fn:
+            for schema in ({"a": "string"}, {"b": "number"}):
+                result = await extract_document(handle, doc_type, schema)
+                assert json.loads(result) == mock_result
+        documents = [call.args[0] for call in mock_fn.await_args_list]
+        assert documents[0] is documents[1] is blobs.get(handle)
+        assert documents[0].doc_base64 == doc_b64
+
 
 # ── comprehensive ─────────────────────────────────────────────────────
 
@@ -111,3 +142,52 @@ class TestMCPServerComprehensive:
             )
         assert json.loads(r1) == mock_result
         assert json.loads(r2) == mock_result
+
+    async def test_calls_are_labelled_mcp(self, sample_b64, mock_result):
+        doc_b64, doc_type = sample_b64
+        seen = []
+
+        async def record(*args, **kwargs):
+            seen.append(current_integration())
+            return mock_result
+
+        with patch(MOCK_TARGET, side_effect=record):
+            await extract_document(doc_b64, doc_type, {"a": "string"})
+        assert seen == ["mcp"]
+
+    async def test_metrics_route(self, monkeypatch):
+        prometheus_client = pytest.importorskip("prometheus_client")
+        monkeypatch.setattr(instrumentation, "_configured", True)
+        monkeypatch.setattr(instrumentation, "_instrumentation", None)
+        assert (await metrics(None)).status_code == 404
+        prometheus = instrumentation.PrometheusInstrumentation(
+            prometheus_client.CollectorRegistry()
+        )
+        monkeypatch.setattr(instrumentation, "_instrumentation", prometheus)
+        response = await metrics(None)
+        assert response.status_code == 200
+        assert b"kie_in_flight" in response.body
+
+    async def test_upload_tool_is_registered(self):
+        tools = {t.name: t for t in await server.list_tools()}
+        assert "upload_document" in tools
+        assert "document_id" in tools["extract_document"].description
+
+    async def test_unknown_handle(self):
+        with pytest.raises(ValueError, match="upload the document again"):
+            await extract_document("kie-blob:0000", "pdf", {"a": "string"})
+
+    async def test_large_upload_off_the_loop(self, monkeypatch):
+        threads = []
+
+        class Recording(BlobStore):
+            def put(self, *args):
+                threads.append(threading.current_thread())
+                return super().put(*args)
+
+        store = Recording()
+        monkeypatch.setattr(server_module, "blobs", store)
+        monkeypatch.setattr(server_module, "DEFAULT_OFFLOAD_THRESHOLD", 4)
+        upload = json.loads(await upload_document("JVBERi0x", "pdf"))
+        assert store.get(upload["document_id"]).doc_type == "pdf"
+        assert threads != [threading.main_thread()]
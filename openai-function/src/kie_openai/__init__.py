@@ -1,11 +1,22 @@
 """OpenAI function-calling wrapper for KIE document extraction."""
 
 from kie_openai.function_def import FUNCTION_DEF, TOOLS
-from kie_openai.handler import handle_extract_document, handle_tool_call
+from kie_openai.handler import (
+    ahandle_extract_document,
+    ahandle_tool_call,
+    ahandle_tool_calls,
+    handle_extract_document,
+    handle_tool_call,
+    handle_tool_calls,
+)
 
 __all__ = [
     "FUNCTION_DEF",
     "TOOLS",
+    "ahandle_extract_document",
+    "ahandle_tool_call",
+    "ahandle_tool_calls",
     "handle_extract_document",
     "handle_tool_call",
+    "handle_tool_calls",
 ]
@@ -2,21 +2,28 @@
 
 from __future__ import annotations
 
-import json
-from typing import Any
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable
 
-from kie_core import extract_document
+from kie_core import extract_document, extract_document_async
+from kie_core.batch import DEFAULT_CONCURRENCY
+from kie_core.document import DocumentInput
+from kie_core.instrumentation import integration_scope
+from kie_core.serialization import dumps, loads
 
 
 def handle_extract_document(
-    document_path: str,
+    document_path: DocumentInput,
     schema: dict,
     model: str | None = None,
 ) -> str:
     """Execute a ``extract_document`` tool call and return a JSON string.
 
     Args:
-        document_path: Path to the document file.
+        document_path: Path to the document file.  When calling the handler
+            directly, the document's bytes or a binary file object also
+            work, e.g. for uploads that were never written to disk.
         schema: JSON schema defining the fields to extract.
         model: Optional model ID for extraction.
 
@@ -24,8 +31,31 @@ def handle_extract_document(
         JSON-serialised extraction result (string), suitable for an OpenAI
         tool-response message.
     """
-    result = extract_document(document_path, schema, model=model)
-    return json.dumps(result, ensure_ascii=False)
+    with integration_scope("openai"):
+        result = extract_document(document_path, schema, model=model)
+    return dumps(result).decode()
+
+
+async def ahandle_extract_document(
+    document_path: DocumentInput,
+    schema: dict,
+    model: str | None = None,
+) -> str:
+    """Async counterpart of :func:`handle_extract_document`."""
+    with integration_scope("openai"):
+        result = await extract_document_async(document_path, schema, model=model)
+    return dumps(result).decode()
+
+
+def _arguments(tool_call: Any) -> dict:
+    """Return the parsed arguments of a tool call this package handles."""
+    name = tool_call.function.name
+    args: dict = loads(tool_call.function.arguments)
+
+    if name == "extract_document":
+        return args
+
+    raise ValueError(f"Unknown function: {name}")
 
 
 def handle_tool_call(tool_call: Any) -> str:
@@ -41,10 +71,88 @@ def handle_tool_call(tool_call: Any) -> str:
     Raises:
         ValueError: If the function name is not recognised.
     """
-    name = tool_call.function.name
-    args: dict = json.loads(tool_call.function.arguments)
+    return handle_extract_document(**_arguments(tool_call))
 
-    if name == "extract_document":
-        return handle_extract_document(**args)
 
-    raise ValueError(f"Unknown function: {name}")
+async def ahandle_tool_call(tool_call: Any) -> str:
+    """Async counterpart of :func:`handle_tool_call`."""
+    return await ahandle_extract_document(**_arguments(tool_call))
+
+
+def _tool_message(tool_call: Any, content: str) -> dict:
+    return {"role": "tool", "tool_call_id": tool_call.id, "content": content}
+
+
+def _error_content(error: Exception) -> str:
+    """Report a failed call to the model instead of aborting the whole turn."""
+    return dumps({"error": str(error)}).decode()
+
+
+def _check_concurrency(concurrency: int) -> None:
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+
+def handle_tool_calls(
+    tool_calls: Iterable[Any],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> list[dict]:
+    """Run all tool calls of one assistant message concurrently.
+
+    Calls are dispatched over a thread pool sharing the pooled default
+    client, with at most ``concurrency`` in flight.  A failing call does not
+    affect the others; its message carries ``{"error": ...}`` so the model
+    can react to it.
+
+    Args:
+        tool_calls: The message's ``tool_calls``.
+        concurrency: Maximum number of extractions in flight.
+
+    Returns:
+        One ``{"role": "tool", "tool_call_id": ..., "content": ...}`` message
+        per tool call, in the original order, ready to append to the
+        conversation.
+
+    Raises:
+        ValueError: If ``concurrency`` is less than 1.
+    """
+    _check_concurrency(concurrency)
+    tool_calls = list(tool_calls)
+    if not tool_calls:
+        return []
+
+    def run(tool_call: Any) -> str:
+        try:
+            return handle_tool_call(tool_call)
+        except Exception as e:  # noqa: BLE001 — reported per call
+            return _error_content(e)
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(tool_calls))) as pool:
+        contents = list(pool.map(run, tool_calls))
+    return [_tool_message(tc, content) for tc, content in zip(tool_calls, contents)]
+
+
+async def ahandle_tool_calls(
+    tool_calls: Iterable[Any],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> list[dict]:
+    """Async counterpart of :func:`handle_tool_calls`.
+
+    Same parameters and semantics; the calls run as tasks on the running
+    event loop over its pooled default client.
+    """
+    _check_concurrency(concurrency)
+    tool_calls = list(tool_calls)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(tool_call: Any) -> str:
+        async with semaphore:
+            try:
+                return await ahandle_tool_call(tool_call)
+            except Exception as e:  # noqa: BLE001 — reported per call
+                return _error_content(e)
+
+    contents = await asyncio.gather(*(run(tc) for tc in tool_calls))
+    return [_tool_message(tc, content) for tc, content in zip(tool_calls, contents)]
@@ -1,18 +1,30 @@
 """Tests for kie_openai — essential + comprehensive."""
 
+import asyncio
+import io
 import json
+import threading
 from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
 
 from kie_openai import FUNCTION_DEF, TOOLS
-from kie_openai.handler import handle_extract_document, handle_tool_call
+from kie_core.instrumentation import current_integration
+from kie_openai.handler import (
+    ahandle_tool_calls,
+    handle_extract_document,
+    handle_tool_call,
+    handle_tool_calls,
+)
 
 
-def _make_tool_call(name: str, arguments: dict) -> SimpleNamespace:
+def _make_tool_call(
+    name: str, arguments: dict, call_id: str = "call_1"
+) -> SimpleNamespace:
     """Build a minimal tool-call object matching the OpenAI SDK shape."""
     return SimpleNamespace(
+        id=call_id,
         function=SimpleNamespace(
             name=name,
             arguments=json.dumps(arguments),
@@ -70,6 +82,58 @@ class TestHandlerEssential:
         with pytest.raises(ValueError, match="Unknown function"):
             handle_tool_call(tc)
 
+    def test_handle_tool_calls_concurrently(self):
+        calls = [
+            _make_tool_call(
+                "extract_document",
+                {"document_path": f"doc{i}.pdf", "schema": {"x": "string"}},
+                f"call_{i}",
+            )
+            for i in range(3)
+        ]
+        # Every call waits for the others: only passes if they overlap.
+        barrier = threading.Barrier(3, timeout=5)
+
+        def extract(path, schema, model=None):
+            barrier.wait()
+            return {"path": path}
+
+        with patch("kie_openai.handler.extract_document", side_effect=extract):
+            messages = handle_tool_calls(calls)
+        assert [(m["role"], m["tool_call_id"]) for m in messages] == [
+            ("tool", f"call_{i}") for i in range(3)
+        ]
+        assert [json.loads(m["content"]) for m in messages] == [
+            {"path": f"doc{i}.pdf"} for i in range(3)
+        ]
+
+    async def test_ahandle_tool_calls_capped_and_ordered(self):
+        calls = [
+            _make_tool_call(
+                "extract_document",
+                {"document_path": f"doc{i}.pdf", "schema": {"x": "string"}},
+                f"call_{i}",
+            )
+            for i in range(5)
+        ]
+        running, peak = 0, 0
+
+        async def extract(path, schema, model=None):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01 * (5 - int(path[3])))  # later calls finish first
+            running -= 1
+            return {"path": path, "label": current_integration()}
+
+        with patch("kie_openai.handler.extract_document_async", side_effect=extract):
+            messages = await ahandle_tool_calls(calls, concurrency=2)
+        assert peak == 2
+        assert [m["tool_call_id"] for m in messages] == [f"call_{i}" for i in range(5)]
+        assert [json.loads(m["content"]) for m in messages] == [
+            {"path": f"doc{i}.pdf", "label": "openai"} for i in range(5)
+        ]
+
 
 # ── comprehensive ─────────────────────────────────────────────────────
 
@@ -139,3 +203,58 @@ class TestHandlerComprehensive:
             )
         parsed = json.loads(result)
         assert parsed["name"] == "日本語テスト"
+
+    def test_handler_with_document_bytes(self, sample_image, mock_result):
+        document = io.BytesIO(sample_image.read_bytes())
+        with patch(
+            "kie_openai.handler.extract_document", return_value=mock_result
+        ) as mock_fn:
+            result = handle_extract_document(document, {"name": "string"})
+        assert json.loads(result) == mock_result
+        mock_fn.assert_called_once_with(document, {"name": "string"}, model=None)
+
+    def test_calls_are_labelled_openai(self, sample_image, mock_result):
+        seen = []
+
+        def record(*args, **kwargs):
+            seen.append(current_integration())
+            return mock_result
+
+        with patch("kie_openai.handler.extract_document", side_effect=record):
+            handle_extract_document(str(sample_image), {"a": "string"})
+        assert seen == ["openai"]
+
+    def test_failed_call_reported_in_its_message(self, mock_result):
+        calls = [
+            _make_tool_call("unknown_fn", {}, "call_a"),
+            _make_tool_call(
+                "extract_document",
+                {"document_path": "doc.pdf", "schema": {"x": "string"}},
+                "call_b",
+            ),
+        ]
+        with patch("kie_openai.handler.extract_document", return_value=mock_result):
+            first, second = handle_tool_calls(calls)
+        assert json.loads(first["content"]) == {"error": "Unknown function: unknown_fn"}
+        assert json.loads(second["content"]) == mock_result
+
+    async def test_async_failed_call(self):
+        calls = [
+            _make_tool_call(
+                "extract_document",
+                {"document_path": "missing.pdf", "schema": {}},
+            )
+        ]
+        with patch(
+            "kie_openai.handler.extract_document_async",
+            side_effect=FileNotFoundError("Document not found: missing.pdf"),
+        ):
+            (message,) = await ahandle_tool_calls(calls)
+        assert "Document not found" in json.loads(message["content"])["error"]
+
+    async def test_tool_calls_validate_concurrency(self):
+        assert handle_tool_calls([]) == []
+        with pytest.raises(ValueError, match="concurrency"):
+            handle_tool_calls([], concurrency=0)
+        with pytest.raises(ValueError, match="concurrency"):
+            await ahandle_tool_calls([], concurrency=0)